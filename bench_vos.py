@@ -0,0 +1,441 @@
+"""
+Microbenchmarks de las Rutas Críticas de VOS
+VOS (Virtual Operating System)
+
+Este script mide el throughput (operaciones/segundo) de las rutas más
+usadas del simulador:
+- read_byte / write_byte con hit y con page fault
+- Recorrido secuencial con read-ahead (prefetch)
+- _ensure_in_ram desalojando víctimas limpias y sucias
+- zero_page y get_stats
+- Scheduler.add/next (Round-Robin, prioridad, MLFQ), Kernel.spawn, Kernel.dispatch (1 y 4 CPUs) y Kernel.run
+- TimerWheel.schedule/advance (procesos bloqueados en sleep/I/O)
+
+Cada benchmark se repite varias veces y se reporta la media y la
+desviación estándar. Los resultados pueden guardarse como baseline JSON
+y compararse contra un baseline previo para detectar regresiones.
+
+Uso:
+    python bench_vos.py                          # correr todo
+    python bench_vos.py --save baseline.json     # guardar baseline
+    python bench_vos.py --compare baseline.json  # comparar (exit 1 si hay regresión)
+    python bench_vos.py --filter vm. --repeat 10 --threshold 0.05
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from vos.core.prefetch import Prefetcher
+from vos.core.process import PCB, State
+from vos.core.sched import MLFQScheduler, PriorityScheduler, Scheduler
+from vos.core.sys import Kernel
+from vos.core.timer import TimerWheel
+from vos.core.vm import VM
+
+
+# Un benchmark recibe n y retorna (función a cronometrar, operaciones que realiza).
+# La preparación (crear VMs, precalentar páginas) queda fuera del tiempo medido.
+Benchmark = Callable[[int], Tuple[Callable[[], None], int]]
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, ops: int):
+    """Registra un benchmark con su cantidad base de operaciones."""
+    def decorator(func: Benchmark) -> Benchmark:
+        func.ops = ops
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+def _resident_vm(pages: int = 16, page_size: int = 256) -> VM:
+    """VM con todas sus páginas ya residentes (solo hits)."""
+    vm = VM(page_size=page_size, virtual_pages=pages, physical_frames=pages)
+    for page_no in range(pages):
+        vm.read_byte(page_no * page_size)
+    return vm
+
+
+def _addresses(vm: VM, n: int, seed: int = 42) -> List[int]:
+    """Direcciones aleatorias reproducibles dentro del espacio de la VM."""
+    rng = random.Random(seed)
+    return [rng.randrange(vm.max_vaddr) for _ in range(n)]
+
+
+def _striding(vm: VM, n: int) -> List[int]:
+    """Direcciones que saltan de página en página (cada acceso es un fault)."""
+    return [(i % vm.virtual_pages) * vm.page_size for i in range(n)]
+
+
+# ============================================================================
+# MEMORIA VIRTUAL
+# ============================================================================
+
+@benchmark('vm.read_byte.hit', 200_000)
+def bench_read_hit(n):
+    vm = _resident_vm()
+    addrs = _addresses(vm, n)
+    read_byte = vm.read_byte
+
+    def run():
+        for vaddr in addrs:
+            read_byte(vaddr)
+    return run, n
+
+
+@benchmark('vm.write_byte.hit', 200_000)
+def bench_write_hit(n):
+    vm = _resident_vm()
+    addrs = _addresses(vm, n)
+    write_byte = vm.write_byte
+
+    def run():
+        for vaddr in addrs:
+            write_byte(vaddr, 7)
+    return run, n
+
+
+@benchmark('vm.read_byte.miss', 50_000)
+def bench_read_miss(n):
+    vm = VM(virtual_pages=64, physical_frames=4)
+    addrs = _striding(vm, n)
+    read_byte = vm.read_byte
+
+    def run():
+        for vaddr in addrs:
+            read_byte(vaddr)
+    return run, n
+
+
+@benchmark('vm.write_byte.miss', 50_000)
+def bench_write_miss(n):
+    vm = VM(virtual_pages=64, physical_frames=4)
+    addrs = _striding(vm, n)
+    write_byte = vm.write_byte
+
+    def run():
+        for vaddr in addrs:
+            write_byte(vaddr, 7)
+    return run, n
+
+
+@benchmark('vm.read_byte.prefetch', 50_000)
+def bench_read_prefetch(n):
+    vm = VM(virtual_pages=64, physical_frames=4, prefetcher=Prefetcher())
+    addrs = _striding(vm, n)
+    read_byte = vm.read_byte
+
+    def run():
+        for vaddr in addrs:
+            read_byte(vaddr)
+    return run, n
+
+
+@benchmark('vm.evict.clean', 50_000)
+def bench_evict_clean(n):
+    vm = VM(virtual_pages=64, physical_frames=4)
+    ensure = vm._ensure_in_ram
+    pages = [i % 64 for i in range(n)]
+
+    def run():
+        for page_no in pages:
+            ensure(page_no)
+    return run, n
+
+
+@benchmark('vm.evict.dirty', 50_000)
+def bench_evict_dirty(n):
+    vm = VM(virtual_pages=64, physical_frames=4)
+    ensure = vm._ensure_in_ram
+    pages = [i % 64 for i in range(n)]
+
+    def run():
+        for page_no in pages:
+            ensure(page_no).dirty = True
+    return run, n
+
+
+@benchmark('vm.zero_page', 50_000)
+def bench_zero_page(n):
+    vm = _resident_vm()
+    zero_page = vm.zero_page
+    pages = [i % vm.virtual_pages for i in range(n)]
+
+    def run():
+        for page_no in pages:
+            zero_page(page_no)
+    return run, n
+
+
+@benchmark('vm.get_stats', 20_000)
+def bench_get_stats(n):
+    vm = _resident_vm(pages=64)
+    get_stats = vm.get_stats
+
+    def run():
+        for _ in range(n):
+            get_stats()
+    return run, n
+
+
+# ============================================================================
+# PROCESOS Y SCHEDULING
+# ============================================================================
+
+def _noop_prog(kernel, pcb):
+    """Programa que nunca termina y no hace nada (mide solo el kernel)."""
+
+
+@benchmark('sched.add_next', 200_000)
+def bench_sched(n):
+    sched = Scheduler()
+    pcbs = [PCB(pid=i, state=State.READY, vm=None) for i in range(16)]
+    for pcb in pcbs:
+        sched.add(pcb)
+    add, next_ = sched.add, sched.next
+
+    def run():
+        # Cada iteración es un add + un next (cola de tamaño constante)
+        for _ in range(n):
+            add(next_())
+    return run, n
+
+
+@benchmark('sched.priority.add_next', 200_000)
+def bench_sched_priority(n):
+    sched = PriorityScheduler()
+    pcbs = [PCB(pid=i, state=State.READY, vm=None, priority=i % 4) for i in range(1024)]
+    for pcb in pcbs:
+        sched.add(pcb)
+    add, next_ = sched.add, sched.next
+
+    def run():
+        for _ in range(n):
+            add(next_())
+    return run, n
+
+
+@benchmark('sched.mlfq.add_next', 200_000)
+def bench_sched_mlfq(n):
+    sched = MLFQScheduler()
+    pcbs = [PCB(pid=i, state=State.READY, vm=None) for i in range(1024)]
+    for pcb in pcbs:
+        sched.add(pcb)
+    add, next_ = sched.add, sched.next
+
+    def run():
+        for _ in range(n):
+            add(next_())
+    return run, n
+
+
+@benchmark('timer.schedule_advance', 100_000)
+def bench_timer(n):
+    wheel = TimerWheel()
+    rng = random.Random(0)
+    delays = [rng.randint(1, 5000) for _ in range(1024)]
+    for i, delay in enumerate(delays):
+        wheel.schedule(delay, i)
+    schedule, advance = wheel.schedule, wheel.advance
+
+    def run():
+        # Cada iteración avanza un tick y reprograma lo vencido (~1024 timers pendientes)
+        for _ in range(n):
+            now = wheel.now + 1
+            for item in advance(now):
+                schedule(now + delays[item], item)
+    return run, n
+
+
+@benchmark('kernel.spawn', 5_000)
+def bench_spawn(n):
+    kernel = Kernel()
+    spawn = kernel.spawn
+
+    def run():
+        for _ in range(n):
+            spawn(_noop_prog)
+    return run, n
+
+
+@benchmark('kernel.dispatch', 100_000)
+def bench_dispatch(n):
+    kernel = Kernel()
+    for _ in range(8):
+        kernel.spawn(_noop_prog)
+    dispatch = kernel.dispatch
+
+    def run():
+        for _ in range(n):
+            dispatch()
+    return run, n
+
+
+@benchmark('kernel.run', 100_000)
+def bench_run(n):
+    kernel = Kernel()
+    for _ in range(8):
+        kernel.spawn(_noop_prog)
+
+    def run():
+        kernel.run(max_ticks=n)
+    return run, n
+
+
+@benchmark('kernel.dispatch.smp4', 25_000)
+def bench_dispatch_smp(n):
+    kernel = Kernel(num_cpus=4)
+    for _ in range(32):
+        kernel.spawn(_noop_prog)
+    dispatch = kernel.dispatch
+
+    def run():
+        for _ in range(n):
+            dispatch()
+    return run, n * 4
+
+
+# ============================================================================
+# MEDICIÓN Y REPORTE
+# ============================================================================
+
+def measure(func: Benchmark, scale: float = 1.0, repeat: int = 5) -> Dict[str, float]:
+    """
+    Ejecuta un benchmark varias veces y resume su throughput.
+
+    Cada repetición usa un estado recién preparado; se descarta una
+    ejecución de calentamiento.
+
+    Args:
+        func: Benchmark registrado
+        scale: Factor sobre la cantidad base de operaciones
+        repeat: Repeticiones medidas
+
+    Returns:
+        Diccionario con ops_per_sec (media), stdev, min, max y runs
+    """
+    n = max(1, int(func.ops * scale))
+    runs = []
+    for i in range(repeat + 1):
+        run, ops = func(n)
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        if i > 0:
+            runs.append(ops / elapsed)
+    return {
+        'ops_per_sec': statistics.mean(runs),
+        'stdev': statistics.stdev(runs) if len(runs) > 1 else 0.0,
+        'min': min(runs),
+        'max': max(runs),
+        'runs': runs,
+    }
+
+
+def run_all(names: List[str], scale: float, repeat: int) -> Dict[str, Dict[str, float]]:
+    """Ejecuta los benchmarks indicados imprimiendo cada resultado."""
+    results = {}
+    print(f"\n{'BENCHMARK':<22} {'OPS/SEC':>14} {'± STDEV':>12} {'CV':>7}")
+    print("-" * 58)
+    for name in names:
+        result = measure(BENCHMARKS[name], scale, repeat)
+        results[name] = result
+        cv = result['stdev'] / result['ops_per_sec'] if result['ops_per_sec'] else 0.0
+        print(f"{name:<22} {result['ops_per_sec']:>14,.0f} {result['stdev']:>12,.0f} {cv:>7.1%}")
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float) -> List[str]:
+    """
+    Compara resultados contra un baseline.
+
+    Args:
+        results: Resultados actuales
+        baseline: Resultados guardados
+        threshold: Caída relativa tolerada (ej: 0.10 = 10%)
+
+    Returns:
+        Nombres de los benchmarks con regresión
+    """
+    regressions = []
+    print(f"\n{'BENCHMARK':<22} {'BASELINE':>14} {'ACTUAL':>14} {'CAMBIO':>9}")
+    print("-" * 62)
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            print(f"{name:<22} {'-':>14} {result['ops_per_sec']:>14,.0f}   (nuevo)")
+            continue
+        change = result['ops_per_sec'] / old['ops_per_sec'] - 1
+        flag = ""
+        if change < -threshold:
+            regressions.append(name)
+            flag = "  ❌ REGRESIÓN"
+        elif change > threshold:
+            flag = "  ✅ mejora"
+        print(f"{name:<22} {old['ops_per_sec']:>14,.0f} {result['ops_per_sec']:>14,.0f} "
+              f"{change:>+9.1%}{flag}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Microbenchmarks de VOS")
+    parser.add_argument('--filter', default='', help="Solo benchmarks cuyo nombre contenga este texto")
+    parser.add_argument('--repeat', type=int, default=5, help="Repeticiones medidas por benchmark")
+    parser.add_argument('--scale', type=float, default=1.0, help="Factor sobre las operaciones base")
+    parser.add_argument('--save', metavar='JSON', help="Guardar resultados como baseline")
+    parser.add_argument('--compare', metavar='JSON', help="Comparar contra un baseline guardado")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Caída relativa que cuenta como regresión (default 0.10)")
+    parser.add_argument('--list', action='store_true', help="Listar benchmarks y salir")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return 0
+    if not names:
+        print(f"❌ Ningún benchmark coincide con {args.filter!r}")
+        return 2
+
+    print(f"⏱️  VOS benchmarks: {len(names)} benchmarks × {args.repeat} repeticiones "
+          f"(Python {platform.python_version()})")
+    results = run_all(names, args.scale, args.repeat)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'meta': {
+                    'python': platform.python_version(),
+                    'implementation': platform.python_implementation(),
+                    'platform': platform.platform(),
+                    'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                    'repeat': args.repeat,
+                    'scale': args.scale,
+                },
+                'results': results,
+            }, f, indent=2)
+        print(f"\n💾 Baseline guardado en {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regresión(es) mayores a {args.threshold:.0%}: "
+                  f"{', '.join(regressions)}")
+            return 1
+        print(f"\n✅ Sin regresiones mayores a {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
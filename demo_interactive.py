@@ -1,8 +1,9 @@
 from vos.core.vm import VM, PAGE_SIZE
+from vos.core.trace import ConsoleTracer
 
 print("=== DEMO INTERACTIVA ===\n")
 
-vm = VM()
+vm = VM(tracer=ConsoleTracer())
 
 print("1. Escribiendo valor 42 en dirección 100:")
 vm.write_byte(100, 42)
@@ -18,7 +18,11 @@ from vos.core.demo_tasks import (
     counter_writer_prog,
     pattern_writer_prog
 )
-from vos.core.vm import PAGE_SIZE
+from vos.core.trace import ConsoleTracer
+
+
+# Salida legible original (opt-in): el kernel y las VMs son silenciosos por defecto
+TRACER = ConsoleTracer()
 
 
 def test_basic_two_processes():
@@ -31,7 +35,7 @@ def test_basic_two_processes():
     print("="*70)
     
     # Crear kernel
-    kernel = Kernel()
+    kernel = Kernel(tracer=TRACER, keep_terminated=True)
     
     # Crear dos procesos
     pid1 = kernel.spawn(touch_pages_prog, "TouchPages")
@@ -68,7 +72,7 @@ def test_basic_two_processes():
     if pcb1:
         print(f"\n🔍 Leyendo memoria del proceso {pid1} ({pcb1.name}):")
         for page_no in range(5):
-            vaddr = page_no * PAGE_SIZE
+            vaddr = page_no * pcb1.vm.page_size
             try:
                 value = pcb1.vm.read_byte(vaddr)
                 print(f"   Página {page_no} (vaddr={vaddr}): {value}")
@@ -86,7 +90,7 @@ def test_multiple_processes():
     print("="*70)
     
     # Crear kernel
-    kernel = Kernel()
+    kernel = Kernel(tracer=TRACER, keep_terminated=True)
     
     # Crear 6 procesos diferentes
     procs = [
@@ -149,7 +153,7 @@ def test_memory_isolation():
     print("="*70)
     
     # Crear kernel
-    kernel = Kernel()
+    kernel = Kernel(tracer=TRACER, keep_terminated=True)
     
     # Crear tres procesos que escriben en la misma dirección virtual
     pids = [
@@ -199,7 +203,7 @@ def test_state_transitions():
     print("="*70)
     
     # Crear kernel
-    kernel = Kernel()
+    kernel = Kernel(tracer=TRACER, keep_terminated=True)
     
     # Crear procesos con diferentes duraciones
     kernel.spawn(idle_prog, "Short-Process")  # Termina rápido
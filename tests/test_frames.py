@@ -0,0 +1,77 @@
+"""
+Pruebas del pool de marcos compartido: robo de marcos a la VM más grande
+y devolución de toda la memoria al terminar los procesos.
+"""
+
+import random
+
+import pytest
+
+from vos.core.frames import FramePool
+from vos.core.sys import Kernel
+from vos.core.workloads import make_program
+
+PAGE = 64
+
+
+def test_largest_matches_max_reference(monkeypatch):
+    largest = FramePool._largest
+    checks = []
+
+    def checked(pool):
+        reference = max(pool.vms, key=lambda vm: len(vm.frame_to_page), default=None)
+        try:
+            owner = largest(pool)
+        except RuntimeError:
+            assert reference is None or not reference.frame_to_page
+            raise
+        assert owner is reference
+        checks.append(owner)
+        return owner
+
+    monkeypatch.setattr(FramePool, '_largest', checked)
+    rng = random.Random(5)
+    for _ in range(4):
+        kernel = Kernel(page_size=PAGE, virtual_pages=16, physical_frames=12, total_frames=24,
+                        low_watermark=rng.choice([0, 3]), num_cpus=rng.choice([1, 2]))
+        run_random_processes(kernel, rng)
+    assert len(checks) > 100
+
+
+def run_random_processes(kernel, rng, rounds=40):
+    """Procesos efímeros con fork y memoria compartida, recogidos al azar."""
+    shm = kernel.shm_create(3)
+    base = 12 * PAGE
+    for _ in range(rounds):
+        for _ in range(rng.randint(0, 4)):
+            refs = [(rng.randrange(base) << 1) | (rng.random() < 0.5)
+                    for _ in range(rng.randint(1, 200))]
+            pid = kernel.spawn(make_program(refs, 16))
+            if rng.random() < 0.3:
+                kernel.shm_attach(pid, shm, base)
+            if rng.random() < 0.3:
+                kernel.fork(pid)
+        for _ in range(rng.randint(1, 15)):
+            kernel.dispatch()
+        while rng.random() < 0.8 and kernel.wait():
+            pass
+    kernel.run()
+    while kernel.wait():
+        pass
+    kernel.shm_destroy(shm)
+
+
+@pytest.mark.parametrize('scope', ['local', 'global'])
+def test_exited_processes_return_all_memory(scope):
+    rng = random.Random(scope)
+    kernel = Kernel(page_size=PAGE, virtual_pages=16, physical_frames=8, total_frames=20,
+                    replacement_scope=scope, low_watermark=2, num_cpus=2)
+    free = len(kernel.frame_pool.memory.free_frames)
+    run_random_processes(kernel, rng)
+    pool = kernel.frame_pool
+    assert not kernel.procs and not kernel.zombies
+    assert not pool.vms and not pool.owners and not pool.sharers
+    assert len(pool.memory.free_frames) == free
+    # Los write-backs evitados de los procesos terminados no se pierden,
+    # y solo cuentan desalojos hechos en page faults
+    assert 0 <= kernel.reclaimer.writebacks_avoided <= pool.evictions
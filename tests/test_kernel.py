@@ -0,0 +1,110 @@
+"""
+Pruebas del Kernel: recolección de procesos terminados, estado de los
+schedulers con migraciones entre CPUs, costo acotado del reclamador y
+su contabilidad de write-backs evitados.
+"""
+
+import random
+
+import pytest
+
+from vos.core.process import State, ZombieRecord
+from vos.core.sys import Kernel
+
+
+def short_prog(slices):
+    """Programa que termina después de `slices` time slices."""
+    def prog(kernel, pcb):
+        if pcb.cpu_time + 1 >= slices:
+            pcb.state = State.TERMINATED
+    return prog
+
+
+def test_terminated_processes_become_zombies_until_wait():
+    kernel = Kernel()
+    quick = kernel.spawn(short_prog(1), "Quick")
+    slow = kernel.spawn(short_prog(5), "Slow")
+    kernel.dispatch()
+    assert quick not in kernel.procs
+    assert isinstance(kernel.get_process(quick), ZombieRecord)
+    assert kernel.ps(State.TERMINATED) == [(quick, 'TERMINATED')]
+    assert kernel.wait(slow) is None            # Sigue vivo: no bloquea
+    record = kernel.wait()
+    assert (record.pid, record.name, record.cpu_time) == (quick, "Quick", 1)
+    assert kernel.get_process(quick) is None
+    with pytest.raises(ValueError):
+        kernel.wait(quick)
+    kernel.run()
+    assert kernel.wait(slow).cpu_time == 5
+    assert not kernel.procs and not kernel.zombies
+
+
+def test_keep_terminated_holds_memory_until_wait():
+    kernel = Kernel(keep_terminated=True)
+
+    def prog(kernel, pcb):
+        pcb.vm.write_byte(0, 7)
+        pcb.state = State.TERMINATED
+
+    pid = kernel.spawn(prog)
+    kernel.run()
+    pcb = kernel.get_process(pid)
+    assert pcb.vm.read_byte(0) == 7
+    kernel.wait(pid)
+    assert not kernel.frame_pool.vms
+
+
+@pytest.mark.parametrize('sleep', [False, True])
+def test_mlfq_forgets_processes_that_migrate(sleep):
+    kernel = Kernel(scheduler='mlfq', num_cpus=2)
+
+    def prog(kernel, pcb):
+        if pcb.cpu_time == 0:
+            kernel.set_affinity(pcb.pid, [1 - pcb.cpu])
+            if sleep:
+                kernel.sleep(pcb, 3)
+        elif pcb.cpu_time >= 3:
+            pcb.state = State.TERMINATED
+
+    for _ in range(300):
+        kernel.spawn(prog)
+    kernel.run()
+    while kernel.wait():
+        pass
+    for cpu in kernel.cpus:
+        assert not cpu.sched.levels and not cpu.sched.used and not cpu.sched.last_run
+
+
+def test_reclaim_pass_cost_does_not_grow_with_processes():
+    def writer(kernel, pcb):
+        pcb.vm.write_byte(0, 1)
+
+    kernel = Kernel(total_frames=2000, low_watermark=4)
+    for _ in range(1000):
+        kernel.spawn(writer)
+    kernel.run(max_ticks=1000)
+    daemon = kernel.reclaimer
+    # Con marcos libres de sobra solo limpia cada clean_interval pasadas,
+    # y cada pasada examina a lo sumo clean_batch páginas
+    before = daemon.writebacks
+    kernel.run(max_ticks=800)
+    assert daemon.writebacks - before <= 800 // daemon.clean_interval * daemon.clean_batch
+
+
+def test_writebacks_avoided_counts_only_fault_evictions():
+    kernel = Kernel(total_frames=16, replacement_scope='global', low_watermark=4, high_watermark=8)
+
+    def writer(seed):
+        rng = random.Random(seed)
+
+        def prog(kernel, pcb):
+            for _ in range(8):
+                pcb.vm.write_byte(rng.randrange(pcb.vm.max_vaddr), 1)
+        return prog
+
+    for seed in range(4):
+        kernel.spawn(writer(seed))
+    kernel.run(max_ticks=2000)
+    # El daemon desaloja miles de páginas que él mismo limpió: esas no cuentan
+    assert kernel.reclaimer.reclaimed > kernel.frame_pool.evictions
+    assert kernel.reclaimer.writebacks_avoided <= kernel.frame_pool.evictions
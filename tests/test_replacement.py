@@ -0,0 +1,202 @@
+"""
+Pruebas de las políticas de reemplazo: page faults de una VM con cada
+política contra una simulación de referencia independiente, y peek().
+"""
+
+import random
+import time
+from collections import OrderedDict, deque
+
+import pytest
+
+from vos.core.replacement import POLICIES, FIFOPolicy
+from vos.core.vm import VM
+
+
+def fifo_ref(trace, c):
+    resident, queue, faults = set(), deque(), 0
+    for x in trace:
+        if x in resident:
+            continue
+        faults += 1
+        if len(queue) == c:
+            resident.discard(queue.popleft())
+        queue.append(x)
+        resident.add(x)
+    return faults
+
+
+def lru_ref(trace, c):
+    stack, faults = [], 0
+    for x in trace:
+        if x in stack:
+            stack.remove(x)
+        else:
+            faults += 1
+            if len(stack) == c:
+                stack.pop(0)
+        stack.append(x)
+    return faults
+
+
+def clock_ref(trace, c):
+    # CLOCK de libro: anillo fijo de c ranuras; la carga marca el bit
+    slots, ref, hand, faults = [], [], 0, 0
+    for x in trace:
+        if x in slots:
+            ref[slots.index(x)] = True
+            continue
+        faults += 1
+        if len(slots) < c:
+            slots.append(x)
+            ref.append(True)
+            continue
+        while ref[hand]:
+            ref[hand] = False
+            hand = (hand + 1) % c
+        slots[hand], ref[hand] = x, True
+        hand = (hand + 1) % c
+    return faults
+
+
+def lfu_ref(trace, c):
+    # Menor frecuencia; empate: la que llegó antes a esa frecuencia
+    freq, since, faults = {}, {}, 0
+    for t, x in enumerate(trace):
+        if x in freq:
+            freq[x] += 1
+        else:
+            faults += 1
+            if len(freq) == c:
+                victim = min(freq, key=lambda k: (freq[k], since[k]))
+                del freq[victim], since[victim]
+            freq[x] = 1
+        since[x] = t
+    return faults
+
+
+def arc_ref(trace, c):
+    # ARC según Megiddo & Modha (FAST '03, fig. 4); |T1| se compara con p
+    # truncado, como en ARCPolicy
+    t1, t2, b1, b2 = OrderedDict(), OrderedDict(), OrderedDict(), OrderedDict()
+    p, faults = 0.0, 0
+
+    def replace(x):
+        if t1 and ((x in b2 and len(t1) == int(p)) or len(t1) > p):
+            key, _ = t1.popitem(last=False)
+            b1[key] = None
+        else:
+            key, _ = t2.popitem(last=False)
+            b2[key] = None
+
+    for x in trace:
+        if x in t1:
+            del t1[x]
+            t2[x] = None
+            continue
+        if x in t2:
+            t2.move_to_end(x)
+            continue
+        faults += 1
+        if x in b1:
+            p = min(c, p + max(len(b2) / len(b1), 1))
+            replace(x)
+            del b1[x]
+            t2[x] = None
+        elif x in b2:
+            p = max(0, p - max(len(b1) / len(b2), 1))
+            replace(x)
+            del b2[x]
+            t2[x] = None
+        else:
+            l1 = len(t1) + len(b1)
+            total = l1 + len(t2) + len(b2)
+            if l1 == c:
+                if len(t1) < c:
+                    b1.popitem(last=False)
+                    replace(x)
+                else:
+                    t1.popitem(last=False)
+            elif total >= c:
+                if total == 2 * c:
+                    b2.popitem(last=False)
+                if len(t1) + len(t2) >= c:
+                    replace(x)
+            t1[x] = None
+    return faults
+
+
+REFERENCES = {
+    'fifo': fifo_ref,
+    'lru': lru_ref,
+    'clock': clock_ref,
+    'lfu': lfu_ref,
+    'arc': arc_ref,
+}
+
+
+def random_trace(rng, pages, n=300):
+    """Mezcla de referencias sesgadas (localidad) y uniformes."""
+    return [int(rng.paretovariate(1.0)) % pages if rng.random() < 0.7 else rng.randrange(pages)
+            for _ in range(n)]
+
+
+@pytest.mark.parametrize('name', sorted(REFERENCES))
+def test_page_faults_match_reference(name):
+    rng = random.Random(name)
+    for _ in range(100):
+        frames = rng.randint(1, 8)
+        trace = random_trace(rng, rng.randint(frames + 1, 16))
+        vm = VM(virtual_pages=16, physical_frames=frames, policy=name)
+        for page in trace:
+            vm.read_byte(page * vm.page_size)
+        assert vm.page_faults == REFERENCES[name](trace, frames)
+
+
+@pytest.mark.parametrize('name', sorted(POLICIES))
+def test_peek_is_snapshot_prefix(name):
+    rng = random.Random(name)
+    policy = POLICIES[name]()
+    policy.attach(50, lambda key: rng.random() < 0.5)
+    live = set()
+    for _ in range(3000):
+        r = rng.random()
+        if r < 0.4 and len(live) < 50:
+            key = rng.randrange(200)
+            if key not in live:
+                policy.on_load(key)
+                live.add(key)
+        elif r < 0.6 and live and policy.tracks_hits:
+            policy.on_access(rng.choice(sorted(live)))
+        elif r < 0.7 and live:
+            key = rng.choice(sorted(live))
+            policy.remove(key)
+            live.discard(key)
+        elif r < 0.75 and live:
+            live.discard(policy.select_victim())
+        assert len(policy) == len(live)
+        for n in (0, 1, 3, 60):
+            assert policy.peek(n) == policy.snapshot()[:n]
+
+
+def test_fifo_remove_keeps_load_order():
+    policy = FIFOPolicy()
+    for key in range(10):
+        policy.on_load(key)
+    for key in (0, 5, 9):
+        policy.remove(key)
+    assert [policy.select_victim() for _ in range(7)] == [1, 2, 3, 4, 6, 7, 8]
+
+
+def test_fifo_remove_is_constant_time():
+    # Con un deque, remove era O(n): 20000 bajas al azar tardaban segundos
+    policy = FIFOPolicy()
+    keys = list(range(20000))
+    for key in keys:
+        policy.on_load(key)
+    random.Random(2).shuffle(keys)
+    start = time.perf_counter()
+    for key in keys:
+        policy.remove(key)
+    assert time.perf_counter() - start < 0.5
+    assert len(policy) == 0
@@ -0,0 +1,32 @@
+"""
+Pruebas del análisis de distancias de pila contra simulaciones directas.
+"""
+
+import random
+
+from vos.core.stackdist import StackDistanceAnalyzer, fifo_fault_curve, find_belady_anomalies
+
+from tests.test_replacement import fifo_ref, lru_ref
+
+
+def test_lru_fault_curve_matches_brute_force():
+    rng = random.Random(11)
+    for _ in range(30):
+        pages = rng.randint(1, 40)
+        trace = [rng.randrange(pages) for _ in range(rng.randint(1, 400))]
+        # Capacidad chica: fuerza las compactaciones del árbol de Fenwick
+        analyzer = StackDistanceAnalyzer(capacity=8)
+        analyzer.feed(trace)
+        curve = analyzer.fault_curve(pages + 2)
+        assert curve[0] == len(trace)
+        for frames in range(1, pages + 3):
+            assert curve[frames] == lru_ref(trace, frames)
+            assert analyzer.faults(frames) == curve[frames]
+
+
+def test_fifo_curve_and_belady_anomaly():
+    # Cadena clásica de Belady: 3 marcos dan 9 faults y 4 marcos, 10
+    trace = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
+    curve = fifo_fault_curve(trace, 5)
+    assert curve[1:] == [fifo_ref(trace, c) for c in range(1, 6)]
+    assert (3, 9, 10) in find_belady_anomalies(curve)
@@ -0,0 +1,50 @@
+"""
+Pruebas de la rueda de timers contra un modelo de lista ordenada.
+"""
+
+import random
+
+from vos.core.timer import TimerWheel
+
+
+def test_wheel_matches_sorted_model():
+    rng = random.Random(23)
+    for _ in range(40):
+        wheel = TimerWheel(slots=rng.choice([2, 4, 8]), levels=rng.randint(1, 3))
+        horizon = wheel.slots ** wheel.levels
+        model = []          # (vencimiento, item)
+        seq = 0
+        for _ in range(200):
+            if rng.random() < 0.6:
+                # Incluye vencidos, cercanos y más allá del alcance (desborde)
+                expires = wheel.now + rng.randint(-3, 3 * horizon)
+                wheel.schedule(expires, seq)
+                model.append((expires, seq))
+                seq += 1
+            else:
+                expected_next = min((e for e, _ in model), default=None)
+                due = wheel.next_due()
+                if expected_next is None:
+                    assert due is None
+                else:
+                    assert due == max(expected_next, wheel.now)
+                start = wheel.now
+                until = start + rng.randint(0, 2 * horizon)
+                fired = wheel.advance(until)
+                assert sorted(fired) == sorted(s for e, s in model if e <= until)
+                # En orden de vencimiento (los ya vencidos al agregarse, primero)
+                expiry = dict((s, max(e, start)) for e, s in model)
+                assert [expiry[s] for s in fired] == sorted(expiry[s] for s in fired)
+                model = [(e, s) for e, s in model if e > until]
+                assert wheel.now == until
+                assert len(wheel) == len(model)
+
+
+def test_advance_delivers_in_expiry_order():
+    wheel = TimerWheel(slots=4, levels=2)
+    for expires in (40, 3, 17, 9, 100, 3):
+        wheel.schedule(expires, expires)
+    assert wheel.advance(50) == [3, 3, 9, 17, 40]
+    assert wheel.next_due() == 100
+    assert wheel.advance(100) == [100]
+    assert len(wheel) == 0
@@ -0,0 +1,96 @@
+"""
+Pruebas de integridad de datos de la VM: copy-on-write tras fork (con
+desalojos y distintos backing stores) y segmentos de memoria compartida.
+"""
+
+import random
+
+import pytest
+
+from vos.core.swap import CompressedBackingStore, DictBackingStore, SwapDevice
+from vos.core.sys import Kernel
+from vos.core.tlb import TLB
+from vos.core.vm import VM
+
+PAGE = 64
+PAGES = 16
+
+STORES = {
+    'dict': lambda: DictBackingStore(),
+    'swap': lambda: SwapDevice(page_size=PAGE),
+    'zlib': lambda: CompressedBackingStore(page_size=PAGE),
+}
+
+
+@pytest.mark.parametrize('store', sorted(STORES))
+@pytest.mark.parametrize('policy', ['fifo', 'lru', 'clock', 'arc'])
+def test_cow_fork_keeps_address_spaces_apart(store, policy):
+    rng = random.Random(f"{store}-{policy}")
+    root = VM(page_size=PAGE, virtual_pages=PAGES, physical_frames=5, policy=policy,
+              backing_store=STORES[store](), tlb=TLB(4))
+    vms = [root]
+    shadows = [bytearray(PAGE * PAGES)]
+    for step in range(3000):
+        i = rng.randrange(len(vms))
+        vm, shadow = vms[i], shadows[i]
+        r = rng.random()
+        if r < 0.01 and len(vms) < 5:
+            vms.append(vm.fork(tlb=TLB(4)))
+            shadows.append(bytearray(shadow))
+        elif r < 0.015 and len(vms) > 1:
+            vms.pop(i).release()
+            shadows.pop(i)
+        elif r < 0.5:
+            vaddr, value = rng.randrange(PAGE * PAGES), rng.randrange(256)
+            vm.write_byte(vaddr, value)
+            shadow[vaddr] = value
+        else:
+            vaddr = rng.randrange(PAGE * PAGES)
+            assert vm.read_byte(vaddr) == shadow[vaddr]
+    for vm, shadow in zip(vms, shadows):
+        assert vm.read(0, PAGE * PAGES) == bytes(shadow)
+
+
+def test_released_parent_keeps_forked_swap_file_open():
+    vm = VM(page_size=PAGE, backing_store=SwapDevice(page_size=PAGE), physical_frames=2)
+    for page in range(6):
+        vm.write_byte(page * PAGE, page + 1)
+    child = vm.fork()
+    vm.release()
+    assert [child.read_byte(page * PAGE) for page in range(6)] == [1, 2, 3, 4, 5, 6]
+    swap_file = child.backing_store.swap_file
+    child.release()
+    assert swap_file._file.closed
+
+
+@pytest.mark.parametrize('scope', ['local', 'global'])
+def test_shared_segment_is_visible_to_all_processes(scope):
+    rng = random.Random(scope)
+    kernel = Kernel(page_size=PAGE, virtual_pages=PAGES, physical_frames=4, total_frames=10,
+                    replacement_scope=scope)
+    noop = lambda kernel, pcb: None
+    shm = kernel.shm_create(4)
+    base = 12 * PAGE
+    pids = [kernel.spawn(noop) for _ in range(3)]
+    for pid in pids:
+        kernel.shm_attach(pid, shm, base)
+    vms = [kernel.get_process(pid).vm for pid in pids]
+    shared = bytearray(4 * PAGE)
+    private = [bytearray(base) for _ in vms]
+    for _ in range(3000):
+        i = rng.randrange(len(vms))
+        vm = vms[i]
+        if rng.random() < 0.5:
+            offset, value = rng.randrange(len(shared)), rng.randrange(256)
+            vm.write_byte(base + offset, value)
+            shared[offset] = value
+        else:
+            vaddr, value = rng.randrange(base), rng.randrange(256)
+            vm.write_byte(vaddr, value)
+            private[i][vaddr] = value
+        j = rng.randrange(len(vms))
+        offset = rng.randrange(len(shared))
+        assert vms[j].read_byte(base + offset) == shared[offset]
+    for vm, memory in zip(vms, private):
+        assert vm.read(base, len(shared)) == bytes(shared)
+        assert vm.read(0, base) == bytes(memory)
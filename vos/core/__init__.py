@@ -8,10 +8,34 @@ Este paquete contiene los componentes fundamentales del sistema operativo simula
 
 # Opcional: Puedes exportar las clases principales para facilitar imports
 
-from vos.core.vm import VM, PageTable, PhysicalMemory, PTEntry, PAGE_SIZE, VIRTUAL_PAGES, PHYSICAL_FRAMES
-from vos.core.process import PCB, State
-from vos.core.sched import Scheduler
+from vos.core.vm import (
+    VM, PageTable, PhysicalMemory, PTEntry, PAGE_SIZE, VIRTUAL_PAGES, PHYSICAL_FRAMES,
+    KERNEL_FRAMES,
+)
+from vos.core.frames import FramePool
+from vos.core.shm import SharedSegment
+from vos.core.reclaim import ReclaimDaemon
+from vos.core.replacement import (
+    ReplacementPolicy, FIFOPolicy, LRUPolicy, ClockPolicy, LFUPolicy, ARCPolicy,
+    make_policy,
+)
+from vos.core.tlb import TLB
+from vos.core.prefetch import Prefetcher
+from vos.core.swap import DictBackingStore, SwapFile, SwapDevice, CompressedBackingStore
+from vos.core.pagetable import MultiLevelPageTable, CompactPageTable, make_page_table
+from vos.core.stackdist import StackDistanceAnalyzer, fifo_faults, find_belady_anomalies
+from vos.core.workloads import make_workload, make_program
+from vos.core.process import PCB, State, ZombieRecord
+from vos.core.sched import (
+    BaseScheduler, Scheduler, PriorityScheduler, MLFQScheduler, make_scheduler,
+)
+from vos.core.cpu import CPU
+from vos.core.timer import TimerWheel
 from vos.core.sys import Kernel
+from vos.core.trace import (
+    TraceLevel, Tracer, NullTracer, MemoryTracer, JSONLinesTracer, ConsoleTracer,
+    get_default_tracer, set_default_tracer,
+)
 
 __all__ = [
     # VM Module (Lab 1)
@@ -22,16 +46,74 @@ __all__ = [
     'PAGE_SIZE',
     'VIRTUAL_PAGES',
     'PHYSICAL_FRAMES',
+    'KERNEL_FRAMES',
+    
+    # RAM compartida
+    'FramePool',
+    'SharedSegment',
+    'ReclaimDaemon',
+    
+    # Políticas de reemplazo
+    'ReplacementPolicy',
+    'FIFOPolicy',
+    'LRUPolicy',
+    'ClockPolicy',
+    'LFUPolicy',
+    'ARCPolicy',
+    'make_policy',
+    
+    # TLB
+    'TLB',
+    
+    # Prefetching
+    'Prefetcher',
+    
+    # Tablas de páginas
+    'MultiLevelPageTable',
+    'CompactPageTable',
+    'make_page_table',
+    
+    # Backing store / swap
+    'DictBackingStore',
+    'SwapFile',
+    'SwapDevice',
+    'CompressedBackingStore',
+    
+    # Análisis de distancias de pila
+    'StackDistanceAnalyzer',
+    'fifo_faults',
+    'find_belady_anomalies',
+    
+    # Cargas de trabajo sintéticas
+    'make_workload',
+    'make_program',
     
     # Process Module (Lab 2)
     'PCB',
     'State',
+    'ZombieRecord',
     
     # Scheduler Module (Lab 2)
+    'BaseScheduler',
     'Scheduler',
+    'PriorityScheduler',
+    'MLFQScheduler',
+    'make_scheduler',
     
     # System Module (Lab 2)
+    'CPU',
+    'TimerWheel',
     'Kernel',
+    
+    # Trazado de eventos
+    'TraceLevel',
+    'Tracer',
+    'NullTracer',
+    'MemoryTracer',
+    'JSONLinesTracer',
+    'ConsoleTracer',
+    'get_default_tracer',
+    'set_default_tracer',
 ]
 
 __version__ = '2.0.0'
@@ -0,0 +1,116 @@
+"""
+CPUs del Kernel Multiprocesador
+VOS (Virtual Operating System)
+
+Este módulo define el estado de cada CPU simulada del Kernel:
+- Cola de listos propia (una instancia de scheduler por CPU)
+- Proceso en ejecución y último proceso que usó la CPU
+- Modelo de TLB por CPU: sin ASIDs, las traducciones cacheadas de un
+  proceso solo siguen válidas si fue el último en ejecutar en ESA CPU;
+  al alternar con otro proceso o al migrar, el TLB arranca vacío
+- Estadísticas de utilización, flushes de TLB, migraciones y robos
+
+El Kernel ejecuta en cada dispatch un time slice por CPU; una CPU cuya
+cola se vacía roba procesos de la más cargada (work stealing).
+"""
+
+from typing import TYPE_CHECKING, Dict, Optional, Union
+
+if TYPE_CHECKING:
+    from vos.core.process import PCB
+    from vos.core.sched import BaseScheduler
+
+
+class CPU:
+    """
+    Estado de una CPU.
+
+    Atributos:
+        cpu_id: Número de CPU
+        sched: Scheduler con la cola de listos de esta CPU
+        running: Proceso en ejecución (o None)
+        last_pid: Último proceso que ejecutó en esta CPU
+        busy: Time slices en los que ejecutó un proceso
+        idle: Time slices sin procesos listos
+        tlb_flushes: Flushes de TLB por cambios de contexto en esta CPU
+        migrations: Procesos que llegaron desde otra CPU
+        steals: Procesos robados de otras CPUs
+    """
+
+    def __init__(self, cpu_id: int, sched: 'BaseScheduler'):
+        """
+        Args:
+            cpu_id: Número de CPU
+            sched: Scheduler propio de la CPU
+        """
+        self.cpu_id = cpu_id
+        self.sched = sched
+        self.running: Optional['PCB'] = None
+        self.last_pid: Optional[int] = None
+        self.busy = 0
+        self.idle = 0
+        self.tlb_flushes = 0
+        self.migrations = 0
+        self.steals = 0
+
+    def allows(self, pcb: 'PCB') -> bool:
+        """True si la afinidad del proceso le permite ejecutar en esta CPU."""
+        return pcb.affinity is None or self.cpu_id in pcb.affinity
+
+    def switch_to(self, pcb: 'PCB') -> bool:
+        """
+        Cambio de contexto hacia un proceso.
+
+        Vacía el TLB del proceso si el último en usar esta CPU fue otro o si
+        el proceso viene de otra CPU (sus traducciones se cargaron allá).
+
+        Args:
+            pcb: Proceso que pasa a ejecutar
+
+        Returns:
+            True si hubo flush de TLB
+        """
+        migrated = pcb.cpu is not None and pcb.cpu != self.cpu_id
+        if migrated:
+            self.migrations += 1
+        pcb.cpu = self.cpu_id
+        if self.last_pid == pcb.pid and not migrated:
+            return False
+        self.last_pid = pcb.pid
+        if pcb.vm.tlb is None:
+            return False
+        pcb.vm.tlb.flush()
+        self.tlb_flushes += 1
+        return True
+
+    @property
+    def utilization(self) -> float:
+        """Fracción de time slices en los que la CPU ejecutó un proceso."""
+        total = self.busy + self.idle
+        return self.busy / total if total else 0.0
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Obtiene estadísticas de la CPU.
+
+        Returns:
+            Diccionario con slices ocupados y ociosos, utilización, flushes
+            de TLB, migraciones, robos y procesos en la cola de listos
+        """
+        return {
+            'cpu': self.cpu_id,
+            'busy': self.busy,
+            'idle': self.idle,
+            'utilization': self.utilization,
+            'tlb_flushes': self.tlb_flushes,
+            'migrations': self.migrations,
+            'steals': self.steals,
+            'ready': self.sched.size(),
+        }
+
+    def __repr__(self) -> str:
+        running = self.running.pid if self.running else None
+        return (
+            f"CPU(id={self.cpu_id}, running={running}, ready={self.sched.size()}, "
+            f"utilization={self.utilization:.2f})"
+        )
@@ -7,7 +7,6 @@ Cada programa está diseñado para demostrar diferentes aspectos del sistema.
 """
 
 from vos.core.process import State
-from vos.core.vm import PAGE_SIZE
 
 
 def touch_pages_prog(kernel, pcb):
@@ -43,7 +42,7 @@ def touch_pages_prog(kernel, pcb):
     
     # Calcular dirección virtual: página i, offset 0
     page_no = pcb._touch_counter
-    vaddr = page_no * PAGE_SIZE + 0
+    vaddr = page_no * pcb.vm.page_size + 0
     
     # Escribir PID en memoria virtual propia
     print(f"   📝 [{pcb.name}] Escribiendo PID {pcb.pid} en vaddr={vaddr} (página {page_no})")
@@ -189,7 +188,7 @@ def memory_scanner_prog(kernel, pcb):
     
     # Calcular dirección a leer (páginas diferentes)
     page_no = pcb._scan_counter
-    vaddr = page_no * PAGE_SIZE + 10
+    vaddr = page_no * pcb.vm.page_size + 10
     
     # Leer de memoria virtual
     print(f"   🔍 [{pcb.name}] Leyendo vaddr={vaddr} (página {page_no})")
@@ -238,7 +237,7 @@ def counter_writer_prog(kernel, pcb):
     
     # Escribir contador en memoria (diferentes páginas)
     page_no = pcb._counter % 4  # Rotar entre 4 páginas
-    vaddr = page_no * PAGE_SIZE + (pcb._counter * 2)
+    vaddr = page_no * pcb.vm.page_size + (pcb._counter * 2)
     value = (pcb._counter * 10) % 256
     
     print(f"   ✍️  [{pcb.name}] Escribiendo {value} en vaddr={vaddr}")
@@ -286,7 +285,7 @@ def pattern_writer_prog(kernel, pcb):
     
     # Escribir patrón en la página actual
     page_no = pcb._pattern_page
-    base_addr = page_no * PAGE_SIZE
+    base_addr = page_no * pcb.vm.page_size
     
     print(f"   🎨 [{pcb.name}] Escribiendo patrón en página {page_no}")
     
@@ -0,0 +1,356 @@
+"""
+Pool de Marcos Físicos Compartido
+VOS (Virtual Operating System)
+
+Este módulo gestiona la RAM física desde la que las VMs obtienen marcos:
+- Una única PhysicalMemory compartida por todos los procesos de un Kernel
+- Alcance de reemplazo local (cada proceso desaloja sus propias páginas,
+  con una cuota de marcos) o global (una política sobre todas las páginas
+  residentes del sistema, con claves (vm, página))
+- Contabilidad del resident set (RSS) de cada proceso, con un heap de
+  RSS para encontrar la VM más grande sin recorrerlas todas
+- Marcos compartidos por varios espacios de direcciones (copy-on-write
+  tras un fork, segmentos de memoria compartida) con conteo de referencias
+
+Una VM creada sin pool recibe uno privado con alcance local: es el
+comportamiento original de una RAM por VM.
+"""
+
+import heapq
+from itertools import count
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Tuple, Union
+
+from vos.core.replacement import ReplacementPolicy, make_policy
+
+if TYPE_CHECKING:
+    from vos.core.vm import VM, PhysicalMemory
+
+# Alcances de reemplazo
+LOCAL = 'local'
+GLOBAL = 'global'
+SCOPES = (LOCAL, GLOBAL)
+
+
+class _GlobalPolicyView(ReplacementPolicy):
+    """
+    Vista de la política global restringida a una VM.
+
+    La VM la usa como si fuera su propia política: traduce cada página a
+    la clave (vm, página) de la política del pool.
+    """
+
+    def __init__(self, policy: ReplacementPolicy, vm: 'VM'):
+        super().__init__()
+        self._policy = policy
+        self._vm = vm
+        self.name = f"{policy.name} (global)"
+        self.tracks_hits = policy.tracks_hits
+
+    def on_load(self, key: Hashable) -> None:
+        self._policy.on_load((self._vm, key))
+
+    def on_access(self, key: Hashable) -> None:
+        self._policy.on_access((self._vm, key))
+
+    def remove(self, key: Hashable) -> None:
+        self._policy.remove((self._vm, key))
+
+    def select_victim(self, incoming: Optional[Hashable] = None) -> Hashable:
+        raise RuntimeError("Con reemplazo global la víctima la elige el FramePool")
+
+    def snapshot(self) -> List[Hashable]:
+        vm = self._vm
+        return [page for owner, page in self._policy.snapshot() if owner is vm]
+
+    def __len__(self) -> int:
+        return len(self._vm.frame_to_page)
+
+
+class FramePool:
+    """
+    Gestor de marcos físicos compartido por varias VMs.
+
+    Con alcance local cada VM tiene una cuota (su physical_frames) y
+    desaloja con su propia política al alcanzarla. Si la RAM se agota antes
+    y la VM no tiene páginas propias, se le quita una página a la VM con el
+    resident set más grande. Con alcance global una sola política elige la
+    víctima entre todas las páginas residentes, sin cuotas.
+
+    Atributos:
+        memory: RAM física compartida
+        page_size: Bytes por marco
+        scope: 'local' o 'global'
+        policy: Política global (None con alcance local)
+        owners: Marco → (vm, página) que lo ocupa
+        sharers: Marco compartido → todos sus mapeos (vm, página)
+        vms: VMs registradas (vm → orden de registro)
+        evictions: Páginas desalojadas para hacer lugar
+        steals: Desalojos de páginas de una VM distinta a la que hizo el fault
+        writebacks_avoided: Write-backs evitados por las VMs ya dadas de baja
+    """
+
+    def __init__(self, memory: 'PhysicalMemory', scope: str = LOCAL,
+                 policy: Union[str, ReplacementPolicy] = 'fifo'):
+        """
+        Args:
+            memory: RAM física a repartir
+            scope: Alcance de reemplazo ('local' o 'global')
+            policy: Política del pool, usada solo con alcance global
+
+        Raises:
+            ValueError: Si el alcance es desconocido
+        """
+        if scope not in SCOPES:
+            raise ValueError(
+                f"Alcance de reemplazo desconocido: {scope!r}. Opciones: {', '.join(SCOPES)}"
+            )
+        self.memory = memory
+        self.page_size = memory.page_size
+        self.scope = scope
+        self.policy: Optional[ReplacementPolicy] = None
+        if scope == GLOBAL:
+            self.policy = make_policy(policy)
+            self.policy.attach(memory.num_frames, self._test_and_clear_referenced)
+        self.owners: Dict[int, Tuple['VM', int]] = {}
+        self.sharers: Dict[int, List[Tuple['VM', int]]] = {}
+        self.vms: Dict['VM', int] = {}
+        self._order = count()
+        # Heap de (-cota de RSS, orden de registro, vm), solo con alcance local.
+        # Cada VM tiene una entrada con cota >= su RSS real: se agrega una al
+        # crecer y _largest corrige las desactualizadas cuando llegan al tope
+        self._rss_heap: List[Tuple[int, int, 'VM']] = []
+        self._rss_bound: Dict['VM', int] = {}
+        self.evictions = 0
+        self.steals = 0
+        self.writebacks_avoided = 0
+
+    @staticmethod
+    def _test_and_clear_referenced(key: Tuple['VM', int]) -> bool:
+        """Bit de referencia de una clave (vm, página) para CLOCK global."""
+        vm, page_no = key
+        return vm._test_and_clear_referenced(page_no)
+
+    def register(self, vm: 'VM', policy: Union[str, ReplacementPolicy] = 'fifo') -> ReplacementPolicy:
+        """
+        Registra una VM y crea la política que debe usar.
+
+        Args:
+            vm: VM que asignará marcos de este pool
+            policy: Política propia de la VM (solo con alcance local)
+
+        Returns:
+            Política local de la VM, o una vista de la política global
+        """
+        self.vms[vm] = next(self._order)
+        if self.scope == GLOBAL:
+            return _GlobalPolicyView(self.policy, vm)
+        local = make_policy(policy)
+        local.attach(vm.physical_frames, vm._test_and_clear_referenced)
+        return local
+
+    def unregister(self, vm: 'VM') -> None:
+        """
+        Da de baja una VM que ya no tiene páginas residentes (ver VM.release).
+
+        Sus write-backs evitados se acumulan en el pool, para que la
+        estadística no se pierda al terminar el proceso.
+
+        Args:
+            vm: VM registrada
+        """
+        del self.vms[vm]
+        self._rss_bound.pop(vm, None)
+        self.writebacks_avoided += vm.writebacks_avoided
+
+    def allocate(self, vm: 'VM', page_no: int) -> int:
+        """
+        Obtiene un marco para una página de una VM, desalojando si hace falta.
+
+        Args:
+            vm: VM que sufrió el page fault
+            page_no: Página que se va a cargar
+
+        Returns:
+            Número de marco (sin limpiar; lo llena la VM)
+
+        Raises:
+            RuntimeError: Si no hay ninguna página que desalojar
+        """
+        memory = self.memory
+        tracer = vm.tracer
+        if self.scope == LOCAL:
+            if len(vm.frame_to_page) < vm.physical_frames:
+                frame_no = memory.allocate_frame()
+                if frame_no is not None:
+                    return frame_no
+                owner = vm if vm.frame_to_page else self._largest()
+            else:
+                owner = vm
+            if tracer.events:
+                tracer.emit('vm.ram_full', policy=owner.policy.name)
+            victim = owner.policy.select_victim(page_no if owner is vm else None)
+        else:
+            frame_no = memory.allocate_frame()
+            if frame_no is not None:
+                return frame_no
+            if tracer.events:
+                tracer.emit('vm.ram_full', policy=self.policy.name)
+            owner, victim = self.policy.select_victim((vm, page_no))
+        if tracer.events:
+            tracer.emit('vm.victim', page=victim)
+
+        owner._evict(victim, on_fault=True)
+        self.evictions += 1
+        if owner is not vm:
+            self.steals += 1
+
+        frame_no = memory.allocate_frame()
+        if frame_no is None:
+            raise RuntimeError("Error al reasignar marco después de desalojo")
+        return frame_no
+
+    def reserve(self, vm: 'VM', page_no: int) -> None:
+        """
+        Hace lugar en la cuota de una VM para mapear un marco ya ocupado
+        (ej: una página de un segmento compartido que otro proceso cargó).
+
+        Con alcance global no hay cuotas y no hace nada.
+
+        Args:
+            vm: VM que sufrió el page fault
+            page_no: Página que se va a mapear
+        """
+        if self.scope != LOCAL or len(vm.frame_to_page) < vm.physical_frames:
+            return
+        tracer = vm.tracer
+        if tracer.events:
+            tracer.emit('vm.ram_full', policy=vm.policy.name)
+        victim = vm.policy.select_victim(page_no)
+        if tracer.events:
+            tracer.emit('vm.victim', page=victim)
+        vm._evict(victim, on_fault=True)
+        self.evictions += 1
+
+    def _largest(self) -> 'VM':
+        """
+        VM con el resident set más grande (víctima de un robo de marcos).
+
+        Empates: la registrada primero. Las entradas del heap que llegan al
+        tope con una cota mayor al RSS real se corrigen y se reintenta.
+        """
+        heap, vms = self._rss_heap, self.vms
+        while heap:
+            neg_bound, order, vm = heap[0]
+            if vms.get(vm) != order:
+                heapq.heappop(heap)         # VM dada de baja
+                continue
+            rss = len(vm.frame_to_page)
+            if rss == -neg_bound:
+                if not rss:
+                    break
+                return vm
+            heapq.heapreplace(heap, (-rss, order, vm))
+            self._rss_bound[vm] = rss
+        raise RuntimeError("No hay páginas para desalojar")
+
+    def _grow(self, vm: 'VM') -> None:
+        """Mantiene la cota de RSS de una VM que suma un mapeo (alcance local)."""
+        # +1: algunos mapeos se registran antes de agregarse a frame_to_page
+        bound = len(vm.frame_to_page) + 1
+        if bound <= self._rss_bound.get(vm, 0):
+            return
+        heap = self._rss_heap
+        if len(heap) > 2 * len(self.vms) + 64:
+            # Compactar: una entrada por VM, sin las de VMs dadas de baja
+            self._rss_bound = {v: len(v.frame_to_page) + 1 for v in self.vms}
+            heap[:] = [(-b, self.vms[v], v) for v, b in self._rss_bound.items()]
+            heapq.heapify(heap)
+            if bound <= self._rss_bound[vm]:
+                return
+        self._rss_bound[vm] = bound
+        heapq.heappush(heap, (-bound, self.vms[vm], vm))
+
+    def map(self, frame_no: int, vm: 'VM', page_no: int) -> None:
+        """Registra que un marco quedó ocupado por una página de una VM."""
+        self.owners[frame_no] = (vm, page_no)
+        if self.scope == LOCAL:
+            self._grow(vm)
+
+    def share(self, frame_no: int, vm: 'VM', page_no: int) -> None:
+        """Agrega un mapeo más de un marco ocupado (ej: el hijo de un fork)."""
+        mappings = self.sharers.get(frame_no)
+        if mappings is None:
+            mappings = self.sharers[frame_no] = [self.owners[frame_no]]
+        mappings.append((vm, page_no))
+        if self.scope == LOCAL:
+            self._grow(vm)
+
+    def refcount(self, frame_no: int) -> int:
+        """Número de mapeos (vm, página) de un marco ocupado."""
+        mappings = self.sharers.get(frame_no)
+        return len(mappings) if mappings is not None else 1
+
+    def mappings(self, frame_no: int) -> List[Tuple['VM', int]]:
+        """Copia de los mapeos (vm, página) de un marco ocupado."""
+        mappings = self.sharers.get(frame_no)
+        return list(mappings) if mappings is not None else [self.owners[frame_no]]
+
+    def unmap(self, frame_no: int, vm: 'VM', page_no: int) -> None:
+        """
+        Quita un mapeo de un marco; lo libera si era el último.
+
+        Args:
+            frame_no: Marco ocupado
+            vm, page_no: Mapeo a quitar
+        """
+        mappings = self.sharers.get(frame_no)
+        if mappings is None:
+            self.release(frame_no)
+            return
+        mappings.remove((vm, page_no))
+        if len(mappings) == 1:
+            del self.sharers[frame_no]
+        self.owners[frame_no] = mappings[0]
+
+    def release(self, frame_no: int) -> None:
+        """Devuelve un marco a la RAM libre, junto con todos sus mapeos."""
+        self.sharers.pop(frame_no, None)
+        del self.owners[frame_no]
+        self.memory.free_frame(frame_no)
+
+    def resident_sets(self) -> Dict['VM', int]:
+        """
+        Resident set de cada VM registrada.
+
+        Returns:
+            Diccionario VM → páginas residentes
+        """
+        return {vm: len(vm.frame_to_page) for vm in self.vms}
+
+    def get_stats(self) -> Dict[str, Union[int, str]]:
+        """
+        Obtiene estadísticas del pool.
+
+        Returns:
+            Diccionario con marcos totales/libres/usados, alcance,
+            desalojos, robos, marcos compartidos y VMs registradas
+        """
+        free = len(self.memory.free_frames)
+        return {
+            'frames': self.memory.num_frames,
+            'free_frames': free,
+            'used_frames': self.memory.num_frames - free,
+            'scope': self.scope,
+            'policy': self.policy.name if self.policy is not None else None,
+            'evictions': self.evictions,
+            'steals': self.steals,
+            'shared_frames': len(self.sharers),
+            'vms': len(self.vms),
+        }
+
+    def __repr__(self) -> str:
+        free = len(self.memory.free_frames)
+        return (
+            f"FramePool(scope={self.scope}, frames={self.memory.num_frames}, "
+            f"free={free}, vms={len(self.vms)})"
+        )
@@ -0,0 +1,435 @@
+"""
+Tablas de Páginas Alternativas
+VOS (Virtual Operating System)
+
+Este módulo contiene representaciones de tabla de páginas adicionales a la
+tabla plana (`vos.core.vm.PageTable`), todas con la misma interfaz
+(get_entry, set_entry, lookup, items, empty_copy, get_stats):
+- MultiLevelPageTable: tabla jerárquica (radix) de 2, 3 o 4 niveles
+- CompactPageTable: estructura de arreglos (array de marcos + bits empacados)
+
+En la tabla jerárquica el número de página virtual se divide en un índice
+por nivel. Las tablas internas se crean solo al tocar por primera vez una
+región, así un espacio de direcciones disperso paga únicamente por las
+regiones usadas.
+
+La tabla compacta guarda el marco de cada página en un array('i') y los
+bits de control en un byte por página; get_entry devuelve una vista
+liviana (PTEView) que lee y escribe directamente en esos arreglos.
+"""
+
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from vos.core.vm import PTEntry, PageTable, VIRTUAL_PAGES
+
+
+class MultiLevelPageTable:
+    """
+    Tabla de páginas jerárquica con asignación perezosa de tablas internas.
+
+    Con L niveles y B bits de número de página, cada nivel indexa con
+    ~B/L bits (el nivel superior absorbe el resto). Cada traducción por
+    get_entry es un recorrido (walk) de L pasos.
+
+    Atributos:
+        virtual_pages: Número de páginas del espacio de direcciones
+        levels: Niveles de la tabla
+        level_bits: Bits de índice por nivel (del superior al hoja)
+        walks: Recorridos completos realizados
+        walk_steps: Accesos a tablas realizados (walks × niveles)
+        tables: Tablas (nodos) asignadas, incluyendo la raíz
+        table_slots: Total de ranuras asignadas en todas las tablas
+    """
+
+    def __init__(self, virtual_pages: int = VIRTUAL_PAGES, levels: int = 2):
+        """
+        Args:
+            virtual_pages: Número de páginas del espacio de direcciones
+            levels: Niveles de la tabla (2 a 4)
+
+        Raises:
+            ValueError: Si levels no está en [2, 4]
+        """
+        if not (2 <= levels <= 4):
+            raise ValueError(f"Niveles de tabla de páginas inválidos: {levels} (2 a 4)")
+        self.virtual_pages = virtual_pages
+        self.levels = levels
+
+        # Repartir los bits del número de página entre los niveles
+        total_bits = max(levels, (virtual_pages - 1).bit_length())
+        base, extra = divmod(total_bits, levels)
+        self.level_bits: List[int] = [base + extra] + [base] * (levels - 1)
+        self._shifts: List[int] = []
+        shift = total_bits
+        for bits in self.level_bits:
+            shift -= bits
+            self._shifts.append(shift)
+        self._masks: List[int] = [(1 << bits) - 1 for bits in self.level_bits]
+
+        self.tables = 1
+        self.table_slots = 1 << self.level_bits[0]
+        self._root: List[Optional[list]] = [None] * self.table_slots
+        self._count = 0
+
+        self.walks = 0
+        self.walk_steps = 0
+
+    def _check(self, page_no: int) -> None:
+        """Valida que la página esté dentro del espacio de direcciones."""
+        if not (0 <= page_no < self.virtual_pages):
+            raise ValueError(f"Página {page_no} fuera de rango [0, {self.virtual_pages-1}]")
+
+    def _leaf(self, page_no: int, allocate: bool) -> Optional[list]:
+        """
+        Recorre los niveles internos hasta la tabla hoja de una página.
+
+        Args:
+            page_no: Número de página virtual
+            allocate: Si True, crea las tablas que falten
+
+        Returns:
+            Tabla hoja, o None si falta alguna y allocate es False
+        """
+        node = self._root
+        for level in range(self.levels - 1):
+            idx = (page_no >> self._shifts[level]) & self._masks[level]
+            child = node[idx]
+            if child is None:
+                if not allocate:
+                    return None
+                size = 1 << self.level_bits[level + 1]
+                child = node[idx] = [None] * size
+                self.tables += 1
+                self.table_slots += size
+            node = child
+        return node
+
+    def get_entry(self, page_no: int) -> PTEntry:
+        """
+        Obtiene (creando si hace falta) la entrada de una página.
+
+        Cuenta como un recorrido completo de la tabla.
+
+        Args:
+            page_no: Número de página virtual
+
+        Returns:
+            Entrada PTEntry correspondiente
+
+        Raises:
+            ValueError: Si page_no está fuera de rango
+        """
+        self._check(page_no)
+        self.walks += 1
+        self.walk_steps += self.levels
+        leaf = self._leaf(page_no, allocate=True)
+        idx = page_no & self._masks[-1]
+        entry = leaf[idx]
+        if entry is None:
+            entry = leaf[idx] = PTEntry()
+            self._count += 1
+        return entry
+
+    def set_entry(self, page_no: int, entry: PTEntry) -> None:
+        """
+        Reemplaza la entrada de una página.
+
+        Args:
+            page_no: Número de página virtual
+            entry: Nueva entrada PTEntry
+
+        Raises:
+            ValueError: Si page_no está fuera de rango
+        """
+        self._check(page_no)
+        leaf = self._leaf(page_no, allocate=True)
+        idx = page_no & self._masks[-1]
+        if leaf[idx] is None:
+            self._count += 1
+        leaf[idx] = entry
+
+    def lookup(self, page_no: int) -> Optional[PTEntry]:
+        """
+        Obtiene la entrada de una página sin crear tablas ni contar el recorrido.
+
+        Args:
+            page_no: Número de página virtual
+
+        Returns:
+            Entrada PTEntry, o None si la página nunca fue tocada
+        """
+        if not (0 <= page_no < self.virtual_pages):
+            return None
+        leaf = self._leaf(page_no, allocate=False)
+        return None if leaf is None else leaf[page_no & self._masks[-1]]
+
+    def items(self) -> Iterator[Tuple[int, PTEntry]]:
+        """Itera (página, entrada) sobre las entradas materializadas, en orden."""
+        def walk(node: list, level: int, prefix: int) -> Iterator[Tuple[int, PTEntry]]:
+            bits = self.level_bits[level]
+            for idx, child in enumerate(node):
+                if child is None:
+                    continue
+                page = (prefix << bits) | idx
+                if level == self.levels - 1:
+                    yield page, child
+                else:
+                    yield from walk(child, level + 1, page)
+        return walk(self._root, 0, 0)
+
+    def empty_copy(self) -> 'MultiLevelPageTable':
+        """Crea una tabla vacía con la misma forma (ej: para un fork)."""
+        return MultiLevelPageTable(self.virtual_pages, self.levels)
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Obtiene estadísticas de la tabla.
+
+        Returns:
+            Diccionario con niveles, recorridos, pasos y memoria de tablas
+        """
+        return {
+            'pt_levels': self.levels,
+            'pt_walks': self.walks,
+            'pt_walk_steps': self.walk_steps,
+            'pt_entries': self._count,
+            'pt_tables': self.tables,
+            'pt_table_slots': self.table_slots,
+        }
+
+    def __len__(self) -> int:
+        """Número de entradas materializadas."""
+        return self._count
+
+    def __repr__(self) -> str:
+        return (
+            f"MultiLevelPageTable(levels={self.levels}, bits={self.level_bits}, "
+            f"tables={self.tables}, entries={self._count})"
+        )
+
+
+# Bits de control empacados de CompactPageTable (un byte por página)
+PRESENT_BIT = 0x01
+DIRTY_BIT = 0x02
+REFERENCED_BIT = 0x04
+COW_BIT = 0x08
+
+
+def _bit_counter(mask: int) -> bytes:
+    """Tabla de traducción byte → 1 si tiene algún bit de mask, si no 0."""
+    return bytes(1 if value & mask else 0 for value in range(256))
+
+
+class PTEView:
+    """
+    Vista liviana de una entrada de CompactPageTable.
+    
+    Expone los mismos atributos que PTEntry (frame, present, dirty,
+    referenced, cow), pero los lee y escribe en los arreglos de la tabla. No
+    tiene __dict__: solo guarda la tabla y el número de página.
+    """
+    __slots__ = ('_table', '_page')
+
+    def __init__(self, table: 'CompactPageTable', page_no: int):
+        self._table = table
+        self._page = page_no
+
+    @property
+    def frame(self) -> Optional[int]:
+        frame_no = self._table._frames[self._page]
+        return None if frame_no < 0 else frame_no
+
+    @frame.setter
+    def frame(self, value: Optional[int]) -> None:
+        self._table._frames[self._page] = -1 if value is None else value
+
+    def _get(self, bit: int) -> bool:
+        return bool(self._table._flags[self._page] & bit)
+
+    def _set(self, bit: int, value: bool) -> None:
+        flags = self._table._flags
+        if value:
+            flags[self._page] |= bit
+        else:
+            flags[self._page] &= ~bit
+
+    present = property(lambda self: self._get(PRESENT_BIT),
+                       lambda self, value: self._set(PRESENT_BIT, value))
+    dirty = property(lambda self: self._get(DIRTY_BIT),
+                     lambda self, value: self._set(DIRTY_BIT, value))
+    referenced = property(lambda self: self._get(REFERENCED_BIT),
+                          lambda self, value: self._set(REFERENCED_BIT, value))
+    cow = property(lambda self: self._get(COW_BIT),
+                   lambda self, value: self._set(COW_BIT, value))
+
+    def __repr__(self) -> str:
+        return (
+            f"PTEView(page={self._page}, frame={self.frame}, present={self.present}, "
+            f"dirty={self.dirty}, referenced={self.referenced}, cow={self.cow})"
+        )
+
+
+class CompactPageTable:
+    """
+    Tabla de páginas como estructura de arreglos.
+    
+    Por página guarda 4 bytes de marco (array('i'), -1 = sin marco) y 1
+    byte de bits de control, frente a los cientos de bytes de un PTEntry
+    en un diccionario. Los conteos de páginas presentes/sucias se hacen
+    con operaciones de bytes en C, sin recorrer entradas en Python.
+    
+    Atributos:
+        virtual_pages: Número de páginas del espacio de direcciones
+        levels: Niveles de la tabla (1: indexación directa)
+        walks: Recorridos realizados por get_entry
+    """
+
+    _PRESENT_COUNTER = _bit_counter(PRESENT_BIT)
+    _DIRTY_COUNTER = _bit_counter(DIRTY_BIT)
+
+    def __init__(self, virtual_pages: int = VIRTUAL_PAGES):
+        """
+        Args:
+            virtual_pages: Número de páginas del espacio de direcciones
+        """
+        self.virtual_pages = virtual_pages
+        self.levels = 1
+        self.walks = 0
+        self._frames = array('i', [-1]) * virtual_pages
+        self._flags = bytearray(virtual_pages)
+
+    def _check(self, page_no: int) -> None:
+        """Valida que la página esté dentro del espacio de direcciones."""
+        if not (0 <= page_no < self.virtual_pages):
+            raise ValueError(f"Página {page_no} fuera de rango [0, {self.virtual_pages-1}]")
+
+    def get_entry(self, page_no: int) -> PTEView:
+        """
+        Obtiene una vista de la entrada de una página.
+        
+        Args:
+            page_no: Número de página virtual
+            
+        Returns:
+            PTEView sobre la entrada
+            
+        Raises:
+            ValueError: Si page_no está fuera de rango
+        """
+        self._check(page_no)
+        self.walks += 1
+        return PTEView(self, page_no)
+
+    def set_entry(self, page_no: int, entry: PTEntry) -> None:
+        """
+        Copia los campos de una entrada en los arreglos de la tabla.
+        
+        Args:
+            page_no: Número de página virtual
+            entry: Entrada (PTEntry o PTEView) con los valores a guardar
+            
+        Raises:
+            ValueError: Si page_no está fuera de rango
+        """
+        self._check(page_no)
+        self._frames[page_no] = -1 if entry.frame is None else entry.frame
+        self._flags[page_no] = (
+            (PRESENT_BIT if entry.present else 0) |
+            (DIRTY_BIT if entry.dirty else 0) |
+            (REFERENCED_BIT if entry.referenced else 0) |
+            (COW_BIT if entry.cow else 0)
+        )
+
+    def lookup(self, page_no: int) -> Optional[PTEView]:
+        """
+        Obtiene una vista de la entrada sin contar el recorrido.
+        
+        Args:
+            page_no: Número de página virtual
+            
+        Returns:
+            PTEView, o None si page_no está fuera de rango
+        """
+        if not (0 <= page_no < self.virtual_pages):
+            return None
+        return PTEView(self, page_no)
+
+    def items(self) -> Iterator[Tuple[int, PTEView]]:
+        """Itera (página, vista) sobre páginas con algún bit o marco asignado."""
+        frames = self._frames
+        for page_no, flags in enumerate(self._flags):
+            if flags or frames[page_no] >= 0:
+                yield page_no, PTEView(self, page_no)
+
+    def empty_copy(self) -> 'CompactPageTable':
+        """Crea una tabla vacía con la misma forma (ej: para un fork)."""
+        return CompactPageTable(self.virtual_pages)
+
+    def count_present(self) -> int:
+        """Número de páginas presentes en RAM (conteo en C)."""
+        return self._flags.translate(self._PRESENT_COUNTER).count(1)
+
+    def count_dirty(self) -> int:
+        """Número de páginas sucias (conteo en C)."""
+        return self._flags.translate(self._DIRTY_COUNTER).count(1)
+
+    def nbytes(self) -> int:
+        """Bytes ocupados por los arreglos de la tabla."""
+        return len(self._frames) * self._frames.itemsize + len(self._flags)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtiene estadísticas de la tabla.
+        
+        Returns:
+            Diccionario con recorridos, páginas presentes/sucias y memoria usada
+        """
+        return {
+            'pt_levels': self.levels,
+            'pt_walks': self.walks,
+            'pt_walk_steps': self.walks,
+            'pt_present': self.count_present(),
+            'pt_dirty': self.count_dirty(),
+            'pt_bytes': self.nbytes(),
+        }
+
+    def __len__(self) -> int:
+        """Número de páginas cubiertas por la tabla."""
+        return self.virtual_pages
+
+    def __repr__(self) -> str:
+        return f"CompactPageTable(pages={self.virtual_pages}, bytes={self.nbytes()})"
+
+
+# Registro de representaciones de tabla de páginas por nombre
+PAGE_TABLES = {
+    'flat': lambda virtual_pages: PageTable(virtual_pages),
+    'two-level': lambda virtual_pages: MultiLevelPageTable(virtual_pages, levels=2),
+    'three-level': lambda virtual_pages: MultiLevelPageTable(virtual_pages, levels=3),
+    'four-level': lambda virtual_pages: MultiLevelPageTable(virtual_pages, levels=4),
+    'compact': lambda virtual_pages: CompactPageTable(virtual_pages),
+}
+
+
+def make_page_table(kind: str, virtual_pages: int = VIRTUAL_PAGES):
+    """
+    Construye una tabla de páginas por nombre.
+
+    Args:
+        kind: 'flat', 'two-level', 'three-level', 'four-level' o 'compact'
+        virtual_pages: Número de páginas del espacio de direcciones
+
+    Returns:
+        Tabla de páginas vacía
+
+    Raises:
+        ValueError: Si el nombre no está registrado
+    """
+    try:
+        factory = PAGE_TABLES[kind]
+    except KeyError:
+        raise ValueError(
+            f"Tabla de páginas desconocida: {kind!r}. Opciones: {sorted(PAGE_TABLES)}"
+        ) from None
+    return factory(virtual_pages)
@@ -0,0 +1,174 @@
+"""
+Prefetching (Read-Ahead) de Páginas
+VOS (Virtual Operating System)
+
+Este módulo implementa un prefetcher adaptativo por VM:
+- Detecta patrones secuenciales y con stride en la secuencia de page faults
+- Ante un fault de un patrón confirmado, carga especulativamente las
+  siguientes N páginas del patrón (la ventana)
+- La ventana crece o se achica según la tasa de acierto de lo precargado
+- Estadísticas de prefetches útiles (luego accedidos) y desperdiciados
+  (desalojados sin ser accedidos)
+
+Un patrón se confirma cuando dos faults consecutivos están separados por
+el mismo stride. Mientras el acceso sigue el patrón, las páginas de la
+ventana ya están en RAM y el siguiente fault cae justo después de ella:
+ese fault continúa el stream sin tener que volver a confirmarlo.
+"""
+
+from typing import Dict, List, Optional, Set, Union
+
+
+class Prefetcher:
+    """
+    Prefetcher de páginas con ventana adaptativa.
+
+    La VM le avisa cada page fault (on_fault), le informa qué páginas
+    precargó (issue) y qué pasó con ellas: accedidas (on_useful) o
+    desalojadas sin uso (on_wasted).
+
+    Atributos:
+        window: Páginas a precargar en el próximo fault del stream
+        min_window, max_window: Límites de la ventana
+        stride: Stride del stream confirmado (0 = sin stream)
+        pending: Páginas precargadas que aún no fueron accedidas
+        issued: Páginas precargadas
+        useful: Precargadas que luego fueron accedidas
+        wasted: Precargadas desalojadas sin ser accedidas
+    """
+
+    def __init__(self, max_window: int = 16, initial_window: int = 2, min_window: int = 1,
+                 grow_threshold: float = 0.75, shrink_threshold: float = 0.5):
+        """
+        Args:
+            max_window: Ventana máxima (páginas por fault)
+            initial_window: Ventana inicial
+            min_window: Ventana mínima
+            grow_threshold: Tasa de acierto a partir de la cual se duplica
+            shrink_threshold: Tasa de acierto por debajo de la cual se reduce
+                              a la mitad
+
+        Raises:
+            ValueError: Si los límites de la ventana no son consistentes
+        """
+        if not 1 <= min_window <= initial_window <= max_window:
+            raise ValueError(
+                f"Ventana de prefetch inválida: min={min_window}, "
+                f"inicial={initial_window}, max={max_window}"
+            )
+        self.min_window = min_window
+        self.max_window = max_window
+        self.window = initial_window
+        self.grow_threshold = grow_threshold
+        self.shrink_threshold = shrink_threshold
+
+        # Detección del patrón
+        self.stride = 0
+        self._last_fault: Optional[int] = None
+        self._candidate = 0                    # Distancia entre los dos últimos faults
+        self._expected: Optional[int] = None   # Próximo fault si el stream sigue
+
+        self.pending: Set[int] = set()
+        self.issued = 0
+        self.useful = 0
+        self.wasted = 0
+        # Aciertos/desperdicios desde la última adaptación de la ventana
+        self._recent_useful = 0
+        self._recent_wasted = 0
+
+    def attach(self, capacity: int) -> None:
+        """
+        Ajusta la ventana a la RAM de la VM (a lo sumo la mitad de sus marcos,
+        para no desalojar con la precarga lo que se acaba de cargar).
+
+        Args:
+            capacity: Marcos disponibles para la VM
+        """
+        self.max_window = max(1, min(self.max_window, capacity // 2))
+        self.min_window = min(self.min_window, self.max_window)
+        self.window = min(self.window, self.max_window)
+
+    def on_fault(self, page_no: int) -> List[int]:
+        """
+        Registra un page fault y decide qué páginas precargar.
+
+        Args:
+            page_no: Página que provocó el fault
+
+        Returns:
+            Páginas a precargar, en orden (pueden caer fuera del espacio de
+            direcciones: la VM las filtra)
+        """
+        if not (self.stride and page_no == self._expected):
+            # Si no continúa el stream justo después de la ventana anterior,
+            # hay que (re)confirmar un stride con los dos últimos faults
+            delta = page_no - self._last_fault if self._last_fault is not None else 0
+            self._last_fault = page_no
+            if delta == 0 or delta != self._candidate:
+                self._candidate = delta
+                self.stride = 0
+                return []
+            self.stride = delta
+        self._last_fault = page_no
+        self._adapt()
+        stride, window = self.stride, self.window
+        self._expected = page_no + stride * (window + 1)
+        return [page_no + stride * k for k in range(1, window + 1)]
+
+    def _adapt(self) -> None:
+        """Ajusta la ventana según la tasa de acierto reciente."""
+        total = self._recent_useful + self._recent_wasted
+        if not total:
+            return
+        rate = self._recent_useful / total
+        if rate >= self.grow_threshold:
+            self.window = min(self.max_window, self.window * 2)
+        elif rate < self.shrink_threshold:
+            self.window = max(self.min_window, self.window // 2)
+        self._recent_useful = self._recent_wasted = 0
+
+    def issue(self, page_no: int) -> None:
+        """Registra que una página fue precargada."""
+        self.pending.add(page_no)
+        self.issued += 1
+
+    def on_useful(self, page_no: int) -> None:
+        """Registra el primer acceso a una página precargada."""
+        self.pending.discard(page_no)
+        self.useful += 1
+        self._recent_useful += 1
+
+    def on_wasted(self, page_no: int) -> None:
+        """Registra que una página precargada salió de RAM sin ser accedida."""
+        self.pending.discard(page_no)
+        self.wasted += 1
+        self._recent_wasted += 1
+
+    @property
+    def accuracy(self) -> float:
+        """Fracción de prefetches resueltos que fueron útiles."""
+        resolved = self.useful + self.wasted
+        return self.useful / resolved if resolved else 0.0
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Obtiene estadísticas del prefetcher.
+
+        Returns:
+            Diccionario con páginas precargadas, útiles, desperdiciadas,
+            pendientes, ventana actual y precisión
+        """
+        return {
+            'prefetch_issued': self.issued,
+            'prefetch_useful': self.useful,
+            'prefetch_wasted': self.wasted,
+            'prefetch_pending': len(self.pending),
+            'prefetch_window': self.window,
+            'prefetch_accuracy': self.accuracy,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"Prefetcher(window={self.window}, stride={self.stride}, "
+            f"issued={self.issued}, useful={self.useful}, wasted={self.wasted})"
+        )
@@ -5,11 +5,12 @@ VOS (Virtual Operating System) - Lab 2
 Este módulo define las estructuras fundamentales para la gestión de procesos:
 - Enum de estados de proceso
 - Clase PCB (Process Control Block)
+- ZombieRecord: registro compacto de un proceso terminado sin recoger
 """
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Optional
+from typing import Callable, FrozenSet, NamedTuple, Optional
 from vos.core.vm import VM
 
 
@@ -47,7 +48,10 @@ class PCB:
     Campos opcionales:
         name: Nombre descriptivo del proceso
         cpu_time: Tiempo total de CPU usado por el proceso (en time slices)
-        priority: Prioridad del proceso (no usado en Round-Robin básico)
+        priority: Prioridad del proceso (menor valor = mayor prioridad; la usa
+                  PriorityScheduler, no Round-Robin ni MLFQ)
+        affinity: CPUs en las que puede ejecutar el proceso (None = cualquiera)
+        cpu: CPU en la que ejecutó por última vez (None = aún no ejecutó)
         
     Propósito de cada campo:
         - pid: Identificación única, usado para debugging y gestión
@@ -64,6 +68,8 @@ class PCB:
     name: str = ""
     cpu_time: int = 0
     priority: int = 0
+    affinity: Optional[FrozenSet[int]] = None
+    cpu: Optional[int] = None
     
     def __post_init__(self):
         """Inicialización adicional después de crear el PCB."""
@@ -75,4 +81,31 @@ class PCB:
         return (
             f"PCB(pid={self.pid}, name='{self.name}', "
             f"state={self.state.value}, cpu_time={self.cpu_time})"
-        )
\ No newline at end of file
+        )
+
+
+class ZombieRecord(NamedTuple):
+    """
+    Proceso terminado que aún no fue recogido con Kernel.wait (un "zombie").
+    
+    Al terminar, el Kernel libera la VM, el programa y el estado del
+    proceso; solo conserva estos datos de su salida hasta que alguien los
+    recoge. Expone state (siempre TERMINATED) como un PCB, así ps y la
+    tabla de procesos lo muestran igual.
+    
+    Campos:
+        pid: Identificador del proceso
+        name: Nombre descriptivo
+        cpu_time: Time slices ejecutados
+        priority: Prioridad que tenía
+        exit_tick: Tick del Kernel en que terminó
+        error: Mensaje de la excepción que lo terminó (None = salida normal)
+    """
+    pid: int
+    name: str
+    cpu_time: int
+    priority: int
+    exit_tick: int
+    error: Optional[str] = None
+    
+    state = State.TERMINATED
@@ -0,0 +1,197 @@
+"""
+Daemon de Reclamo de Marcos (estilo kswapd)
+VOS (Virtual Operating System)
+
+Este módulo implementa un reclamador en segundo plano que el Kernel
+ejecuta entre time slices, fuera de la ruta crítica de los accesos:
+- Limpieza: escribe al backing store las páginas sucias más próximas a
+  ser víctimas, así el desalojo en un page fault no necesita write-back.
+  Cada pasada examina a lo sumo clean_batch candidatas en total (con
+  alcance local, recorriendo las VMs con un cursor rotativo), así su costo
+  no crece con la cantidad de procesos; y solo limpia con la memoria
+  libre por debajo de la marca alta o cada clean_interval pasadas
+- Reclamo: si los marcos libres de la RAM caen por debajo de la marca
+  baja, desaloja páginas frías hasta llegar a la marca alta, así los
+  faults encuentran un marco libre sin desalojar
+
+Las escrituras del daemon son asíncronas (no las paga ningún acceso) y se
+cuentan aparte de los write-backs síncronos de las VMs. Cada VM cuenta en
+writebacks_avoided los desalojos hechos en un page fault cuya víctima el
+daemon ya había limpiado y siguió limpia; los desalojos del propio daemon
+y las páginas que salen de RAM al adjuntar o desadjuntar un segmento no
+cuentan.
+
+Con alcance local, una VM que alcanzó su cuota sigue desalojando sus
+propias páginas en el fault: ahí el beneficio es que la víctima ya está
+limpia. Las marcas de agua se aplican a la RAM compartida completa.
+"""
+
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from vos.core.frames import GLOBAL
+
+if TYPE_CHECKING:
+    from vos.core.frames import FramePool
+    from vos.core.vm import VM
+
+
+class ReclaimDaemon:
+    """
+    Reclamador de marcos con marcas de agua de memoria libre.
+
+    Atributos:
+        pool: Pool de marcos que vigila
+        low_watermark: Marcos libres por debajo de los cuales se reclama
+        high_watermark: Marcos libres a los que se llega al reclamar
+        clean_batch: Páginas candidatas examinadas en cada pasada de limpieza
+        clean_interval: Pasadas entre limpiezas con memoria libre de sobra
+        runs: Pasadas ejecutadas
+        wakeups: Pasadas en las que se reclamaron marcos
+        reclaimed: Marcos liberados
+        writebacks: Write-backs asíncronos (limpieza y reclamo)
+    """
+
+    def __init__(self, pool: 'FramePool', low_watermark: int, high_watermark: Optional[int] = None,
+                 clean_batch: int = 8, clean_interval: int = 8):
+        """
+        Args:
+            pool: Pool de marcos a vigilar
+            low_watermark: Marca baja de marcos libres
+            high_watermark: Marca alta (None = el doble de la baja)
+            clean_batch: Páginas candidatas a víctima examinadas por pasada
+                         (en total, no por VM)
+            clean_interval: Con al menos high_watermark marcos libres, se
+                            limpia solo una de cada clean_interval pasadas
+
+        Raises:
+            ValueError: Si las marcas no cumplen 0 <= baja <= alta <= marcos,
+                        o clean_batch < 0 o clean_interval < 1
+        """
+        if high_watermark is None:
+            high_watermark = min(2 * low_watermark, pool.memory.num_frames)
+        if not 0 <= low_watermark <= high_watermark <= pool.memory.num_frames:
+            raise ValueError(
+                f"Marcas de agua inválidas: baja={low_watermark}, alta={high_watermark}, "
+                f"marcos={pool.memory.num_frames}"
+            )
+        if clean_batch < 0:
+            raise ValueError(f"clean_batch inválido: {clean_batch}")
+        if clean_interval < 1:
+            raise ValueError(f"clean_interval inválido: {clean_interval}")
+        self.pool = pool
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.clean_batch = clean_batch
+        self.clean_interval = clean_interval
+        self._cursor: Iterator['VM'] = iter(())  # Próximas VMs a limpiar (alcance local)
+        self.runs = 0
+        self.wakeups = 0
+        self.reclaimed = 0
+        self.writebacks = 0
+
+    def run(self) -> Tuple[int, int]:
+        """
+        Ejecuta una pasada: reclamo (si hace falta) y luego limpieza.
+
+        Returns:
+            Tupla (marcos reclamados, páginas limpiadas) en esta pasada
+        """
+        self.runs += 1
+        reclaimed = cleaned = 0
+        free = len(self.pool.memory.free_frames)
+        if free < self.low_watermark:
+            reclaimed = self._reclaim()
+            self.wakeups += 1
+        if free < self.high_watermark or not self.runs % self.clean_interval:
+            cleaned = self._clean()
+        return reclaimed, cleaned
+
+    def _reclaim(self) -> int:
+        """Desaloja páginas frías hasta alcanzar la marca alta."""
+        pool = self.pool
+        free_frames = pool.memory.free_frames
+        reclaimed = 0
+        while len(free_frames) < self.high_watermark and pool.owners:
+            if pool.scope == GLOBAL:
+                owner, victim = pool.policy.select_victim()
+            else:
+                owner = pool._largest()
+                victim = owner.policy.select_victim()
+            # Write-back asíncrono antes de desalojar: el desalojo ya es limpio
+            if owner.clean_page(victim, mark=False):
+                self.writebacks += 1
+            owner._evict(victim)
+            reclaimed += 1
+        self.reclaimed += reclaimed
+        return reclaimed
+
+    def _clean(self) -> int:
+        """Limpia las páginas sucias más próximas a ser víctimas."""
+        if not self.clean_batch:
+            return 0
+        cleaned = 0
+        for vm, page_no in self._candidates():
+            if vm.clean_page(page_no):
+                cleaned += 1
+        self.writebacks += cleaned
+        return cleaned
+
+    def _candidates(self) -> List[Tuple['VM', int]]:
+        """
+        Próximas víctimas (vm, página), a lo sumo clean_batch.
+
+        Con alcance local se toman de las VMs siguientes al cursor, que
+        recorre el pool en ronda entre pasadas; se visitan a lo sumo
+        clean_batch VMs, tengan o no páginas.
+        """
+        pool = self.pool
+        batch = self.clean_batch
+        if pool.scope == GLOBAL:
+            return pool.policy.peek(batch)
+        candidates: List[Tuple['VM', int]] = []
+        vms = pool.vms
+        for _ in range(batch):
+            vm = next(self._cursor, None)
+            if vm is None:
+                # Fin de la ronda: la siguiente recorre las VMs registradas ahora
+                if not vms:
+                    break
+                self._cursor = iter(list(vms))
+                vm = next(self._cursor)
+            if vm not in vms:
+                continue                     # Dada de baja durante la ronda
+            candidates.extend((vm, page_no) for page_no in vm.policy.peek(batch - len(candidates)))
+            if len(candidates) >= batch:
+                break
+        return candidates
+
+    @property
+    def writebacks_avoided(self) -> int:
+        """
+        Desalojos en faults que no necesitaron write-back gracias a la
+        limpieza, incluidos los de procesos ya terminados.
+        """
+        pool = self.pool
+        return pool.writebacks_avoided + sum(vm.writebacks_avoided for vm in pool.vms)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtiene estadísticas del daemon.
+
+        Returns:
+            Diccionario con pasadas, despertares, marcos reclamados,
+            write-backs asíncronos y write-backs síncronos evitados
+        """
+        return {
+            'reclaim_runs': self.runs,
+            'reclaim_wakeups': self.wakeups,
+            'reclaimed_frames': self.reclaimed,
+            'async_writebacks': self.writebacks,
+            'writebacks_avoided': self.writebacks_avoided,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"ReclaimDaemon(low={self.low_watermark}, high={self.high_watermark}, "
+            f"reclaimed={self.reclaimed}, writebacks={self.writebacks})"
+        )
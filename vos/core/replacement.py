@@ -0,0 +1,431 @@
+"""
+Políticas de Reemplazo de Páginas
+VOS (Virtual Operating System)
+
+Este módulo define la interfaz de políticas de reemplazo que usa la VM
+para elegir la página víctima cuando la RAM está llena, y las
+implementaciones incluidas:
+- FIFO: la página más antigua en RAM (OrderedDict, O(1))
+- LRU: la página usada hace más tiempo (OrderedDict, O(1))
+- CLOCK: segunda oportunidad usando el bit de referencia del PTEntry
+- LFU: la página menos usada (buckets por frecuencia, O(1))
+- ARC: Adaptive Replacement Cache (Megiddo & Modha)
+
+Las políticas trabajan con claves opacas (en la VM, números de página).
+La VM les notifica cada carga (`on_load`), cada hit (`on_access`, solo si
+`tracks_hits` es True) y cada salida de RAM que no sea un desalojo
+(`remove`). `select_victim` elige la víctima y deja de rastrearla.
+`peek(n)` da las n próximas víctimas sin recorrer todas las claves.
+"""
+
+from collections import OrderedDict
+from itertools import chain, islice
+from typing import Callable, Dict, Hashable, List, Optional, Type, Union
+
+
+class ReplacementPolicy:
+    """
+    Interfaz base de una política de reemplazo.
+
+    Atributos de clase:
+        name: Nombre legible de la política
+        tracks_hits: True si la política necesita ser notificada de cada hit.
+                     La VM omite la llamada a on_access cuando es False.
+    """
+    name = "BASE"
+    tracks_hits = False
+
+    def __init__(self):
+        """Inicializa la política sin capacidad ni callback asociados."""
+        self.capacity = 0
+        self._referenced: Optional[Callable[[Hashable], bool]] = None
+
+    def attach(self, capacity: int,
+               referenced: Optional[Callable[[Hashable], bool]] = None) -> None:
+        """
+        Asocia la política a una memoria física concreta.
+
+        Args:
+            capacity: Número de marcos que gestiona la política
+            referenced: Callback test-and-clear del bit de referencia de una
+                        clave (retorna el bit y lo pone en 0). Solo lo usa CLOCK.
+        """
+        self.capacity = capacity
+        self._referenced = referenced
+
+    def on_load(self, key: Hashable) -> None:
+        """Notifica que la clave fue cargada en RAM (tras un page fault)."""
+        raise NotImplementedError
+
+    def on_access(self, key: Hashable) -> None:
+        """Notifica un hit sobre una clave residente."""
+
+    def remove(self, key: Hashable) -> None:
+        """Deja de rastrear una clave que salió de RAM sin ser víctima."""
+        raise NotImplementedError
+
+    def select_victim(self, incoming: Optional[Hashable] = None) -> Hashable:
+        """
+        Elige y retira la clave víctima.
+
+        Args:
+            incoming: Clave que provocó el reemplazo (la usa ARC)
+
+        Returns:
+            Clave a desalojar
+
+        Raises:
+            RuntimeError: Si no hay claves residentes
+        """
+        raise NotImplementedError
+
+    def snapshot(self) -> List[Hashable]:
+        """Claves residentes, de candidata a víctima más próxima a más lejana."""
+        raise NotImplementedError
+
+    def peek(self, n: int) -> List[Hashable]:
+        """
+        Las n próximas víctimas: los primeros n elementos de snapshot().
+
+        Las subclases recorren solo ese prefijo de su estructura.
+        """
+        return self.snapshot()[:n]
+
+    def __len__(self) -> int:
+        return len(self.snapshot())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(resident={len(self)})"
+
+
+class FIFOPolicy(ReplacementPolicy):
+    """
+    FIFO: desaloja la página que lleva más tiempo en RAM.
+
+    Un OrderedDict mantiene el orden de carga: carga, desalojo y remove
+    (cada COW, detach o liberación de una VM) son O(1).
+    """
+    name = "FIFO"
+
+    def __init__(self):
+        super().__init__()
+        self.queue: OrderedDict = OrderedDict()
+
+    def on_load(self, key: Hashable) -> None:
+        self.queue[key] = None  # Al final (más reciente)
+
+    def remove(self, key: Hashable) -> None:
+        del self.queue[key]
+
+    def select_victim(self, incoming: Optional[Hashable] = None) -> Hashable:
+        if not self.queue:
+            raise RuntimeError("No hay páginas para desalojar")
+        key, _ = self.queue.popitem(last=False)  # Frente (más antigua)
+        return key
+
+    def snapshot(self) -> List[Hashable]:
+        return list(self.queue)
+
+    def peek(self, n: int) -> List[Hashable]:
+        return list(islice(self.queue, n))
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+
+class LRUPolicy(ReplacementPolicy):
+    """
+    LRU verdadero: desaloja la página usada hace más tiempo.
+
+    Un OrderedDict mantiene el orden de uso; mover al final y sacar del
+    frente son O(1).
+    """
+    name = "LRU"
+    tracks_hits = True
+
+    def __init__(self):
+        super().__init__()
+        self.order: OrderedDict = OrderedDict()
+
+    def on_load(self, key: Hashable) -> None:
+        self.order[key] = None
+
+    def on_access(self, key: Hashable) -> None:
+        self.order.move_to_end(key)
+
+    def remove(self, key: Hashable) -> None:
+        del self.order[key]
+
+    def select_victim(self, incoming: Optional[Hashable] = None) -> Hashable:
+        if not self.order:
+            raise RuntimeError("No hay páginas para desalojar")
+        key, _ = self.order.popitem(last=False)
+        return key
+
+    def snapshot(self) -> List[Hashable]:
+        return list(self.order)
+
+    def peek(self, n: int) -> List[Hashable]:
+        return list(islice(self.order, n))
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+
+class ClockPolicy(ReplacementPolicy):
+    """
+    CLOCK (segunda oportunidad).
+
+    Las páginas residentes forman un anillo recorrido por una manecilla.
+    Si la página apuntada tiene el bit de referencia en 1, se limpia y se
+    avanza; la primera con bit en 0 es la víctima y su ranura la ocupa la
+    página entrante. El bit lo pone la VM en cada acceso, así que esta
+    política no necesita ser notificada de los hits.
+    """
+    name = "CLOCK"
+
+    def __init__(self):
+        super().__init__()
+        self.ring: List[Optional[Hashable]] = []
+        self.slots: Dict[Hashable, int] = {}
+        self.free_slots: List[int] = []
+        self.hand = 0
+
+    def on_load(self, key: Hashable) -> None:
+        if self.free_slots:
+            slot = self.free_slots.pop()
+            self.ring[slot] = key
+        else:
+            slot = len(self.ring)
+            self.ring.append(key)
+        self.slots[key] = slot
+
+    def remove(self, key: Hashable) -> None:
+        slot = self.slots.pop(key)
+        self.ring[slot] = None
+        self.free_slots.append(slot)
+
+    def select_victim(self, incoming: Optional[Hashable] = None) -> Hashable:
+        if not self.slots:
+            raise RuntimeError("No hay páginas para desalojar")
+        ring = self.ring
+        referenced = self._referenced
+        # A lo sumo dos vueltas: la primera puede limpiar todos los bits
+        while True:
+            if self.hand >= len(ring):
+                self.hand = 0
+            key = ring[self.hand]
+            if key is not None and (referenced is None or not referenced(key)):
+                break
+            self.hand += 1
+        slot = self.hand
+        self.hand += 1
+        del self.slots[key]
+        ring[slot] = None
+        self.free_slots.append(slot)  # La página entrante ocupa esta ranura
+        return key
+
+    def snapshot(self) -> List[Hashable]:
+        n = len(self.ring)
+        order = [self.ring[(self.hand + i) % n] for i in range(n)] if n else []
+        return [key for key in order if key is not None]
+
+    def peek(self, n: int) -> List[Hashable]:
+        hand = min(self.hand, len(self.ring))
+        order = chain(islice(self.ring, hand, None), islice(self.ring, hand))
+        return list(islice((key for key in order if key is not None), n))
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+
+class LFUPolicy(ReplacementPolicy):
+    """
+    LFU: desaloja la página con menos accesos (empates: la menos reciente).
+
+    Buckets por frecuencia (frecuencia → OrderedDict de claves) hacen que
+    acceso, carga y desalojo sean O(1).
+    """
+    name = "LFU"
+    tracks_hits = True
+
+    def __init__(self):
+        super().__init__()
+        self.freq: Dict[Hashable, int] = {}
+        self.buckets: Dict[int, OrderedDict] = {}
+        self.min_freq = 0
+
+    def on_load(self, key: Hashable) -> None:
+        self.freq[key] = 1
+        self.buckets.setdefault(1, OrderedDict())[key] = None
+        self.min_freq = 1
+
+    def on_access(self, key: Hashable) -> None:
+        f = self.freq[key]
+        bucket = self.buckets[f]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[f]
+            if self.min_freq == f:
+                self.min_freq = f + 1
+        self.freq[key] = f + 1
+        self.buckets.setdefault(f + 1, OrderedDict())[key] = None
+
+    def remove(self, key: Hashable) -> None:
+        f = self.freq.pop(key)
+        bucket = self.buckets[f]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[f]
+            if self.min_freq == f and self.buckets:
+                self.min_freq = min(self.buckets)
+
+    def select_victim(self, incoming: Optional[Hashable] = None) -> Hashable:
+        if not self.freq:
+            raise RuntimeError("No hay páginas para desalojar")
+        if self.min_freq not in self.buckets:
+            self.min_freq = min(self.buckets)
+        bucket = self.buckets[self.min_freq]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self.buckets[self.min_freq]
+        del self.freq[key]
+        return key
+
+    def snapshot(self) -> List[Hashable]:
+        return [key for f in sorted(self.buckets) for key in self.buckets[f]]
+
+    def peek(self, n: int) -> List[Hashable]:
+        # Solo se ordenan las frecuencias distintas, no las claves
+        return list(islice(chain.from_iterable(self.buckets[f] for f in sorted(self.buckets)), n))
+
+    def __len__(self) -> int:
+        return len(self.freq)
+
+
+class ARCPolicy(ReplacementPolicy):
+    """
+    ARC: Adaptive Replacement Cache.
+
+    Mantiene dos listas residentes (T1: vistas una vez, T2: vistas al
+    menos dos veces) y dos listas fantasma con claves desalojadas
+    recientemente (B1, B2). Un hit fantasma ajusta el objetivo `p` del
+    tamaño de T1, adaptándose entre recencia y frecuencia. Resiste bien
+    los escaneos secuenciales que degradan a LRU.
+    """
+    name = "ARC"
+    tracks_hits = True
+
+    def __init__(self):
+        super().__init__()
+        self.t1: OrderedDict = OrderedDict()
+        self.t2: OrderedDict = OrderedDict()
+        self.b1: OrderedDict = OrderedDict()
+        self.b2: OrderedDict = OrderedDict()
+        self.p = 0.0
+        self._adapted_for: Optional[Hashable] = None
+
+    def _adapt(self, key: Hashable) -> None:
+        """Ajusta p ante un hit fantasma (una sola vez por clave entrante)."""
+        if key == self._adapted_for:
+            return
+        if key in self.b1:
+            delta = max(len(self.b2) / len(self.b1), 1)
+            self.p = min(float(self.capacity), self.p + delta)
+        elif key in self.b2:
+            delta = max(len(self.b1) / len(self.b2), 1)
+            self.p = max(0.0, self.p - delta)
+        self._adapted_for = key
+
+    def on_load(self, key: Hashable) -> None:
+        self._adapt(key)
+        self._adapted_for = None
+        if key in self.b1:
+            del self.b1[key]
+            self.t2[key] = None
+        elif key in self.b2:
+            del self.b2[key]
+            self.t2[key] = None
+        else:
+            self.t1[key] = None
+            # Mantener |T1| + |B1| <= c y el total del directorio <= 2c
+            if len(self.t1) + len(self.b1) > self.capacity and self.b1:
+                self.b1.popitem(last=False)
+            total = len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2)
+            if total > 2 * self.capacity and self.b2:
+                self.b2.popitem(last=False)
+
+    def on_access(self, key: Hashable) -> None:
+        if key in self.t1:
+            del self.t1[key]
+            self.t2[key] = None
+        else:
+            self.t2.move_to_end(key)
+
+    def remove(self, key: Hashable) -> None:
+        if key in self.t1:
+            del self.t1[key]
+        else:
+            del self.t2[key]
+
+    def select_victim(self, incoming: Optional[Hashable] = None) -> Hashable:
+        if not self.t1 and not self.t2:
+            raise RuntimeError("No hay páginas para desalojar")
+        if incoming is not None:
+            self._adapt(incoming)
+        t1_len = len(self.t1)
+        if self.t1 and (t1_len > self.p or
+                        (incoming in self.b2 and t1_len == int(self.p)) or
+                        not self.t2):
+            key, _ = self.t1.popitem(last=False)
+            self.b1[key] = None
+        else:
+            key, _ = self.t2.popitem(last=False)
+            self.b2[key] = None
+        return key
+
+    def snapshot(self) -> List[Hashable]:
+        return list(self.t1) + list(self.t2)
+
+    def peek(self, n: int) -> List[Hashable]:
+        return list(islice(chain(self.t1, self.t2), n))
+
+    def __len__(self) -> int:
+        return len(self.t1) + len(self.t2)
+
+
+# Registro de políticas por nombre
+POLICIES: Dict[str, Type[ReplacementPolicy]] = {
+    'fifo': FIFOPolicy,
+    'lru': LRUPolicy,
+    'clock': ClockPolicy,
+    'lfu': LFUPolicy,
+    'arc': ARCPolicy,
+}
+
+
+def make_policy(policy: Union[str, ReplacementPolicy, Type[ReplacementPolicy]]) -> ReplacementPolicy:
+    """
+    Construye una política de reemplazo.
+
+    Args:
+        policy: Nombre registrado ('fifo', 'lru', 'clock', 'lfu', 'arc'),
+                clase de política o instancia ya construida
+
+    Returns:
+        Instancia de ReplacementPolicy
+
+    Raises:
+        ValueError: Si el nombre no está registrado
+    """
+    if isinstance(policy, ReplacementPolicy):
+        return policy
+    if isinstance(policy, type) and issubclass(policy, ReplacementPolicy):
+        return policy()
+    try:
+        return POLICIES[policy.lower()]()
+    except (KeyError, AttributeError):
+        raise ValueError(
+            f"Política de reemplazo desconocida: {policy!r}. "
+            f"Opciones: {sorted(POLICIES)}"
+        ) from None
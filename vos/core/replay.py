@@ -0,0 +1,335 @@
+"""
+Motor de Replay de Trazas de Acceso a Memoria
+VOS (Virtual Operating System)
+
+Este módulo aplica trazas de accesos a memoria grabadas sobre una VM, en
+lugar de programas escritos a mano (demo_tasks):
+- Lectura en streaming por bloques (memoria constante) con generadores
+- Formatos: texto, binario array('Q') y cualquiera de ellos con gzip
+- Bucle interno sin trazado ni validación por acceso
+- Estadísticas de faults, write-backs, hits y referencias por segundo
+
+Codificación de una referencia: entero sin signo de 64 bits
+    ref = (vaddr << 1) | es_escritura
+
+Formato de texto (una referencia por línea, '#' inicia comentario):
+    R 0x1f00        lectura (también L, I)
+    W 4096          escritura (también S, M)
+    0x2000          lectura (sin operación)
+    L 04222cac,4    formato Valgrind Lackey (dirección hex, tamaño ignorado)
+
+Uso desde la línea de comandos:
+    python -m vos.core.replay traza.bin.gz --policy lru --frames 64
+"""
+
+import argparse
+import gzip
+import sys
+import time
+from array import array
+from typing import IO, Dict, Iterable, Iterator, Optional, Union
+
+from vos.core.vm import VM, PAGE_SIZE, VIRTUAL_PAGES, PHYSICAL_FRAMES
+
+# Referencias por bloque al leer trazas
+CHUNK_SIZE = 65536
+
+# Operaciones del formato de texto que cuentan como escritura
+_WRITE_OPS = {'W', 'S', 'M'}
+_READ_OPS = {'R', 'L', 'I'}
+
+
+def encode(vaddr: int, write: bool = False) -> int:
+    """Codifica una referencia como (vaddr << 1) | escritura."""
+    return (vaddr << 1) | (1 if write else 0)
+
+
+def _open(path: str, mode: str) -> IO:
+    """Abre un archivo, descomprimiendo con gzip si tiene la firma 1f 8b."""
+    if 'r' in mode:
+        with open(path, 'rb') as probe:
+            compressed = probe.read(2) == b'\x1f\x8b'
+    else:
+        compressed = path.endswith('.gz')
+    if compressed:
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+def _parse_line(line: str) -> Optional[int]:
+    """
+    Convierte una línea de traza de texto en una referencia codificada.
+
+    Returns:
+        Referencia codificada, o None si la línea está vacía o es comentario
+
+    Raises:
+        ValueError: Si la línea no tiene un formato reconocido
+    """
+    line = line.split('#', 1)[0].strip()
+    if not line:
+        return None
+    parts = line.split()
+    write = False
+    if len(parts) == 2:
+        op = parts[0].upper()
+        if op in _WRITE_OPS:
+            write = True
+        elif op not in _READ_OPS:
+            raise ValueError(f"Operación de traza desconocida: {parts[0]!r}")
+        addr = parts[1]
+    elif len(parts) == 1:
+        addr = parts[0]
+    else:
+        raise ValueError(f"Línea de traza inválida: {line!r}")
+    if ',' in addr:
+        # Formato Lackey: dirección hexadecimal sin prefijo, luego tamaño
+        vaddr = int(addr.split(',', 1)[0], 16)
+    else:
+        vaddr = int(addr, 0)
+    return (vaddr << 1) | write
+
+
+def read_text_trace(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[array]:
+    """
+    Lee una traza de texto (opcionalmente gzip) en bloques.
+
+    Args:
+        path: Ruta del archivo
+        chunk_size: Referencias por bloque
+
+    Yields:
+        Bloques array('Q') de referencias codificadas
+    """
+    with _open(path, 'rt') as f:
+        chunk = array('Q')
+        for line in f:
+            ref = _parse_line(line)
+            if ref is None:
+                continue
+            chunk.append(ref)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = array('Q')
+        if chunk:
+            yield chunk
+
+
+def read_binary_trace(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[array]:
+    """
+    Lee una traza binaria array('Q') little-endian (opcionalmente gzip) en bloques.
+
+    Args:
+        path: Ruta del archivo
+        chunk_size: Referencias por bloque
+
+    Yields:
+        Bloques array('Q') de referencias codificadas
+    """
+    itemsize = array('Q').itemsize
+    swap = sys.byteorder != 'little'
+    with _open(path, 'rb') as f:
+        while True:
+            data = f.read(chunk_size * itemsize)
+            if not data:
+                break
+            if len(data) % itemsize:
+                raise ValueError("Traza binaria truncada: tamaño no múltiplo de 8 bytes")
+            chunk = array('Q')
+            chunk.frombytes(data)
+            if swap:
+                chunk.byteswap()
+            yield chunk
+
+
+def read_trace(path: str, fmt: str = 'auto', chunk_size: int = CHUNK_SIZE) -> Iterator[array]:
+    """
+    Lee una traza en bloques, detectando el formato si se pide.
+
+    Args:
+        path: Ruta del archivo
+        fmt: 'text', 'binary' o 'auto' (binario si termina en .bin o .bin.gz)
+        chunk_size: Referencias por bloque
+
+    Yields:
+        Bloques array('Q') de referencias codificadas
+
+    Raises:
+        ValueError: Si el formato es desconocido
+    """
+    if fmt == 'auto':
+        fmt = 'binary' if path.endswith(('.bin', '.bin.gz')) else 'text'
+    if fmt == 'text':
+        return read_text_trace(path, chunk_size)
+    if fmt == 'binary':
+        return read_binary_trace(path, chunk_size)
+    raise ValueError(f"Formato de traza desconocido: {fmt!r}")
+
+
+def write_binary_trace(path: str, refs: Iterable[int]) -> int:
+    """
+    Escribe referencias codificadas como traza binaria (gzip si termina en .gz).
+
+    Args:
+        path: Ruta del archivo
+        refs: Referencias codificadas (ver encode)
+
+    Returns:
+        Número de referencias escritas
+    """
+    count = 0
+    with _open(path, 'wb') as f:
+        for chunk in chunked(refs):
+            if sys.byteorder != 'little':
+                chunk.byteswap()
+            f.write(chunk.tobytes())
+            count += len(chunk)
+    return count
+
+
+def chunked(refs: Iterable[int], chunk_size: int = CHUNK_SIZE) -> Iterator[array]:
+    """
+    Agrupa un iterable de referencias en bloques array('Q').
+
+    Args:
+        refs: Referencias codificadas
+        chunk_size: Referencias por bloque
+
+    Yields:
+        Bloques array('Q')
+    """
+    chunk = array('Q')
+    for ref in refs:
+        chunk.append(ref)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = array('Q')
+    if chunk:
+        yield chunk
+
+
+def replay(vm: VM, chunks: Iterable[Iterable[int]],
+           limit: Optional[int] = None) -> Dict[str, Union[int, float]]:
+    """
+    Aplica una traza (en bloques) sobre una VM.
+
+    La validación de rango se hace una vez por bloque y el bucle interno
+    llama directamente a VM.touch_page, sin trazado por acceso. Cuando la
+    política no necesita ver cada hit y no hay TLB que medir, las
+    referencias consecutivas a la misma página residente (ya sucia y sin
+    copy-on-write pendiente si es escritura) se cuentan como hit sin
+    volver a traducir.
+
+    Args:
+        vm: VM destino (su política, TLB, etc. ya configurados)
+        chunks: Iterable de bloques de referencias codificadas
+        limit: Máximo de referencias a aplicar (None = todas)
+
+    Returns:
+        Diccionario con referencias, lecturas, escrituras, faults,
+        write-backs, hits, segundos y referencias por segundo
+
+    Raises:
+        ValueError: Si un bloque contiene direcciones fuera de rango
+    """
+    page_size = vm.page_size
+    max_ref = vm.max_vaddr << 1
+    touch = vm.touch_page
+    collapse = vm.tlb is None and not vm.policy.tracks_hits
+    faults_before = vm.page_faults
+    write_backs_before = vm.write_backs
+
+    references = writes = 0
+    last_page = -1
+    last_entry = None
+    start = time.perf_counter()
+    for chunk in chunks:
+        if limit is not None:
+            remaining = limit - references
+            if remaining <= 0:
+                break
+            if len(chunk) > remaining:
+                chunk = chunk[:remaining]
+        if not chunk:
+            continue
+        if max(chunk) >= max_ref:
+            raise ValueError(
+                f"La traza contiene direcciones fuera de [0, {vm.max_vaddr})"
+            )
+        for ref in chunk:
+            write = ref & 1
+            page_no = (ref >> 1) // page_size
+            if (collapse and page_no == last_page and last_entry.present
+                    and (not write or (last_entry.dirty and not last_entry.cow))):
+                continue
+            last_entry = touch(page_no, write)
+            last_page = page_no
+        references += len(chunk)
+        writes += sum(ref & 1 for ref in chunk)
+    elapsed = time.perf_counter() - start
+
+    faults = vm.page_faults - faults_before
+    return {
+        'references': references,
+        'reads': references - writes,
+        'writes': writes,
+        'page_faults': faults,
+        'write_backs': vm.write_backs - write_backs_before,
+        'hits': references - faults,
+        'fault_rate': faults / references if references else 0.0,
+        'seconds': elapsed,
+        'refs_per_sec': references / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def replay_trace(path: str, policy: str = 'fifo', page_size: int = PAGE_SIZE,
+                 virtual_pages: int = VIRTUAL_PAGES, physical_frames: int = PHYSICAL_FRAMES,
+                 fmt: str = 'auto', chunk_size: int = CHUNK_SIZE,
+                 limit: Optional[int] = None, **vm_options) -> Dict[str, Union[int, float]]:
+    """
+    Crea una VM con la política indicada y le aplica una traza de archivo.
+
+    Args:
+        path: Ruta de la traza
+        policy: Política de reemplazo
+        page_size, virtual_pages, physical_frames: Geometría de la VM
+        fmt: Formato de la traza ('auto', 'text', 'binary')
+        chunk_size: Referencias por bloque
+        limit: Máximo de referencias a aplicar
+        **vm_options: Argumentos adicionales para VM (tlb, page_table, ...)
+
+    Returns:
+        Estadísticas del replay más las de la VM (get_stats)
+    """
+    vm = VM(page_size=page_size, virtual_pages=virtual_pages,
+            physical_frames=physical_frames, policy=policy, **vm_options)
+    stats = replay(vm, read_trace(path, fmt, chunk_size), limit)
+    vm_stats = vm.get_stats()
+    vm_stats.pop('replacement_queue', None)
+    return {**vm_stats, **stats}
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Replay de trazas de memoria sobre la VM de VOS")
+    parser.add_argument('trace', help="Archivo de traza (texto o binario, opcionalmente .gz)")
+    parser.add_argument('--format', default='auto', choices=['auto', 'text', 'binary'])
+    parser.add_argument('--policy', default='fifo')
+    parser.add_argument('--page-size', type=int, default=4096)
+    parser.add_argument('--virtual-pages', type=int, default=1 << 20)
+    parser.add_argument('--frames', type=int, default=256)
+    parser.add_argument('--limit', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    stats = replay_trace(
+        args.trace, policy=args.policy, page_size=args.page_size,
+        virtual_pages=args.virtual_pages, physical_frames=args.frames,
+        fmt=args.format, limit=args.limit,
+    )
+    for key, value in stats.items():
+        print(f"{key:>20}: {value}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
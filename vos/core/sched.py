@@ -1,17 +1,116 @@
 """
-Round-Robin Scheduler
+Schedulers de Procesos
 VOS (Virtual Operating System) - Lab 2
 
-Este módulo implementa un scheduler Round-Robin simple que gestiona
-la cola de procesos listos para ejecutar.
+Este módulo define la interfaz de scheduler que usa el Kernel para
+gestionar la cola de procesos listos, y las implementaciones incluidas:
+- Scheduler: Round-Robin simple (deque, O(1))
+- PriorityScheduler: prioridad estática de PCB.priority (heap, O(log n))
+- MLFQScheduler: Multi-Level Feedback Queue con quantum por nivel,
+  degradación de procesos CPU-bound y promoción de los que se bloquean
+
+El Kernel llama add() al poner un proceso en READY, next() al elegir el
+siguiente y on_slice() después de cada time slice ejecutado. Con varias
+CPUs cada una tiene su propia instancia, y una CPU sin procesos listos
+roba procesos de otra con steal() (work stealing).
 """
 
-from typing import Optional, List
+import heapq
+import itertools
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
 from collections import deque
 from vos.core.process import PCB, State
+from vos.core.trace import Tracer, get_default_tracer
 
 
-class Scheduler:
+class BaseScheduler:
+    """
+    Interfaz base de un scheduler.
+    
+    Atributos de clase:
+        name: Nombre legible del scheduler
+    
+    Atributos:
+        tracer: Sink de eventos del scheduler
+    """
+    name = "BASE"
+    
+    def __init__(self, tracer: Optional[Tracer] = None):
+        """
+        Args:
+            tracer: Sink de eventos (None = tracer por defecto, silencioso)
+        """
+        self.tracer: Tracer = tracer if tracer is not None else get_default_tracer()
+    
+    def _check_ready(self, pcb: PCB) -> None:
+        """Valida que un proceso a encolar esté READY."""
+        if pcb.state != State.READY:
+            raise ValueError(
+                f"Solo se pueden agregar procesos READY al scheduler. "
+                f"Estado actual: {pcb.state.value}"
+            )
+    
+    def add(self, pcb: PCB) -> None:
+        """
+        Agrega un proceso READY a la cola de listos.
+        
+        Raises:
+            ValueError: Si el proceso no está en estado READY
+        """
+        raise NotImplementedError
+    
+    def next(self) -> Optional[PCB]:
+        """Retira y retorna el siguiente proceso a ejecutar (None = CPU idle)."""
+        raise NotImplementedError
+    
+    def on_slice(self, pcb: PCB) -> None:
+        """
+        Notifica que un proceso terminó un time slice.
+        
+        Se llama antes de reencolarlo; pcb.state indica cómo terminó
+        (RUNNING = agotó el slice, WAITING = se bloqueó, TERMINATED).
+        """
+    
+    def steal(self, allowed: Callable[[PCB], bool]) -> Optional[PCB]:
+        """
+        Retira un proceso listo para que lo ejecute otra CPU.
+        
+        Se roba el proceso que este scheduler ejecutaría primero entre los
+        que acepta `allowed` (ej: los que tienen afinidad con la CPU que
+        roba), así el robo también adelanta al que más viene esperando.
+        
+        Args:
+            allowed: Filtro de procesos que se pueden migrar
+        
+        Returns:
+            PCB retirado, o None si ninguno cumple el filtro
+        """
+        raise NotImplementedError
+    
+    def forget(self, pcb: PCB) -> None:
+        """
+        Descarta el estado que el scheduler guarda de un proceso que ya no
+        está en su cola (ej: migró a otra CPU por un cambio de afinidad).
+        """
+    
+    def size(self) -> int:
+        """Número de procesos en la cola de listos."""
+        raise NotImplementedError
+    
+    def is_empty(self) -> bool:
+        """True si no hay procesos listos."""
+        return self.size() == 0
+    
+    def get_ready_pids(self) -> List[int]:
+        """PIDs de la cola de listos, en el orden en que se ejecutarían."""
+        raise NotImplementedError
+    
+    def __repr__(self) -> str:
+        pids = self.get_ready_pids()
+        return f"{type(self).__name__}(ready={len(pids)}, queue={pids})"
+
+
+class Scheduler(BaseScheduler):
     """
     Scheduler Round-Robin.
     
@@ -27,10 +126,18 @@ class Scheduler:
     
     Atributos:
         ready_queue: Cola de PCBs en estado READY
+        tracer: Sink de eventos del scheduler
     """
+    name = "Round-Robin"
     
-    def __init__(self):
-        """Inicializa el scheduler con una cola vacía."""
+    def __init__(self, tracer: Optional[Tracer] = None):
+        """
+        Inicializa el scheduler con una cola vacía.
+        
+        Args:
+            tracer: Sink de eventos (None = tracer por defecto, silencioso)
+        """
+        super().__init__(tracer)
         self.ready_queue: deque[PCB] = deque()
     
     def add(self, pcb: PCB) -> None:
@@ -49,15 +156,12 @@ class Scheduler:
         Raises:
             ValueError: Si el proceso no está en estado READY
         """
-        if pcb.state != State.READY:
-            raise ValueError(
-                f"Solo se pueden agregar procesos READY al scheduler. "
-                f"Estado actual: {pcb.state.value}"
-            )
+        self._check_ready(pcb)
         
         # Agregar al final de la cola (FIFO)
         self.ready_queue.append(pcb)
-        print(f"   📋 Scheduler: Proceso {pcb.pid} ({pcb.name}) agregado a ready queue")
+        if self.tracer.events:
+            self.tracer.emit('sched.add', pid=pcb.pid, name=pcb.name)
     
     def next(self) -> Optional[PCB]:
         """
@@ -77,9 +181,18 @@ class Scheduler:
         
         # Tomar el primer proceso de la cola (FIFO)
         pcb = self.ready_queue.popleft()
-        print(f"   🎯 Scheduler: Seleccionado proceso {pcb.pid} ({pcb.name}) para ejecutar")
+        if self.tracer.events:
+            self.tracer.emit('sched.next', pid=pcb.pid, name=pcb.name)
         return pcb
     
+    def steal(self, allowed: Callable[[PCB], bool]) -> Optional[PCB]:
+        queue = self.ready_queue
+        for i, pcb in enumerate(queue):
+            if allowed(pcb):
+                del queue[i]
+                return pcb
+        return None
+    
     def is_empty(self) -> bool:
         """
         Verifica si la cola de listos está vacía.
@@ -112,4 +225,275 @@ class Scheduler:
     def __repr__(self) -> str:
         """Representación legible del scheduler."""
         pids = self.get_ready_pids()
-        return f"Scheduler(ready={len(pids)}, queue={pids})"
\ No newline at end of file
+        return f"Scheduler(ready={len(pids)}, queue={pids})"
+
+
+class PriorityScheduler(BaseScheduler):
+    """
+    Scheduler por prioridad estática.
+    
+    Ejecuta siempre el proceso READY con menor PCB.priority (menor valor =
+    mayor prioridad, como nice en Unix); a igual prioridad, en orden de
+    llegada (Round-Robin entre ellos). La cola es un heap: add y next son
+    O(log n). Un proceso de baja prioridad puede no ejecutar nunca
+    mientras haya otros de mayor prioridad listos.
+    
+    Atributos:
+        heap: Tuplas (prioridad, orden de llegada, PCB)
+    """
+    name = "Priority"
+    
+    def __init__(self, tracer: Optional[Tracer] = None):
+        super().__init__(tracer)
+        self.heap: List[Tuple[int, int, PCB]] = []
+        self._seq = itertools.count()
+    
+    def add(self, pcb: PCB) -> None:
+        self._check_ready(pcb)
+        heapq.heappush(self.heap, (pcb.priority, next(self._seq), pcb))
+        if self.tracer.events:
+            self.tracer.emit('sched.add', pid=pcb.pid, name=pcb.name)
+    
+    def next(self) -> Optional[PCB]:
+        if not self.heap:
+            return None
+        pcb = heapq.heappop(self.heap)[2]
+        if self.tracer.events:
+            self.tracer.emit('sched.next', pid=pcb.pid, name=pcb.name)
+        return pcb
+    
+    def steal(self, allowed: Callable[[PCB], bool]) -> Optional[PCB]:
+        heap = self.heap
+        if heap and allowed(heap[0][2]):
+            return heapq.heappop(heap)[2]
+        # Con afinidades: el mejor permitido, fuera de la cima (O(n))
+        best = min((item for item in heap if allowed(item[2])),
+                   key=lambda item: item[:2], default=None)
+        if best is None:
+            return None
+        heap.remove(best)
+        heapq.heapify(heap)
+        return best[2]
+    
+    def size(self) -> int:
+        return len(self.heap)
+    
+    def get_ready_pids(self) -> List[int]:
+        return [pcb.pid for _, _, pcb in sorted(self.heap, key=lambda item: item[:2])]
+
+
+class MLFQScheduler(BaseScheduler):
+    """
+    Multi-Level Feedback Queue.
+    
+    Hay una cola Round-Robin por nivel; siempre se ejecuta el primer
+    proceso del nivel más alto (0) no vacío. Reglas:
+    - Un proceso nuevo entra al nivel 0
+    - Un proceso mantiene la CPU hasta usar el quantum de su nivel
+      (quanta[nivel] slices seguidos); al agotarlo baja un nivel
+      (procesos CPU-bound)
+    - Un proceso que se bloquea (WAITING) sube un nivel y reinicia su
+      quantum (procesos interactivos)
+    - Boost por envejecimiento: cada boost_interval slices, los procesos
+      listos que llevan al menos boost_interval slices sin ejecutar
+      vuelven al nivel 0 (evita inanición: ninguno espera más de unos
+      2 × boost_interval slices)
+    
+    A diferencia de un boost global, el envejecimiento no devuelve al
+    nivel 0 a los procesos CPU-bound que sí vienen ejecutando, así con
+    miles de procesos los interactivos no quedan detrás de todos ellos.
+    
+    next() es O(niveles); add() y on_slice() son O(1); cada boost es
+    O(procesos en niveles bajos), una vez cada boost_interval slices.
+    
+    Los niveles son locales a cada instancia: un proceso robado por otra
+    CPU (steal) entra al nivel 0 del scheduler de esa CPU.
+    
+    Atributos:
+        quanta: Slices por quantum en cada nivel (uno por nivel)
+        boost_interval: Período y antigüedad del boost (0 = sin boost)
+        queues: Cola de listos de cada nivel
+        levels: Nivel actual de cada proceso conocido (pid → nivel)
+        used: Slices usados del quantum actual (pid → slices)
+        last_run: Slice en que cada proceso ejecutó por última vez
+        demotions, promotions, boosts: Contadores de cambios de nivel
+                                       (boosts cuenta procesos subidos)
+    """
+    name = "MLFQ"
+    
+    def __init__(self, quanta: Sequence[int] = (1, 2, 4), boost_interval: int = 1000,
+                 tracer: Optional[Tracer] = None):
+        """
+        Args:
+            quanta: Quantum (en slices) de cada nivel, del más alto al más bajo
+            boost_interval: Slices entre boosts, y sin ejecutar para recibirlo
+                            (0 = sin boost)
+            tracer: Sink de eventos (None = tracer por defecto, silencioso)
+        
+        Raises:
+            ValueError: Si no hay niveles o algún quantum no es positivo
+        """
+        if not quanta or any(q <= 0 for q in quanta):
+            raise ValueError(f"Quanta de MLFQ inválidos: {list(quanta)}")
+        if boost_interval < 0:
+            raise ValueError(f"boost_interval inválido: {boost_interval}")
+        super().__init__(tracer)
+        self.quanta = tuple(quanta)
+        self.boost_interval = boost_interval
+        self.queues: List[deque[PCB]] = [deque() for _ in self.quanta]
+        self.levels: Dict[int, int] = {}
+        self.used: Dict[int, int] = {}
+        self.last_run: Dict[int, int] = {}
+        self._slices = 0
+        self.demotions = 0
+        self.promotions = 0
+        self.boosts = 0
+    
+    def add(self, pcb: PCB) -> None:
+        self._check_ready(pcb)
+        pid = pcb.pid
+        level = self.levels.setdefault(pid, 0)
+        self.last_run.setdefault(pid, self._slices)
+        if self.used.get(pid):
+            # Le queda quantum: sigue primero en su nivel
+            self.queues[level].appendleft(pcb)
+        else:
+            self.queues[level].append(pcb)
+        if self.tracer.events:
+            self.tracer.emit('sched.add', pid=pid, name=pcb.name)
+    
+    def next(self) -> Optional[PCB]:
+        for queue in self.queues:
+            if queue:
+                pcb = queue.popleft()
+                if self.tracer.events:
+                    self.tracer.emit('sched.next', pid=pcb.pid, name=pcb.name)
+                return pcb
+        return None
+    
+    def steal(self, allowed: Callable[[PCB], bool]) -> Optional[PCB]:
+        for queue in self.queues:
+            for i, pcb in enumerate(queue):
+                if allowed(pcb):
+                    del queue[i]
+                    self.forget(pcb)
+                    return pcb
+        return None
+    
+    def forget(self, pcb: PCB) -> None:
+        pid = pcb.pid
+        self.levels.pop(pid, None)
+        self.used.pop(pid, None)
+        self.last_run.pop(pid, None)
+    
+    def on_slice(self, pcb: PCB) -> None:
+        pid = pcb.pid
+        state = pcb.state
+        if state == State.TERMINATED:
+            self.forget(pcb)
+        else:
+            self.last_run[pid] = self._slices
+            level = self.levels.get(pid, 0)
+            if state == State.WAITING:
+                self.used[pid] = 0
+                if level > 0:
+                    self._move(pcb, level - 1)
+                    self.promotions += 1
+            else:
+                used = self.used.get(pid, 0) + 1
+                if used >= self.quanta[level]:
+                    self.used[pid] = 0
+                    if level + 1 < len(self.quanta):
+                        self._move(pcb, level + 1)
+                        self.demotions += 1
+                else:
+                    self.used[pid] = used
+        
+        self._slices += 1
+        if self.boost_interval and self._slices % self.boost_interval == 0:
+            self._boost()
+    
+    def _move(self, pcb: PCB, level: int) -> None:
+        """Cambia el nivel de un proceso que no está en ninguna cola."""
+        self.levels[pcb.pid] = level
+        if self.tracer.events:
+            self.tracer.emit('sched.level', pid=pcb.pid, name=pcb.name, level=level)
+    
+    def _boost(self) -> None:
+        """Sube al nivel 0 los procesos listos que llevan boost_interval slices sin ejecutar."""
+        oldest = self._slices - self.boost_interval
+        last_run, levels, used = self.last_run, self.levels, self.used
+        top = self.queues[0]
+        boosted = 0
+        for level in range(1, len(self.queues)):
+            waiting = deque()
+            for pcb in self.queues[level]:
+                pid = pcb.pid
+                if last_run.get(pid, 0) <= oldest:
+                    top.append(pcb)
+                    levels[pid] = 0
+                    used.pop(pid, None)
+                    boosted += 1
+                else:
+                    waiting.append(pcb)
+            self.queues[level] = waiting
+        self.boosts += boosted
+        if boosted and self.tracer.events:
+            self.tracer.emit('sched.boost', count=boosted)
+    
+    def size(self) -> int:
+        return sum(len(queue) for queue in self.queues)
+    
+    def get_ready_pids(self) -> List[int]:
+        return [pcb.pid for queue in self.queues for pcb in queue]
+    
+    def get_stats(self) -> Dict[str, Union[int, List[int]]]:
+        """
+        Obtiene estadísticas del scheduler.
+        
+        Returns:
+            Diccionario con procesos listos por nivel, degradaciones,
+            promociones y boosts
+        """
+        return {
+            'ready_by_level': [len(queue) for queue in self.queues],
+            'demotions': self.demotions,
+            'promotions': self.promotions,
+            'boosts': self.boosts,
+        }
+
+
+# Registro de schedulers por nombre
+SCHEDULERS: Dict[str, Type[BaseScheduler]] = {
+    'rr': Scheduler,
+    'priority': PriorityScheduler,
+    'mlfq': MLFQScheduler,
+}
+
+
+def make_scheduler(scheduler: Union[str, BaseScheduler, Type[BaseScheduler]],
+                   tracer: Optional[Tracer] = None) -> BaseScheduler:
+    """
+    Construye un scheduler.
+    
+    Args:
+        scheduler: Nombre registrado ('rr', 'priority', 'mlfq'), clase de
+                   scheduler o instancia ya construida (se usa tal cual)
+        tracer: Sink de eventos para los schedulers que se construyen
+    
+    Returns:
+        Instancia de BaseScheduler
+    
+    Raises:
+        ValueError: Si el nombre no está registrado
+    """
+    if isinstance(scheduler, BaseScheduler):
+        return scheduler
+    if isinstance(scheduler, type) and issubclass(scheduler, BaseScheduler):
+        return scheduler(tracer=tracer)
+    try:
+        return SCHEDULERS[scheduler.lower()](tracer=tracer)
+    except (KeyError, AttributeError):
+        raise ValueError(
+            f"Scheduler desconocido: {scheduler!r}. Opciones: {sorted(SCHEDULERS)}"
+        ) from None
@@ -0,0 +1,119 @@
+"""
+Segmentos de Memoria Compartida
+VOS (Virtual Operating System)
+
+Este módulo define segmentos de memoria compartida estilo shm:
+- El Kernel crea un segmento de N páginas con su propio backing store
+- Cada proceso lo adjunta en un rango virtual de su VM (attach/detach)
+- Todas las VMs que lo adjuntan mapean LOS MISMOS marcos físicos: lo que
+  un proceso escribe, el otro lo lee sin copias
+
+La residencia de cada página del segmento es única: el primer proceso
+que la toca la carga en un marco y los demás solo lo mapean. Al desalojar
+ese marco se quita de todos los espacios de direcciones a la vez y, si
+alguno lo modificó, se escribe UNA sola vez en el store del segmento.
+"""
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from vos.core.swap import BackingStore, DictBackingStore
+
+if TYPE_CHECKING:
+    from vos.core.vm import VM, PhysicalMemory
+
+
+class SharedSegment:
+    """
+    Segmento de memoria compartida.
+
+    Atributos:
+        shm_id: Identificador del segmento
+        name: Nombre descriptivo
+        num_pages: Páginas del segmento
+        page_size: Bytes por página
+        backing_store: Store de las páginas no residentes del segmento
+        frames: Página del segmento → marco, para las residentes
+        dirty: Páginas residentes modificadas por mapeos ya quitados
+        attachments: Adjuntos (vm, página virtual inicial)
+        write_backs: Páginas escritas al store
+    """
+
+    def __init__(self, shm_id: int, num_pages: int, page_size: int, name: str = "",
+                 backing_store: Optional[BackingStore] = None):
+        """
+        Args:
+            shm_id: Identificador del segmento
+            num_pages: Páginas del segmento (> 0)
+            page_size: Bytes por página
+            name: Nombre descriptivo (vacío = "shm-<id>")
+            backing_store: Store del segmento (None = DictBackingStore)
+
+        Raises:
+            ValueError: Si num_pages no es positivo
+        """
+        if num_pages <= 0:
+            raise ValueError(f"Tamaño de segmento inválido: {num_pages} páginas")
+        self.shm_id = shm_id
+        self.name = name if name else f"shm-{shm_id}"
+        self.num_pages = num_pages
+        self.page_size = page_size
+        self.backing_store = backing_store if backing_store is not None else DictBackingStore()
+        self.frames: Dict[int, int] = {}
+        self.dirty: Set[int] = set()
+        self.attachments: List[Tuple['VM', int]] = []
+        self.write_backs = 0
+
+    @property
+    def size(self) -> int:
+        """Bytes del segmento."""
+        return self.num_pages * self.page_size
+
+    def load(self, seg_page: int, frame_no: int, memory: 'PhysicalMemory') -> None:
+        """
+        Carga una página del segmento en un marco recién asignado.
+
+        Args:
+            seg_page: Página dentro del segmento
+            frame_no: Marco destino
+            memory: RAM física
+        """
+        if seg_page in self.backing_store:
+            memory.load_frame(frame_no, self.backing_store[seg_page])
+        else:
+            memory.zero_frame(frame_no)
+        self.frames[seg_page] = frame_no
+
+    def release(self, seg_page: int, memory: 'PhysicalMemory') -> None:
+        """
+        Saca una página del segmento de RAM (ya sin mapeos), con write-back
+        si alguno de sus mapeos la modificó.
+
+        Args:
+            seg_page: Página dentro del segmento
+            memory: RAM física
+        """
+        frame_no = self.frames.pop(seg_page)
+        if seg_page in self.dirty:
+            self.dirty.discard(seg_page)
+            self.backing_store[seg_page] = memory.read_frame(frame_no)
+            self.write_backs += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtiene estadísticas del segmento.
+
+        Returns:
+            Diccionario con páginas, páginas residentes, adjuntos y write-backs
+        """
+        return {
+            'shm_pages': self.num_pages,
+            'shm_resident': len(self.frames),
+            'shm_attachments': len(self.attachments),
+            'shm_write_backs': self.write_backs,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"SharedSegment(id={self.shm_id}, name='{self.name}', pages={self.num_pages}, "
+            f"resident={len(self.frames)}, attached={len(self.attachments)})"
+        )
@@ -0,0 +1,283 @@
+"""
+Análisis de Distancias de Pila (Algoritmo de Mattson)
+VOS (Virtual Operating System)
+
+Este módulo calcula, en una sola pasada sobre una cadena de referencias,
+los page faults de LRU para TODOS los tamaños de memoria a la vez:
+- Distancia de pila LRU de cada referencia con un árbol de Fenwick
+- Curva de faults / miss ratio para 1..N marcos
+- Simulación FIFO por tamaño para detectar la anomalía de Belady
+
+LRU es un algoritmo de pila: con C marcos una referencia es hit si y solo
+si su distancia de pila es <= C. Así, con el histograma de distancias,
+faults(C) = referencias en frío + referencias con distancia > C.
+FIFO no tiene esta propiedad (puede fallar MÁS con más marcos), por eso
+se simula para cada tamaño y se compara.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from vos.core.vm import PAGE_SIZE
+
+
+class StackDistanceAnalyzer:
+    """
+    Calcula distancias de pila LRU incrementalmente.
+
+    Cada página guarda el instante de su último acceso; el árbol de Fenwick
+    marca con 1 esos instantes. La distancia de una referencia es la
+    cantidad de páginas distintas accedidas desde su acceso anterior + 1,
+    es decir, las marcas posteriores a su instante. Cuando los instantes
+    se agotan se renumeran, así la memoria es O(páginas distintas).
+
+    Atributos:
+        references: Referencias procesadas
+        cold: Referencias a páginas nunca vistas (distancia infinita)
+        histogram: Distancia → cantidad de referencias
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Args:
+            capacity: Instantes iniciales del árbol (crece si hace falta)
+        """
+        self.references = 0
+        self.cold = 0
+        self.histogram: Dict[int, int] = {}
+        self._last: Dict[int, int] = {}
+        self._capacity = max(1, capacity)
+        self._tree = [0] * (self._capacity + 1)
+        self._time = 0
+
+    def _compact(self) -> None:
+        """Renumera los instantes de último acceso a 1..k y reconstruye el árbol."""
+        order = sorted(self._last, key=self._last.__getitem__)
+        k = len(order)
+        self._capacity = max(self._capacity, 2 * k)
+        tree = [0] * (self._capacity + 1)
+        for t, page in enumerate(order, 1):
+            self._last[page] = t
+            tree[t] = 1
+        # Construcción lineal del árbol de Fenwick
+        size = self._capacity
+        for i in range(1, size + 1):
+            j = i + (i & -i)
+            if j <= size:
+                tree[j] += tree[i]
+        self._tree = tree
+        self._time = k
+
+    def feed(self, pages: Iterable[int]) -> None:
+        """
+        Procesa una secuencia de números de página.
+
+        Args:
+            pages: Números de página en orden de referencia
+        """
+        last = self._last
+        histogram = self.histogram
+        tree = self._tree
+        size = self._capacity
+        time = self._time
+        count = 0
+        cold = 0
+        for page in pages:
+            if time == size:
+                self._time = time
+                self._compact()
+                tree = self._tree
+                size = self._capacity
+                time = self._time
+            time += 1
+            count += 1
+            prev = last.get(page)
+            if prev is None:
+                cold += 1
+            else:
+                # Marcas con instante <= prev
+                before = 0
+                i = prev
+                while i:
+                    before += tree[i]
+                    i -= i & -i
+                distance = len(last) - before + 1
+                histogram[distance] = histogram.get(distance, 0) + 1
+                # Quitar la marca anterior
+                i = prev
+                while i <= size:
+                    tree[i] -= 1
+                    i += i & -i
+            # Marcar el instante actual
+            i = time
+            while i <= size:
+                tree[i] += 1
+                i += i & -i
+            last[page] = time
+        self._time = time
+        self.references += count
+        self.cold += cold
+
+    def feed_trace(self, chunks: Iterable[Iterable[int]], page_size: int = PAGE_SIZE) -> None:
+        """
+        Procesa una traza codificada (ver vos.core.replay) en bloques.
+
+        Args:
+            chunks: Bloques de referencias (vaddr << 1) | escritura
+            page_size: Tamaño de página para convertir direcciones
+        """
+        divisor = page_size << 1
+        for chunk in chunks:
+            self.feed(ref // divisor for ref in chunk)
+
+    @property
+    def distinct_pages(self) -> int:
+        """Páginas distintas referenciadas."""
+        return len(self._last)
+
+    def faults(self, frames: int) -> int:
+        """
+        Page faults de LRU con un número dado de marcos.
+
+        Args:
+            frames: Marcos físicos
+
+        Returns:
+            Faults (referencias en frío + distancia > frames)
+        """
+        return self.cold + sum(n for d, n in self.histogram.items() if d > frames)
+
+    def fault_curve(self, max_frames: Optional[int] = None) -> List[int]:
+        """
+        Faults de LRU para todos los tamaños 0..max_frames.
+
+        Args:
+            max_frames: Último tamaño (None = páginas distintas, donde solo
+                        quedan los faults en frío)
+
+        Returns:
+            Lista donde curve[c] son los faults con c marcos
+        """
+        if max_frames is None:
+            max_frames = self.distinct_pages
+        curve = [0] * (max_frames + 1)
+        # Faults(c) = cold + hits que necesitarían más de c marcos
+        beyond = self.cold + sum(n for d, n in self.histogram.items() if d > max_frames)
+        curve[max_frames] = beyond
+        for c in range(max_frames, 0, -1):
+            beyond += self.histogram.get(c, 0)
+            curve[c - 1] = beyond
+        return curve
+
+    def miss_ratio_curve(self, max_frames: Optional[int] = None) -> List[float]:
+        """
+        Miss ratio de LRU para todos los tamaños 0..max_frames.
+
+        Returns:
+            Lista donde mrc[c] = faults(c) / referencias
+        """
+        refs = self.references or 1
+        return [f / refs for f in self.fault_curve(max_frames)]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtiene estadísticas del análisis.
+
+        Returns:
+            Diccionario con referencias, faults en frío, páginas distintas
+            y distancia máxima observada
+        """
+        return {
+            'references': self.references,
+            'cold_misses': self.cold,
+            'distinct_pages': self.distinct_pages,
+            'max_distance': max(self.histogram, default=0),
+        }
+
+
+def fifo_faults(pages: Iterable[int], frames: int) -> int:
+    """
+    Simula FIFO con un número de marcos y cuenta los page faults.
+
+    Args:
+        pages: Números de página en orden de referencia
+        frames: Marcos físicos (> 0)
+
+    Returns:
+        Page faults
+    """
+    resident = set()
+    queue = deque()
+    faults = 0
+    for page in pages:
+        if page in resident:
+            continue
+        faults += 1
+        if len(queue) >= frames:
+            resident.discard(queue.popleft())
+        queue.append(page)
+        resident.add(page)
+    return faults
+
+
+def fifo_fault_curve(pages: List[int], max_frames: int) -> List[int]:
+    """
+    Faults de FIFO para todos los tamaños 0..max_frames (una simulación por tamaño).
+
+    Args:
+        pages: Cadena de referencias (se recorre varias veces)
+        max_frames: Último tamaño
+
+    Returns:
+        Lista donde curve[c] son los faults con c marcos
+    """
+    return [len(pages)] + [fifo_faults(pages, c) for c in range(1, max_frames + 1)]
+
+
+def find_belady_anomalies(curve: List[int]) -> List[Tuple[int, int, int]]:
+    """
+    Busca tamaños donde agregar un marco aumenta los faults.
+
+    Args:
+        curve: Faults por número de marcos (curve[c])
+
+    Returns:
+        Lista de (c, faults con c marcos, faults con c+1 marcos)
+    """
+    return [
+        (c, curve[c], curve[c + 1])
+        for c in range(1, len(curve) - 1)
+        if curve[c + 1] > curve[c]
+    ]
+
+
+def analyze(pages: Iterable[int], max_frames: Optional[int] = None,
+            fifo: bool = True) -> Dict[str, object]:
+    """
+    Curvas de faults de LRU (una pasada) y FIFO, con anomalías de Belady.
+
+    Args:
+        pages: Cadena de referencias (números de página)
+        max_frames: Último tamaño a reportar (None = páginas distintas)
+        fifo: Si se simula FIFO para buscar anomalías
+
+    Returns:
+        Diccionario con 'references', 'distinct_pages', 'lru_faults',
+        'lru_miss_ratio' y, si fifo, 'fifo_faults' y 'belady_anomalies'
+    """
+    pages = list(pages)
+    analyzer = StackDistanceAnalyzer()
+    analyzer.feed(pages)
+    if max_frames is None:
+        max_frames = analyzer.distinct_pages
+    result = {
+        'references': analyzer.references,
+        'distinct_pages': analyzer.distinct_pages,
+        'lru_faults': analyzer.fault_curve(max_frames),
+        'lru_miss_ratio': analyzer.miss_ratio_curve(max_frames),
+    }
+    if fifo:
+        curve = fifo_fault_curve(pages, max_frames)
+        result['fifo_faults'] = curve
+        result['belady_anomalies'] = find_belady_anomalies(curve)
+    return result
@@ -0,0 +1,542 @@
+"""
+Backing Store y Dispositivo de Swap
+VOS (Virtual Operating System)
+
+Este módulo define el almacenamiento secundario donde la VM guarda las
+páginas desalojadas:
+- DictBackingStore: páginas en un diccionario en memoria (por defecto)
+- SwapFile: archivo de swap real con asignación de slots de página
+- SwapDevice: backing store de una VM sobre un SwapFile (pread/pwrite)
+- CompressedBackingStore: páginas comprimidas en memoria (estilo zram),
+  con las páginas en cero guardadas como un centinela
+
+Todas las variantes se usan como un diccionario página → bytes
+(`in`, `[]`, `del`) y reportan bytes leídos/escritos con get_stats().
+fork() crea el store de un proceso hijo que comparte las páginas
+guardadas sin copiarlas (copy-on-write).
+Con SwapDevice las páginas desalojadas viven en disco, así la suma de la
+memoria virtual simulada puede superar la RAM del host.
+"""
+
+import os
+import tempfile
+import threading
+import time
+import zlib
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import lzma
+except ImportError:  # Python compilado sin liblzma
+    lzma = None
+
+
+class DictBackingStore:
+    """
+    Backing store en memoria: diccionario página → bytes.
+
+    Es el comportamiento original del simulador. Las páginas se guardan
+    como bytes inmutables, así pueden compartirse sin copias.
+
+    Atributos:
+        pages: Diccionario página → contenido
+        bytes_read: Bytes servidos en page-ins
+        bytes_written: Bytes recibidos en write-backs
+    """
+
+    def __init__(self):
+        """Inicializa el store vacío."""
+        self.pages: Dict[int, bytes] = {}
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def __contains__(self, page_no: int) -> bool:
+        return page_no in self.pages
+
+    def __getitem__(self, page_no: int) -> bytes:
+        data = self.pages[page_no]
+        self.bytes_read += len(data)
+        return data
+
+    def __setitem__(self, page_no: int, data: bytes) -> None:
+        self.pages[page_no] = bytes(data)
+        self.bytes_written += len(data)
+
+    def __delitem__(self, page_no: int) -> None:
+        del self.pages[page_no]
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.pages)
+
+    def discard(self, page_no: int) -> None:
+        """Elimina una página si existe."""
+        self.pages.pop(page_no, None)
+
+    def clear(self) -> None:
+        """Elimina todas las páginas."""
+        self.pages.clear()
+
+    def fork(self) -> 'DictBackingStore':
+        """
+        Crea un store hijo con las mismas páginas.
+
+        Solo se copia el diccionario: los bytes son inmutables y quedan
+        compartidos hasta que uno de los dos reescriba la página.
+        """
+        child = DictBackingStore()
+        child.pages = dict(self.pages)
+        return child
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtiene estadísticas del store.
+
+        Returns:
+            Diccionario con páginas guardadas y bytes leídos/escritos
+        """
+        return {
+            'swap_pages': len(self.pages),
+            'swap_bytes_read': self.bytes_read,
+            'swap_bytes_written': self.bytes_written,
+        }
+
+    def close(self) -> None:
+        """Libera las páginas guardadas."""
+        self.pages.clear()
+
+
+class SwapFile:
+    """
+    Archivo de swap dividido en slots de tamaño de página.
+
+    Asigna slots libres (reutilizando los liberados) y lee/escribe cada
+    slot con os.pread/os.pwrite en su offset. Puede compartirse entre
+    varias VMs (ej: un swap por Kernel); cada una usa su propio SwapDevice.
+    Un slot puede tener varios dueños tras un fork: se cuentan las
+    referencias y solo se libera con la última.
+
+    Atributos:
+        page_size: Bytes por slot
+        path: Ruta del archivo (None si es temporal anónimo)
+        num_slots: Slots creados (tamaño del archivo / page_size)
+        free_slots: Slots liberados disponibles para reutilizar
+        refs: Referencias de los slots compartidos (los ausentes tienen 1)
+        owners: SwapDevices dueños del archivo (el que lo creó y sus hijos
+                de fork); el último en cerrarse cierra el archivo
+        bytes_read, bytes_written: E/S total realizada
+    """
+
+    def __init__(self, page_size: int, path: Optional[str] = None):
+        """
+        Args:
+            page_size: Bytes por slot (debe coincidir con el de las VMs)
+            path: Ruta del archivo de swap (None = archivo temporal que se
+                  borra al cerrarse)
+        """
+        self.page_size = page_size
+        self.path = path
+        self._file: BinaryIO = (
+            open(path, 'w+b') if path is not None else tempfile.TemporaryFile()
+        )
+        self._fd = self._file.fileno()
+        self._lock = threading.Lock()  # Solo para el fallback con seek
+        self.num_slots = 0
+        self.free_slots: List[int] = []
+        self.refs: Dict[int, int] = {}
+        self.owners = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def allocate(self) -> int:
+        """
+        Asigna un slot libre, extendiendo el archivo si hace falta.
+
+        Returns:
+            Número de slot
+        """
+        if self.free_slots:
+            return self.free_slots.pop()
+        slot = self.num_slots
+        self.num_slots += 1
+        return slot
+
+    def free(self, slot: int) -> None:
+        """Suelta una referencia a un slot; con la última vuelve a la lista de libres."""
+        refs = self.refs.get(slot)
+        if refs is None:
+            self.free_slots.append(slot)
+        elif refs > 2:
+            self.refs[slot] = refs - 1
+        else:
+            del self.refs[slot]
+
+    def share(self, slot: int) -> None:
+        """Agrega una referencia a un slot asignado (fork)."""
+        self.refs[slot] = self.refs.get(slot, 1) + 1
+
+    def is_shared(self, slot: int) -> bool:
+        """True si el slot tiene más de un dueño."""
+        return slot in self.refs
+
+    def read(self, slot: int) -> bytes:
+        """
+        Lee el contenido de un slot.
+
+        Args:
+            slot: Número de slot
+
+        Returns:
+            page_size bytes
+        """
+        offset = slot * self.page_size
+        if hasattr(os, 'pread'):
+            data = os.pread(self._fd, self.page_size, offset)
+        else:
+            with self._lock:
+                self._file.seek(offset)
+                data = self._file.read(self.page_size)
+        self.bytes_read += len(data)
+        return data
+
+    def write(self, slot: int, data: bytes) -> None:
+        """
+        Escribe una página completa en un slot.
+
+        Args:
+            slot: Número de slot
+            data: page_size bytes
+        """
+        offset = slot * self.page_size
+        if hasattr(os, 'pwrite'):
+            os.pwrite(self._fd, data, offset)
+        else:
+            with self._lock:
+                self._file.seek(offset)
+                self._file.write(data)
+        self.bytes_written += len(data)
+
+    @property
+    def slots_in_use(self) -> int:
+        """Slots actualmente asignados."""
+        return self.num_slots - len(self.free_slots)
+
+    def close(self) -> None:
+        """Cierra el archivo (el temporal se borra automáticamente)."""
+        self._file.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"SwapFile(path={self.path!r}, slots={self.slots_in_use}/{self.num_slots}, "
+            f"read={self.bytes_read}, written={self.bytes_written})"
+        )
+
+
+class SwapDevice:
+    """
+    Backing store de una VM respaldado por un SwapFile.
+
+    Mantiene el mapeo página → slot de la VM; los datos viven en el
+    archivo. Reescribir una página reutiliza su slot (o toma uno nuevo si
+    el slot está compartido tras un fork) y eliminarla lo libera.
+
+    Atributos:
+        swap_file: Archivo de swap subyacente (posiblemente compartido)
+        slots: Mapeo página → slot
+        bytes_read, bytes_written: E/S realizada por esta VM
+    """
+
+    def __init__(self, swap_file: Optional[SwapFile] = None, page_size: Optional[int] = None,
+                 path: Optional[str] = None):
+        """
+        Args:
+            swap_file: Archivo de swap a usar (None = crear uno propio)
+            page_size: Bytes por página, requerido si no se da swap_file
+            path: Ruta del archivo propio (None = temporal)
+
+        Raises:
+            ValueError: Si no se da swap_file ni page_size
+        """
+        self._owns_file = swap_file is None
+        if swap_file is None:
+            if page_size is None:
+                raise ValueError("SwapDevice requiere swap_file o page_size")
+            swap_file = SwapFile(page_size, path)
+            swap_file.owners += 1
+        self.swap_file = swap_file
+        self.slots: Dict[int, int] = {}
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def __contains__(self, page_no: int) -> bool:
+        return page_no in self.slots
+
+    def __getitem__(self, page_no: int) -> bytes:
+        data = self.swap_file.read(self.slots[page_no])
+        self.bytes_read += len(data)
+        return data
+
+    def __setitem__(self, page_no: int, data: bytes) -> None:
+        slot = self.slots.get(page_no)
+        if slot is not None and self.swap_file.is_shared(slot):
+            # Copy-on-write del slot: el otro dueño conserva el contenido viejo
+            self.swap_file.free(slot)
+            slot = None
+        if slot is None:
+            slot = self.slots[page_no] = self.swap_file.allocate()
+        self.swap_file.write(slot, data)
+        self.bytes_written += len(data)
+
+    def __delitem__(self, page_no: int) -> None:
+        self.swap_file.free(self.slots.pop(page_no))
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.slots)
+
+    def discard(self, page_no: int) -> None:
+        """Elimina una página si existe, liberando su slot."""
+        if page_no in self.slots:
+            del self[page_no]
+
+    def clear(self) -> None:
+        """Libera todos los slots de esta VM."""
+        for slot in self.slots.values():
+            self.swap_file.free(slot)
+        self.slots.clear()
+
+    def fork(self) -> 'SwapDevice':
+        """
+        Crea un dispositivo hijo sobre el mismo archivo que comparte los slots.
+
+        Cada slot gana una referencia. Si el archivo es propio, el hijo
+        también pasa a ser su dueño: el archivo sigue abierto mientras
+        alguno de los dos lo use.
+        """
+        child = SwapDevice(self.swap_file)
+        if self._owns_file:
+            child._owns_file = True
+            self.swap_file.owners += 1
+        for slot in self.slots.values():
+            self.swap_file.share(slot)
+        child.slots = dict(self.slots)
+        return child
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtiene estadísticas del dispositivo.
+
+        Returns:
+            Diccionario con páginas en swap, bytes leídos/escritos y slots
+            del archivo
+        """
+        return {
+            'swap_pages': len(self.slots),
+            'swap_bytes_read': self.bytes_read,
+            'swap_bytes_written': self.bytes_written,
+            'swap_file_slots': self.swap_file.num_slots,
+        }
+
+    def close(self) -> None:
+        """
+        Libera los slots de esta VM y cierra el archivo si es propio y
+        ningún otro dispositivo (hijo de fork) lo sigue usando.
+        """
+        self.clear()
+        if self._owns_file:
+            self._owns_file = False
+            self.swap_file.owners -= 1
+            if not self.swap_file.owners:
+                self.swap_file.close()
+
+
+# Algoritmos de compresión: nombre → (niveles válidos, fábrica de (comprimir, descomprimir))
+COMPRESSORS: Dict[str, Tuple[range, Callable[[int], Tuple[Callable, Callable]]]] = {
+    'zlib': (range(0, 10), lambda level: (
+        lambda data: zlib.compress(data, level),
+        zlib.decompress,
+    )),
+}
+if lzma is not None:
+    def _lzma_codec(level: int) -> Tuple[Callable, Callable]:
+        # Formato crudo: sin los ~60 bytes de encabezado de .xz por página.
+        # Diccionario chico: una página nunca lo llena, y el de los presets
+        # altos (8-64 MiB) haría que inicializar cada llamada domine el costo
+        filters = [{'id': lzma.FILTER_LZMA2, 'preset': level, 'dict_size': 1 << 16}]
+        return (
+            lambda data: lzma.compress(data, format=lzma.FORMAT_RAW, filters=filters),
+            lambda data: lzma.decompress(data, format=lzma.FORMAT_RAW, filters=filters),
+        )
+    COMPRESSORS['lzma'] = (range(0, 10), _lzma_codec)
+
+
+class CompressedBackingStore:
+    """
+    Backing store en memoria con páginas comprimidas (estilo zram).
+
+    Cada write-back se comprime con zlib o lzma y cada page-in se
+    descomprime. Una página toda en cero se guarda como el centinela None,
+    sin datos; una página que no se achica al comprimirla se guarda tal
+    cual (se reconoce porque mide una página entera).
+
+    Atributos:
+        algorithm: 'zlib' o 'lzma'
+        level: Nivel de compresión (0-9)
+        pages: Diccionario página → datos comprimidos, crudos o None (cero)
+        page_size: Bytes por página (se aprende en la primera escritura)
+        stored_bytes: Bytes ocupados por los datos guardados
+        zero_pages: Páginas guardadas como centinela de cero
+        bytes_read, bytes_written: Bytes sin comprimir servidos / recibidos
+        compress_seconds, decompress_seconds: Tiempo de CPU de (des)compresión
+    """
+
+    def __init__(self, algorithm: str = 'zlib', level: int = 1, page_size: Optional[int] = None):
+        """
+        Args:
+            algorithm: Algoritmo de compresión ('zlib' o 'lzma')
+            level: Nivel de compresión (0 = más rápido, 9 = más compacto)
+            page_size: Bytes por página (None = se aprende al escribir)
+
+        Raises:
+            ValueError: Si el algoritmo no está disponible o el nivel es inválido
+        """
+        try:
+            levels, codec = COMPRESSORS[algorithm]
+        except KeyError:
+            raise ValueError(
+                f"Algoritmo de compresión no disponible: {algorithm!r}. "
+                f"Opciones: {', '.join(COMPRESSORS)}"
+            ) from None
+        if level not in levels:
+            raise ValueError(f"Nivel de compresión inválido para {algorithm}: {level}")
+        self.algorithm = algorithm
+        self.level = level
+        self._compress, self._decompress = codec(level)
+        self.page_size = page_size
+        self._zero = bytes(page_size) if page_size is not None else None
+        self.pages: Dict[int, Optional[bytes]] = {}
+        self.stored_bytes = 0
+        self.zero_pages = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.compress_seconds = 0.0
+        self.decompress_seconds = 0.0
+
+    def __contains__(self, page_no: int) -> bool:
+        return page_no in self.pages
+
+    def __getitem__(self, page_no: int) -> bytes:
+        stored = self.pages[page_no]
+        page_size = self.page_size
+        self.bytes_read += page_size
+        if stored is None:
+            return self._zero
+        if len(stored) == page_size:
+            return stored
+        start = time.process_time()
+        data = self._decompress(stored)
+        self.decompress_seconds += time.process_time() - start
+        return data
+
+    def __setitem__(self, page_no: int, data: bytes) -> None:
+        if self.page_size is None:
+            self.page_size = len(data)
+            self._zero = bytes(len(data))
+        self._drop(page_no)
+        self.bytes_written += len(data)
+        if data == self._zero:
+            self.pages[page_no] = None
+            self.zero_pages += 1
+            return
+        start = time.process_time()
+        stored = self._compress(data)
+        self.compress_seconds += time.process_time() - start
+        if len(stored) >= len(data):
+            stored = bytes(data)
+        self.pages[page_no] = stored
+        self.stored_bytes += len(stored)
+
+    def _drop(self, page_no: int) -> None:
+        """Descuenta el espacio de una página guardada (si existe)."""
+        if page_no not in self.pages:
+            return
+        stored = self.pages.pop(page_no)
+        if stored is None:
+            self.zero_pages -= 1
+        else:
+            self.stored_bytes -= len(stored)
+
+    def __delitem__(self, page_no: int) -> None:
+        if page_no not in self.pages:
+            raise KeyError(page_no)
+        self._drop(page_no)
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.pages)
+
+    def discard(self, page_no: int) -> None:
+        """Elimina una página si existe."""
+        self._drop(page_no)
+
+    def clear(self) -> None:
+        """Elimina todas las páginas."""
+        self.pages.clear()
+        self.stored_bytes = 0
+        self.zero_pages = 0
+
+    def fork(self) -> 'CompressedBackingStore':
+        """
+        Crea un store hijo con las mismas páginas.
+
+        Los datos comprimidos son bytes inmutables: solo se copia el
+        diccionario y quedan compartidos hasta que uno reescriba la página.
+        """
+        child = CompressedBackingStore(self.algorithm, self.level, self.page_size)
+        child.pages = dict(self.pages)
+        child.stored_bytes = self.stored_bytes
+        child.zero_pages = self.zero_pages
+        return child
+
+    @property
+    def compression_ratio(self) -> float:
+        """Bytes sin comprimir / bytes guardados (las páginas cero no ocupan)."""
+        if not self.pages:
+            return 0.0
+        logical = len(self.pages) * self.page_size
+        return logical / self.stored_bytes if self.stored_bytes else float('inf')
+
+    def get_stats(self) -> Dict[str, Union[int, float, str]]:
+        """
+        Obtiene estadísticas del store.
+
+        Returns:
+            Diccionario con páginas guardadas, bytes leídos/escritos,
+            bytes ocupados, páginas cero, razón de compresión y tiempo de
+            CPU de compresión y descompresión
+        """
+        return {
+            'swap_pages': len(self.pages),
+            'swap_bytes_read': self.bytes_read,
+            'swap_bytes_written': self.bytes_written,
+            'swap_compression': f"{self.algorithm}-{self.level}",
+            'swap_stored_bytes': self.stored_bytes,
+            'swap_zero_pages': self.zero_pages,
+            'swap_compression_ratio': self.compression_ratio,
+            'swap_compress_seconds': self.compress_seconds,
+            'swap_decompress_seconds': self.decompress_seconds,
+        }
+
+    def close(self) -> None:
+        """Libera las páginas guardadas."""
+        self.clear()
+
+
+# Cualquiera de los backing stores (misma interfaz de diccionario)
+BackingStore = Union[DictBackingStore, SwapDevice, CompressedBackingStore]
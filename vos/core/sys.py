@@ -2,12 +2,30 @@
 Kernel del Sistema Operativo Virtual
 VOS (Virtual Operating System) - Lab 2
 
-Este módulo implementa el Kernel que gestiona procesos y scheduling.
+Este módulo implementa el Kernel que gestiona procesos y scheduling,
+en una o varias CPUs con colas de listos propias, y las llamadas
+bloqueantes (sleep, I/O) que despierta una rueda de timers.
 """
 
-from typing import Dict, List, Tuple, Callable, Optional
-from vos.core.process import PCB, State
-from vos.core.sched import Scheduler
+import copy
+import heapq
+import time
+from dataclasses import fields
+from typing import Dict, FrozenSet, Iterable, List, Tuple, Callable, Optional, Type, Union
+from vos.core.cpu import CPU
+from vos.core.frames import FramePool
+from vos.core.prefetch import Prefetcher
+from vos.core.process import PCB, State, ZombieRecord
+from vos.core.reclaim import ReclaimDaemon
+from vos.core.sched import BaseScheduler, make_scheduler
+from vos.core.shm import SharedSegment
+from vos.core.swap import BackingStore, CompressedBackingStore, SwapDevice, SwapFile
+from vos.core.timer import TimerWheel
+from vos.core.tlb import TLB
+from vos.core.trace import Tracer, get_default_tracer
+from vos.core.vm import (
+    VM, PhysicalMemory, PAGE_SIZE, VIRTUAL_PAGES, PHYSICAL_FRAMES, KERNEL_FRAMES,
+)
 
 
 class Kernel:
@@ -15,38 +33,179 @@ class Kernel:
     Kernel del Sistema Operativo Virtual.
     
     El Kernel es el núcleo del sistema operativo que gestiona:
-    - Creación de procesos (spawn)
-    - Scheduling de procesos (dispatch)
+    - Creación de procesos (spawn) y duplicación copy-on-write (fork)
+    - Segmentos de memoria compartida entre procesos (shm_*)
+    - Scheduling de procesos (dispatch) en una o varias CPUs, con afinidad
+      y balanceo de carga por work stealing
+    - Ejecución en lote de muchos time slices (run)
+    - Terminación y recolección de procesos (exit/wait): la memoria de un
+      proceso terminado se libera al instante y queda un registro compacto
     - Ejecución de programas de procesos
+    - Llamadas bloqueantes (sleep, io_request): WAITING → READY al vencer
+      su timer
     - Transiciones de estado de procesos
     - Tabla de procesos del sistema
     
     Conceptos implementados:
-        - Process Table: Diccionario de todos los PCBs del sistema
+        - Process Table: PCBs de los procesos vivos más los registros
+          zombie de los terminados que aún no se recogieron con wait
         - Current Running Process: Proceso actualmente ejecutándose
         - Time Slice Execution: Ejecutar una porción del programa por vez
         - Context Switch: Cambiar entre procesos
+        - Tiempo simulado: cada dispatch es un tick; si todos los procesos
+          están bloqueados, el tiempo salta al próximo timer
     
     Atributos:
-        procs: Tabla de procesos (pid → PCB)
-        sched: Scheduler Round-Robin
-        running: Proceso actualmente en ejecución (o None)
+        procs: Procesos vivos, no terminados (pid → PCB)
+        zombies: Procesos terminados sin recoger (pid → ZombieRecord)
+        keep_terminated: Conservar PCB y memoria de los terminados hasta wait
+        exited, reaped: Procesos terminados y recogidos
+        cpus: CPUs del sistema, cada una con su scheduler y cola de listos
+        sched: Scheduler de la CPU 0 (el único con una sola CPU)
+        running: Proceso en ejecución en la CPU 0 (o None)
         next_pid: Siguiente PID disponible
+        ticks: Tick actual del tiempo simulado
+        timers: Rueda de timers de los procesos bloqueados
+        sleeps, io_requests: Llamadas bloqueantes realizadas
+        skipped_ticks: Ticks saltados con todos los procesos bloqueados
+        tracer: Sink de eventos compartido por kernel, scheduler y VMs
+        frame_pool: RAM física compartida de la que asignan todas las VMs
+        reclaimer: Daemon de reclamo de marcos (o None)
+        shm_segments: Segmentos de memoria compartida (shm_id → segmento)
+        tlb_flushes: Flushes de TLB provocados por cambios de contexto
+                     (suma de todas las CPUs)
     """
     
-    def __init__(self):
-        """Inicializa el kernel con estructuras vacías."""
-        self.procs: Dict[int, PCB] = {}           # Tabla de procesos
-        self.sched: Scheduler = Scheduler()        # Scheduler Round-Robin
-        self.running: Optional[PCB] = None         # Proceso actualmente ejecutándose
+    def __init__(self, tracer: Optional[Tracer] = None, tlb_entries: int = 0,
+                 tlb_ways: Optional[int] = None, page_size: int = PAGE_SIZE,
+                 virtual_pages: int = VIRTUAL_PAGES,
+                 physical_frames: int = PHYSICAL_FRAMES,
+                 swap_file: Optional[SwapFile] = None,
+                 total_frames: int = KERNEL_FRAMES,
+                 replacement_scope: str = 'local',
+                 global_policy: str = 'fifo',
+                 prefetch_window: int = 0,
+                 low_watermark: int = 0,
+                 high_watermark: Optional[int] = None,
+                 swap_compression: Optional[str] = None,
+                 swap_compression_level: int = 1,
+                 scheduler: Union[str, BaseScheduler, Type[BaseScheduler]] = 'rr',
+                 num_cpus: int = 1,
+                 keep_terminated: bool = False):
+        """
+        Inicializa el kernel con estructuras vacías.
+        
+        Args:
+            tracer: Sink de eventos (None = tracer por defecto, silencioso).
+                    Se propaga al scheduler y a la VM de cada proceso.
+            tlb_entries: Entradas del TLB de cada proceso (0 = sin TLB)
+            tlb_ways: Asociatividad del TLB (None = totalmente asociativo)
+            page_size: Bytes por página de las VMs de los procesos
+            virtual_pages: Páginas del espacio de direcciones de cada proceso
+            physical_frames: Cuota de marcos de cada proceso (alcance local)
+            swap_file: Archivo de swap compartido por los procesos (None =
+                       backing store en memoria por proceso)
+            total_frames: Marcos de la RAM física compartida por todos los procesos
+            replacement_scope: 'local' (cada proceso desaloja sus páginas) o
+                               'global' (una política sobre toda la RAM)
+            global_policy: Política de reemplazo con alcance global
+            prefetch_window: Ventana máxima de read-ahead de cada proceso
+                             (0 = sin prefetch)
+            low_watermark: Marcos libres por debajo de los cuales el
+                           reclamador libera memoria (0 = sin reclamador)
+            high_watermark: Marcos libres que el reclamador restablece
+                            (None = el doble de low_watermark)
+            swap_compression: Algoritmo del backing store comprimido en
+                              memoria de cada proceso ('zlib' o 'lzma';
+                              None = sin compresión)
+            swap_compression_level: Nivel de compresión (0-9)
+            scheduler: Scheduler de las colas de listos ('rr', 'priority',
+                       'mlfq'), clase o instancia de BaseScheduler (una
+                       instancia solo con una CPU)
+            num_cpus: CPUs del sistema; cada una tiene su propia cola de
+                      listos construida con `scheduler`
+            keep_terminated: Conservar el PCB y la memoria de los procesos
+                             terminados hasta recogerlos con wait (para
+                             inspeccionarlos; por defecto se liberan al
+                             terminar)
+        
+        Raises:
+            ValueError: Si se piden a la vez swap_file y swap_compression,
+                        el scheduler es desconocido, num_cpus no es positivo
+                        o se da una instancia de scheduler para varias CPUs
+        """
+        if swap_file is not None and swap_compression is not None:
+            raise ValueError("Indicar swap_file o swap_compression, no ambos")
+        if num_cpus < 1:
+            raise ValueError(f"num_cpus inválido: {num_cpus}")
+        if num_cpus > 1 and isinstance(scheduler, BaseScheduler):
+            raise ValueError("Con varias CPUs indicar el scheduler por nombre o clase, no una instancia")
+        self.tracer: Tracer = tracer if tracer is not None else get_default_tracer()
+        self.procs: Dict[int, PCB] = {}           # Procesos vivos
+        self.zombies: Dict[int, ZombieRecord] = {}  # Terminados sin recoger
+        self.keep_terminated = keep_terminated
+        self._kept: Dict[int, PCB] = {}            # PCBs terminados conservados
+        self.exited = 0
+        self.reaped = 0
+        self.cpus: List[CPU] = [CPU(cpu_id, make_scheduler(scheduler, self.tracer))
+                                for cpu_id in range(num_cpus)]
+        self.sched: BaseScheduler = self.cpus[0].sched  # Cola de listos de la CPU 0
         self.next_pid: int = 1                     # Contador de PIDs
         
-        print("🖥️  Kernel inicializado")
-        print(f"   - Scheduler: Round-Robin")
-        print(f"   - Ready queue: vacía")
-        print(f"   - Procesos: 0\n")
+        # Tiempo simulado y procesos bloqueados hasta un tick
+        self.ticks: int = 0
+        self.timers = TimerWheel()
+        self.sleeps = 0
+        self.io_requests = 0
+        self.skipped_ticks = 0
+        
+        # Geometría de memoria de los procesos creados por este kernel
+        self.page_size = page_size
+        self.virtual_pages = virtual_pages
+        self.physical_frames = physical_frames
+        
+        # RAM física única: todas las VMs asignan marcos de este pool
+        self.frame_pool = FramePool(
+            PhysicalMemory(total_frames, page_size), replacement_scope, global_policy
+        )
+        
+        # Reclamador en segundo plano: corre entre time slices
+        self.reclaimer: Optional[ReclaimDaemon] = None
+        if low_watermark > 0:
+            self.reclaimer = ReclaimDaemon(self.frame_pool, low_watermark, high_watermark)
+        
+        # Swap: si hay archivo, cada proceso usa un SwapDevice sobre él; si
+        # no, un store en memoria (comprimido si se pidió)
+        self.swap_file = swap_file
+        self.swap_compression = swap_compression
+        self.swap_compression_level = swap_compression_level
+        
+        # Segmentos de memoria compartida
+        self.shm_segments: Dict[int, SharedSegment] = {}
+        self.next_shm_id: int = 1
+        
+        # TLB: sin ASIDs, se vacía al cambiar de proceso en cada CPU
+        self.tlb_entries = tlb_entries
+        self.tlb_ways = tlb_ways
+        
+        # Read-ahead: cada proceso tiene su propio prefetcher
+        self.prefetch_window = prefetch_window
+        
+        if self.tracer.events:
+            self.tracer.emit('kernel.init', scheduler=self.sched.name)
     
-    def spawn(self, prog: Callable, name: str = "") -> int:
+    @property
+    def running(self) -> Optional[PCB]:
+        """Proceso en ejecución en la CPU 0 (ver cpus para las demás)."""
+        return self.cpus[0].running
+    
+    @property
+    def tlb_flushes(self) -> int:
+        """Flushes de TLB por cambios de contexto en todas las CPUs."""
+        return sum(cpu.tlb_flushes for cpu in self.cpus)
+    
+    def spawn(self, prog: Callable, name: str = "", policy: str = 'fifo',
+              priority: int = 0, affinity: Optional[Iterable[int]] = None) -> int:
         """
         Crea un nuevo proceso.
         
@@ -61,10 +220,21 @@ class Kernel:
             prog: Función que implementa el programa del proceso
                   Firma: prog(kernel, pcb) -> None
             name: Nombre descriptivo del proceso (opcional)
+            policy: Política de reemplazo de páginas de la VM del proceso
+                    ('fifo', 'lru', 'clock', 'lfu', 'arc'); con alcance
+                    global se usa la política del kernel
+            priority: Prioridad del proceso (menor valor = mayor prioridad;
+                      la usa PriorityScheduler)
+            affinity: CPUs en las que puede ejecutar (None = cualquiera)
         
         Returns:
             PID del proceso creado
+        
+        Raises:
+            ValueError: Si la afinidad está vacía o nombra CPUs inexistentes
         """
+        affinity = self._check_affinity(affinity)
+        
         # Asignar PID único
         pid = self.next_pid
         self.next_pid += 1
@@ -73,37 +243,380 @@ class Kernel:
         pcb = PCB(
             pid=pid,
             state=State.NEW,
+            vm=VM(page_size=self.page_size, virtual_pages=self.virtual_pages,
+                  physical_frames=self.physical_frames, policy=policy,
+                  tlb=self._make_tlb(), prefetcher=self._make_prefetcher(),
+                  backing_store=self._make_backing_store(),
+                  tracer=self.tracer, frame_pool=self.frame_pool),
             prog=prog,
-            name=name if name else f"Process-{pid}"
+            name=name if name else f"Process-{pid}",
+            priority=priority,
+            affinity=affinity
         )
         
         # Agregar a tabla de procesos
         self.procs[pid] = pcb
         
-        print(f"\n🆕 SPAWN: Creando proceso {pid} ({pcb.name})")
-        print(f"   - Estado inicial: {State.NEW.value}")
-        print(f"   - VM propia: ✓")
+        tracer = self.tracer
+        if tracer.events:
+            tracer.emit('kernel.spawn', pid=pid, name=pcb.name)
         
         # Transición NEW → READY
         pcb.state = State.READY
-        self.sched.add(pcb)
+        self._enqueue(pcb)
         
-        print(f"   - Transición: NEW → READY")
-        print(f"   - Agregado al scheduler")
+        if tracer.events:
+            tracer.emit('kernel.spawn_ready', pid=pid)
         
         return pid
     
+    def fork(self, pid: int, prog: Optional[Callable] = None, name: str = "") -> int:
+        """
+        Duplica un proceso con memoria copy-on-write.
+        
+        El hijo comparte los marcos residentes y las páginas del backing
+        store del padre; cada página se copia recién en la primera
+        escritura de cualquiera de los dos (ver VM.fork). El estado que el
+        programa guarda en el PCB (atributos extra, ej: contadores) se
+        copia, así el hijo continúa desde el mismo punto que el padre.
+        
+        Args:
+            pid: PID del proceso padre
+            prog: Programa del hijo (None = el mismo que el padre)
+            name: Nombre del hijo (vacío = derivado del padre)
+        
+        Returns:
+            PID del proceso hijo
+        
+        Raises:
+            ValueError: Si el proceso padre no existe (o ya terminó)
+        """
+        parent = self.procs.get(pid)
+        if parent is None:
+            raise ValueError(f"Proceso {pid} no existe")
+        
+        child_pid = self.next_pid
+        self.next_pid += 1
+        pcb = PCB(
+            pid=child_pid,
+            state=State.NEW,
+            vm=parent.vm.fork(tlb=self._make_tlb(), prefetcher=self._make_prefetcher()),
+            prog=prog if prog is not None else parent.prog,
+            name=name if name else f"{parent.name}-child-{child_pid}",
+            priority=parent.priority,
+            affinity=parent.affinity
+        )
+        
+        # Estado del programa guardado en el PCB fuera de los campos propios
+        pcb_fields = {f.name for f in fields(PCB)}
+        for attr, value in vars(parent).items():
+            if attr not in pcb_fields:
+                setattr(pcb, attr, copy.copy(value))
+        
+        self.procs[child_pid] = pcb
+        
+        tracer = self.tracer
+        if tracer.events:
+            tracer.emit('kernel.fork', pid=child_pid, name=pcb.name, parent=pid,
+                        shared=len(pcb.vm.frame_to_page))
+        
+        # Transición NEW → READY
+        pcb.state = State.READY
+        self._enqueue(pcb)
+        
+        if tracer.events:
+            tracer.emit('kernel.spawn_ready', pid=child_pid)
+        
+        return child_pid
+    
+    def _check_affinity(self, affinity: Optional[Iterable[int]]) -> Optional[FrozenSet[int]]:
+        """Normaliza una afinidad (ValueError si está vacía o fuera de rango)."""
+        if affinity is None:
+            return None
+        affinity = frozenset(affinity)
+        if not affinity or not affinity <= set(range(len(self.cpus))):
+            raise ValueError(
+                f"Afinidad inválida: {sorted(affinity)} (CPUs 0..{len(self.cpus) - 1})"
+            )
+        return affinity
+    
+    def set_affinity(self, pid: int, affinity: Optional[Iterable[int]]) -> None:
+        """
+        Cambia las CPUs en las que puede ejecutar un proceso.
+        
+        Si el proceso espera en la cola de una CPU que ya no le corresponde,
+        se mueve a una permitida cuando esa CPU lo elige.
+        
+        Args:
+            pid: Proceso
+            affinity: CPUs permitidas (None = cualquiera)
+        
+        Raises:
+            ValueError: Si el proceso no existe o la afinidad no es válida
+        """
+        pcb = self.procs.get(pid)
+        if pcb is None:
+            raise ValueError(f"Proceso {pid} no existe")
+        pcb.affinity = self._check_affinity(affinity)
+    
+    def _enqueue(self, pcb: PCB) -> None:
+        """
+        Agrega un proceso READY a la cola de una CPU.
+        
+        Vuelve a la CPU donde ejecutó por última vez (su TLB y caché siguen
+        ahí) si su afinidad lo permite; si no, a la CPU permitida con menos
+        procesos listos, y el scheduler de la CPU anterior lo olvida.
+        """
+        cpus = self.cpus
+        if len(cpus) == 1:
+            cpu = cpus[0]
+        elif pcb.cpu is not None and cpus[pcb.cpu].allows(pcb):
+            cpu = cpus[pcb.cpu]
+        else:
+            cpu = min((cpu for cpu in cpus if cpu.allows(pcb)), key=lambda cpu: cpu.sched.size())
+            if pcb.cpu is not None:
+                cpus[pcb.cpu].sched.forget(pcb)
+        cpu.sched.add(pcb)
+    
+    def _make_tlb(self) -> Optional[TLB]:
+        """Crea el TLB de un proceso nuevo según la configuración del kernel."""
+        if self.tlb_entries <= 0:
+            return None
+        return TLB(self.tlb_entries, self.tlb_ways)
+    
+    def _make_backing_store(self) -> Optional[BackingStore]:
+        """Crea el backing store de un proceso o segmento nuevo (None = en memoria)."""
+        if self.swap_file is not None:
+            return SwapDevice(self.swap_file)
+        if self.swap_compression is not None:
+            return CompressedBackingStore(self.swap_compression, self.swap_compression_level,
+                                          self.page_size)
+        return None
+    
+    def _make_prefetcher(self) -> Optional[Prefetcher]:
+        """Crea el prefetcher de un proceso nuevo según la configuración del kernel."""
+        if self.prefetch_window <= 0:
+            return None
+        return Prefetcher(max_window=self.prefetch_window,
+                          initial_window=min(2, self.prefetch_window))
+    
+    def shm_create(self, num_pages: int, name: str = "") -> int:
+        """
+        Crea un segmento de memoria compartida.
+        
+        Sus páginas no residentes van al swap del kernel si hay uno, o a
+        un store en memoria propio del segmento.
+        
+        Args:
+            num_pages: Páginas del segmento
+            name: Nombre descriptivo (vacío = "shm-<id>")
+        
+        Returns:
+            Identificador del segmento
+        
+        Raises:
+            ValueError: Si num_pages no es positivo
+        """
+        shm_id = self.next_shm_id
+        segment = SharedSegment(
+            shm_id, num_pages, self.page_size, name,
+            backing_store=self._make_backing_store()
+        )
+        self.next_shm_id += 1
+        self.shm_segments[shm_id] = segment
+        
+        if self.tracer.events:
+            self.tracer.emit('kernel.shm_create', shm_id=shm_id, name=segment.name,
+                             pages=num_pages)
+        return shm_id
+    
+    def _get_segment(self, shm_id: int) -> SharedSegment:
+        """Busca un segmento por id (ValueError si no existe)."""
+        segment = self.shm_segments.get(shm_id)
+        if segment is None:
+            raise ValueError(f"Segmento {shm_id} no existe")
+        return segment
+    
+    def _get_vm(self, pid: int) -> VM:
+        """Busca la VM de un proceso por PID (ValueError si no existe)."""
+        pcb = self.procs.get(pid)
+        if pcb is None:
+            raise ValueError(f"Proceso {pid} no existe")
+        return pcb.vm
+    
+    def shm_attach(self, pid: int, shm_id: int, vaddr: int) -> int:
+        """
+        Adjunta un segmento al espacio de direcciones de un proceso.
+        
+        Todos los procesos que adjuntan el mismo segmento ven los mismos
+        marcos: lo que uno escribe el otro lo lee sin copias, en la
+        dirección en la que cada uno lo adjuntó.
+        
+        Args:
+            pid: Proceso destino
+            shm_id: Segmento a adjuntar
+            vaddr: Dirección virtual inicial (alineada a página)
+        
+        Returns:
+            Dirección virtual del segmento en el proceso
+        
+        Raises:
+            ValueError: Si el proceso o el segmento no existen, o el rango
+                        no es válido (ver VM.attach_segment)
+        """
+        vm = self._get_vm(pid)
+        vm.attach_segment(self._get_segment(shm_id), vaddr)
+        
+        if self.tracer.events:
+            self.tracer.emit('kernel.shm_attach', shm_id=shm_id, pid=pid, vaddr=vaddr)
+        return vaddr
+    
+    def shm_detach(self, pid: int, shm_id: int) -> None:
+        """
+        Desadjunta un segmento de un proceso.
+        
+        Args:
+            pid: Proceso
+            shm_id: Segmento adjunto al proceso
+        
+        Raises:
+            ValueError: Si el proceso o el segmento no existen, o el
+                        segmento no está adjunto al proceso
+        """
+        self._get_vm(pid).detach_segment(self._get_segment(shm_id))
+        
+        if self.tracer.events:
+            self.tracer.emit('kernel.shm_detach', shm_id=shm_id, pid=pid)
+    
+    def shm_destroy(self, shm_id: int) -> None:
+        """
+        Destruye un segmento sin adjuntos, liberando su store.
+        
+        Args:
+            shm_id: Segmento a destruir
+        
+        Raises:
+            ValueError: Si el segmento no existe o sigue adjunto a algún proceso
+        """
+        segment = self._get_segment(shm_id)
+        if segment.attachments:
+            raise ValueError(
+                f"Segmento {shm_id} sigue adjunto a {len(segment.attachments)} espacio(s) "
+                f"de direcciones"
+            )
+        segment.backing_store.clear()
+        del self.shm_segments[shm_id]
+        
+        if self.tracer.events:
+            self.tracer.emit('kernel.shm_destroy', shm_id=shm_id)
+    
+    def sleep(self, pcb: PCB, ticks: int) -> None:
+        """
+        Syscall bloqueante: el proceso duerme una cantidad de ticks.
+        
+        Lo llama el programa durante su time slice. El proceso pasa a
+        WAITING y vuelve a READY en el tick actual + ticks.
+        
+        Args:
+            pcb: Proceso en ejecución que se bloquea
+            ticks: Ticks a dormir (>= 0)
+        
+        Raises:
+            ValueError: Si el proceso no está RUNNING o ticks es negativo
+        """
+        due = self._block(pcb, ticks)
+        self.sleeps += 1
+        if self.tracer.events:
+            self.tracer.emit('kernel.sleep', pid=pcb.pid, ticks=ticks, due=due)
+    
+    def io_request(self, pcb: PCB, latency: int) -> None:
+        """
+        Syscall bloqueante: el proceso inicia una operación de I/O simulada.
+        
+        El proceso pasa a WAITING y la operación completa (READY) en el
+        tick actual + latency.
+        
+        Args:
+            pcb: Proceso en ejecución que se bloquea
+            latency: Latencia del dispositivo en ticks (>= 0)
+        
+        Raises:
+            ValueError: Si el proceso no está RUNNING o latency es negativa
+        """
+        due = self._block(pcb, latency)
+        self.io_requests += 1
+        if self.tracer.events:
+            self.tracer.emit('kernel.io', pid=pcb.pid, latency=latency, due=due)
+    
+    def _block(self, pcb: PCB, ticks: int) -> int:
+        """Bloquea un proceso en ejecución hasta un tick; retorna el tick."""
+        if pcb.state != State.RUNNING:
+            raise ValueError(
+                f"Solo un proceso RUNNING puede bloquearse. Estado actual: {pcb.state.value}"
+            )
+        if ticks < 0:
+            raise ValueError(f"Ticks de bloqueo inválidos: {ticks}")
+        due = self.ticks + ticks
+        pcb.state = State.WAITING
+        self.timers.schedule(due, pcb)
+        return due
+    
+    def _wake_due(self) -> None:
+        """
+        Despierta los procesos cuyos timers vencieron hasta el tick actual
+        (WAITING → READY). Si no hay nada para ejecutar y quedan procesos
+        bloqueados, salta el tiempo al próximo vencimiento.
+        """
+        timers = self.timers
+        woken = timers.advance(self.ticks)
+        if not woken and not self._runnable():
+            due = timers.next_due()
+            skipped = due - self.ticks
+            if self.tracer.events:
+                self.tracer.emit('kernel.skip', start=self.ticks, end=due)
+            self.ticks = due
+            self.skipped_ticks += skipped
+            for cpu in self.cpus:
+                cpu.idle += skipped
+            woken = timers.advance(due)
+        
+        tracer = self.tracer
+        for pcb in woken:
+            # Un proceso terminado mientras esperaba ya no vuelve
+            if pcb.state != State.WAITING:
+                continue
+            if tracer.events:
+                tracer.emit('kernel.wake', pid=pcb.pid, name=pcb.name)
+            pcb.state = State.READY
+            self._enqueue(pcb)
+    
+    def _runnable(self) -> bool:
+        """True si algún proceso está listo o sigue RUNNING para el próximo slice."""
+        for cpu in self.cpus:
+            running = cpu.running
+            if (running is not None and running.state == State.RUNNING) or cpu.sched.size():
+                return True
+        return False
+    
     def dispatch(self) -> None:
         """
-        Ejecuta un time slice del scheduler Round-Robin.
+        Ejecuta un time slice en cada CPU.
         
         Algoritmo:
-        1. Si hay un proceso running que aún está RUNNING:
+        0. Despertar los procesos bloqueados cuyo timer venció; si todos
+           están bloqueados, saltar el tiempo al próximo vencimiento.
+           Si hay reclamador, ejecutar una pasada (entre slices, fuera de
+           la ruta crítica de los accesos)
+        
+        Luego, para cada CPU en orden:
+        
+        1. Si la CPU tiene un proceso running que aún está RUNNING:
            - Requearlo (RUNNING → READY)
-           - Agregarlo de vuelta al scheduler
+           - Agregarlo de vuelta a la cola de esa CPU
         
-        2. Pedir al scheduler el siguiente proceso:
-           - Si None: CPU idle, terminar
+        2. Pedir al scheduler de la CPU el siguiente proceso:
+           - Si la cola está vacía, robar procesos de la CPU más cargada
+           - Si aun así no hay: CPU idle
            - Si hay proceso: ejecutarlo
         
         3. Transicionar el proceso a RUNNING
@@ -112,67 +625,318 @@ class Kernel:
            - Llamar a pcb.prog(kernel, pcb)
            - El programa puede cambiar su estado a TERMINATED o WAITING
         
-        5. Actualizar estadísticas (cpu_time)
+        5. Actualizar estadísticas (cpu_time) y avisar al scheduler
+           (on_slice), que puede cambiar la prioridad del proceso
         
         Nota: El proceso puede cambiar su propio estado durante la ejecución.
-              El Kernel solo reencola procesos que permanecen RUNNING.
+              El Kernel solo reencola procesos que permanecen RUNNING; uno
+              que pasa a WAITING vuelve a READY solo si se bloqueó con
+              sleep o io_request.
         """
-        print(f"\n{'='*70}")
-        print(f"⏰ DISPATCH: Iniciando time slice")
-        print(f"{'='*70}")
+        tracer = self.tracer
+        if tracer.events:
+            tracer.emit('kernel.dispatch')
+        
+        # Tiempo simulado: despertar procesos cuyo timer venció
+        if self.timers:
+            self._wake_due()
+        
+        # Entre slices: el reclamador libera marcos y limpia páginas sucias
+        if self.reclaimer is not None:
+            reclaimed, cleaned = self.reclaimer.run()
+            if (reclaimed or cleaned) and tracer.events:
+                tracer.emit('kernel.reclaim', reclaimed=reclaimed, cleaned=cleaned,
+                            free=len(self.frame_pool.memory.free_frames))
+        
+        for cpu in self.cpus:
+            self._dispatch_cpu(cpu)
+        self.ticks += 1
+    
+    def _dispatch_cpu(self, cpu: CPU) -> None:
+        """Ejecuta un time slice en una CPU (pasos 1-5 de dispatch)."""
+        tracer = self.tracer
+        if tracer.events and len(self.cpus) > 1:
+            tracer.emit('kernel.cpu', cpu=cpu.cpu_id)
         
         # PASO 1: Reencolar proceso anterior si aún está RUNNING
-        if self.running is not None and self.running.state == State.RUNNING:
-            print(f"\n🔄 Proceso {self.running.pid} ({self.running.name}) aún RUNNING")
-            print(f"   - Transición: RUNNING → READY")
-            self.running.state = State.READY
-            self.sched.add(self.running)
+        running = cpu.running
+        if running is not None and running.state == State.RUNNING:
+            if tracer.events:
+                tracer.emit('kernel.requeue', pid=running.pid, name=running.name)
+            running.state = State.READY
+            if cpu.allows(running):
+                cpu.sched.add(running)     # Vuelve a la cola de esta CPU
+            else:
+                self._enqueue(running)
         
         # PASO 2: Obtener siguiente proceso del scheduler
-        print(f"\n📋 Scheduler state: {self.sched}")
-        pcb = self.sched.next()
+        # (repr del scheduler es O(ready queue): solo se construye si se traza)
+        if tracer.events:
+            tracer.emit('kernel.sched_state', sched=repr(cpu.sched))
+        pcb = cpu.sched.next()
+        if pcb is None or pcb.affinity is not None:
+            pcb = self._next(cpu, pcb)
         
         if pcb is None:
-            print(f"\n💤 CPU IDLE: No hay procesos listos para ejecutar")
-            self.running = None
+            if tracer.events:
+                tracer.emit('kernel.idle')
+            cpu.running = None
+            cpu.idle += 1
             return
         
         # PASO 3: Marcar proceso como RUNNING
-        self.running = pcb
+        cpu.running = pcb
+        cpu.busy += 1
         pcb.state = State.RUNNING
-        print(f"\n▶️  Ejecutando proceso {pcb.pid} ({pcb.name})")
-        print(f"   - Estado: READY → RUNNING")
-        print(f"   - CPU time usado hasta ahora: {pcb.cpu_time} slices")
+        
+        # Cambio de contexto: las traducciones del proceso anterior no sirven
+        if cpu.last_pid != pcb.pid or pcb.cpu != cpu.cpu_id:
+            cpu.switch_to(pcb)
+        if tracer.events:
+            tracer.emit('kernel.run', pid=pcb.pid, name=pcb.name, cpu_time=pcb.cpu_time)
         
         # PASO 4: Ejecutar UN PASO del programa
         try:
-            print(f"\n🔧 Ejecutando programa del proceso {pcb.pid}...")
             pcb.prog(self, pcb)
             
             # PASO 5: Actualizar estadísticas
             pcb.cpu_time += 1
             
-            print(f"\n✅ Time slice completado para proceso {pcb.pid}")
-            print(f"   - Estado después de ejecución: {pcb.state.value}")
-            print(f"   - CPU time total: {pcb.cpu_time} slices")
+            if tracer.events:
+                tracer.emit('kernel.slice_done', pid=pcb.pid,
+                            state=pcb.state.value, cpu_time=pcb.cpu_time)
             
         except Exception as e:
-            print(f"\n❌ ERROR en proceso {pcb.pid}: {e}")
+            error = str(e)
+            if tracer.events:
+                tracer.emit('kernel.error', pid=pcb.pid, error=error)
             pcb.state = State.TERMINATED
-            print(f"   - Proceso terminado forzosamente")
+        else:
+            error = None
+        
+        cpu.sched.on_slice(pcb)
+        if pcb.state == State.TERMINATED:
+            self._exit(pcb, error)
     
-    def ps(self) -> List[Tuple[int, str]]:
+    def _exit(self, pcb: PCB, error: Optional[str] = None) -> None:
+        """
+        Saca de la tabla de vivos a un proceso que terminó y deja su registro
+        zombie. Su memoria (marcos, backing store, segmentos) se libera ya,
+        salvo con keep_terminated.
+        """
+        pid = pcb.pid
+        del self.procs[pid]
+        self.zombies[pid] = ZombieRecord(pid, pcb.name, pcb.cpu_time, pcb.priority,
+                                         self.ticks, error)
+        self.exited += 1
+        if self.keep_terminated:
+            self._kept[pid] = pcb
+            return
+        if self.tracer.events:
+            self.tracer.emit('kernel.exit', pid=pid, name=pcb.name)
+        pcb.vm.release()
+    
+    def wait(self, pid: Optional[int] = None) -> Optional[ZombieRecord]:
+        """
+        Recoge un proceso terminado (como waitpid con WNOHANG).
+        
+        El registro zombie sale de la tabla de procesos; con
+        keep_terminated, recién ahora se libera la memoria del proceso.
+        
+        Args:
+            pid: Proceso a recoger (None = el zombie más antiguo)
+        
+        Returns:
+            Registro de salida del proceso, o None si el proceso aún no
+            terminó (o, con pid None, si no hay zombies)
+        
+        Raises:
+            ValueError: Si el proceso no existe o ya fue recogido
+        """
+        if pid is None:
+            if not self.zombies:
+                return None
+            pid = next(iter(self.zombies))
+        elif pid not in self.zombies:
+            if pid in self.procs:
+                return None
+            raise ValueError(f"Proceso {pid} no existe")
+        record = self.zombies.pop(pid)
+        pcb = self._kept.pop(pid, None)
+        if pcb is not None:
+            pcb.vm.release()
+        self.reaped += 1
+        if self.tracer.events:
+            self.tracer.emit('kernel.reap', pid=pid, name=record.name, cpu_time=record.cpu_time)
+        return record
+    
+    def _next(self, cpu: CPU, pcb: Optional[PCB]) -> Optional[PCB]:
+        """
+        Completa la elección del siguiente proceso de una CPU: si el
+        scheduler no tenía ninguno (pcb None), roba de otras CPUs; si el
+        elegido no tiene afinidad con la CPU, lo mueve y elige otro.
+        """
+        sched = cpu.sched
+        while True:
+            if pcb is None:
+                if len(self.cpus) == 1 or not self._steal(cpu):
+                    return None
+            elif cpu.allows(pcb):
+                return pcb
+            else:
+                # Su afinidad cambió mientras esperaba: pasa a una CPU permitida
+                sched.forget(pcb)
+                self._enqueue(pcb)
+            pcb = sched.next()
+    
+    def _steal(self, thief: CPU) -> int:
+        """
+        Work stealing: una CPU sin procesos listos roba la mitad de la cola
+        de la CPU más cargada (entre los procesos con afinidad con ella).
+        
+        Returns:
+            Procesos robados
+        """
+        victims = sorted((cpu for cpu in self.cpus if cpu is not thief),
+                         key=lambda cpu: cpu.sched.size(), reverse=True)
+        for victim in victims:
+            ready = victim.sched.size()
+            if not ready:
+                break
+            stolen = 0
+            for _ in range((ready + 1) // 2):
+                pcb = victim.sched.steal(thief.allows)
+                if pcb is None:
+                    break
+                thief.sched.add(pcb)
+                stolen += 1
+            if stolen:
+                thief.steals += stolen
+                if self.tracer.events:
+                    self.tracer.emit('kernel.steal', cpu=thief.cpu_id, victim=victim.cpu_id,
+                                     count=stolen)
+                return stolen
+        return 0
+    
+    def run(self, max_ticks: Optional[int] = None, deadline: Optional[float] = None,
+            sample_every: int = 0,
+            on_sample: Optional[Callable[['Kernel'], None]] = None) -> Dict:
+        """
+        Ejecuta time slices en un loop hasta que el sistema queda ocioso,
+        se agota un presupuesto de ticks o se alcanza un deadline.
+        
+        Es la alternativa a llamar dispatch() desde un loop del driver:
+        no consulta ps() ni imprime por slice (el tracer sigue emitiendo
+        si está activo), y el reloj de pared se consulta solo cada 256
+        dispatches. Para observar la simulación se usa un hook de muestreo.
+        
+        Args:
+            max_ticks: Ticks simulados a ejecutar como máximo (None = sin límite)
+            deadline: Segundos de reloj de pared como máximo (None = sin límite)
+            sample_every: Cada cuántos ticks simulados llamar a on_sample
+                          (0 = nunca)
+            on_sample: Hook de muestreo, recibe el kernel
+        
+        Returns:
+            Diccionario con dispatches, slices ejecutados (en todas las
+            CPUs), ticks simulados, segundos transcurridos, slices/segundo
+            y motivo de fin ('idle', 'ticks' o 'deadline')
+        
+        Raises:
+            ValueError: Si max_ticks, deadline o sample_every son negativos
+        """
+        if (max_ticks is not None and max_ticks < 0) or (deadline is not None and deadline < 0) \
+                or sample_every < 0:
+            raise ValueError(
+                f"Límites de run inválidos: max_ticks={max_ticks}, deadline={deadline}, "
+                f"sample_every={sample_every}"
+            )
+        dispatch = self.dispatch
+        cpus = self.cpus
+        timers = self.timers
+        running_state = State.RUNNING
+        start_ticks = self.ticks
+        end_ticks = start_ticks + max_ticks if max_ticks is not None else None
+        next_sample = start_ticks + sample_every if on_sample is not None and sample_every else None
+        start_busy = sum(cpu.busy for cpu in self.cpus)
+        
+        start = time.perf_counter()
+        stop = start + deadline if deadline is not None else None
+        dispatches = 0
+        reason = 'idle'
+        while True:
+            # Ocioso: nada corriendo ni listo y ningún proceso por despertar
+            # (las colas solo se miran si ninguna CPU sigue con un proceso)
+            for cpu in cpus:
+                running = cpu.running
+                if running is not None and running.state is running_state:
+                    break
+            else:
+                if not timers and not any(cpu.sched.size() for cpu in cpus):
+                    reason = 'idle'
+                    break
+            if end_ticks is not None and self.ticks >= end_ticks:
+                reason = 'ticks'
+                break
+            if stop is not None and not dispatches & 255 and time.perf_counter() >= stop:
+                reason = 'deadline'
+                break
+            dispatch()
+            dispatches += 1
+            if next_sample is not None and self.ticks >= next_sample:
+                on_sample(self)
+                next_sample = self.ticks + sample_every
+        elapsed = time.perf_counter() - start
+        
+        slices = sum(cpu.busy for cpu in self.cpus) - start_busy
+        stats = {
+            'dispatches': dispatches,
+            'slices': slices,
+            'ticks': self.ticks - start_ticks,
+            'elapsed': elapsed,
+            'slices_per_sec': slices / elapsed if elapsed > 0 else 0.0,
+            'reason': reason,
+        }
+        if self.tracer.events:
+            self.tracer.emit('kernel.run_done', **stats)
+        return stats
+    
+    def _table(self, state: Optional[State] = None) -> Iterable[Tuple[int, Union[PCB, ZombieRecord]]]:
+        """
+        Entradas (pid, PCB o registro zombie) de la tabla de procesos, en
+        orden de PID.
+        
+        Los vivos ya están en orden de PID (los PIDs crecen); solo se
+        ordenan los zombies, que están en orden de terminación. Con un
+        estado, solo se recorre la parte de la tabla que puede tenerlo.
+        """
+        kept = self._kept
+        zombies = (sorted((pid, kept.get(pid, record)) for pid, record in self.zombies.items())
+                   if state is None or state == State.TERMINATED else ())
+        if state == State.TERMINATED:
+            return zombies
+        live = self.procs.items()
+        if state is not None:
+            return [(pid, pcb) for pid, pcb in live if pcb.state == state]
+        if not zombies:
+            return live
+        return heapq.merge(live, zombies, key=lambda item: item[0])
+    
+    def ps(self, state: Optional[State] = None) -> List[Tuple[int, str]]:
         """
         Retorna tabla de procesos estilo comando 'ps'.
         
-        Muestra información básica de todos los procesos en el sistema,
-        similar al comando 'ps' de Unix/Linux.
+        Muestra información básica de los procesos vivos y de los zombies
+        sin recoger, similar al comando 'ps' de Unix/Linux.
+        
+        Args:
+            state: Mostrar solo los procesos en este estado (None = todos)
         
         Returns:
             Lista de tuplas (pid, estado_nombre)
             Ejemplo: [(1, 'RUNNING'), (2, 'READY'), (3, 'TERMINATED')]
         """
-        return [(pid, pcb.state.value) for pid, pcb in sorted(self.procs.items())]
+        return [(pid, pcb.state.value) for pid, pcb in self._table(state)]
     
     def ps_detailed(self) -> List[Dict]:
         """
@@ -182,17 +946,60 @@ class Kernel:
             Lista de diccionarios con información completa de cada proceso
         """
         result = []
-        for pid, pcb in sorted(self.procs.items()):
+        for pid, pcb in self._table():
+            alive = isinstance(pcb, PCB)
             result.append({
                 'pid': pid,
                 'name': pcb.name,
                 'state': pcb.state.value,
                 'cpu_time': pcb.cpu_time,
-                'priority': pcb.priority
+                'priority': pcb.priority,
+                'cpu': pcb.cpu if alive else None,
+                'rss': len(pcb.vm.frame_to_page) if alive else 0
             })
         return result
     
-    def get_process(self, pid: int) -> Optional[PCB]:
+    def get_memory_stats(self) -> Dict:
+        """
+        Obtiene estadísticas de la RAM compartida.
+        
+        Returns:
+            Estadísticas del pool de marcos más el resident set de cada
+            proceso (clave 'rss': pid → páginas residentes) y las de cada
+            segmento compartido (clave 'shm': shm_id → estadísticas); con
+            reclamador, también las suyas
+        """
+        stats = self.frame_pool.get_stats()
+        stats['rss'] = {pid: len(pcb.vm.frame_to_page) for pid, pcb in self._table()
+                        if isinstance(pcb, PCB)}
+        stats['shm'] = {shm_id: segment.get_stats()
+                        for shm_id, segment in sorted(self.shm_segments.items())}
+        if self.reclaimer is not None:
+            stats.update(self.reclaimer.get_stats())
+        return stats
+    
+    def get_cpu_stats(self) -> List[Dict]:
+        """
+        Obtiene estadísticas de cada CPU.
+        
+        Returns:
+            Lista (una entrada por CPU) con slices ocupados y ociosos,
+            utilización, flushes de TLB, migraciones, robos y procesos listos
+        """
+        return [cpu.get_stats() for cpu in self.cpus]
+    
+    def ready_count(self) -> int:
+        """Procesos listos en las colas de todas las CPUs."""
+        return sum(cpu.sched.size() for cpu in self.cpus)
+    
+    def _running_label(self) -> str:
+        """Proceso en ejecución de cada CPU, para las representaciones legibles."""
+        if len(self.cpus) == 1:
+            return str(self.running.pid if self.running else None)
+        return ", ".join(f"CPU{cpu.cpu_id}={cpu.running.pid if cpu.running else None}"
+                         for cpu in self.cpus)
+    
+    def get_process(self, pid: int) -> Optional[Union[PCB, ZombieRecord]]:
         """
         Obtiene el PCB de un proceso por su PID.
         
@@ -200,9 +1007,13 @@ class Kernel:
             pid: Process ID
             
         Returns:
-            PCB del proceso, o None si no existe
+            PCB del proceso; si terminó y no fue recogido, su registro
+            zombie (o su PCB, con keep_terminated); None si no existe
         """
-        return self.procs.get(pid)
+        pcb = self.procs.get(pid)
+        if pcb is None:
+            pcb = self._kept.get(pid) or self.zombies.get(pid)
+        return pcb
     
     def print_process_table(self) -> None:
         """Imprime tabla de procesos formateada."""
@@ -212,19 +1023,19 @@ class Kernel:
         print(f"{'PID':<5} {'NAME':<20} {'STATE':<12} {'CPU TIME':<10}")
         print(f"{'-'*70}")
         
-        for pcb in sorted(self.procs.values(), key=lambda p: p.pid):
-            print(f"{pcb.pid:<5} {pcb.name:<20} {pcb.state.value:<12} {pcb.cpu_time:<10}")
+        for pid, pcb in self._table():
+            print(f"{pid:<5} {pcb.name:<20} {pcb.state.value:<12} {pcb.cpu_time:<10}")
         
         print(f"{'-'*70}")
-        print(f"Total procesos: {len(self.procs)}")
-        print(f"En ready queue: {self.sched.size()}")
-        print(f"Running: {self.running.pid if self.running else 'None'}")
+        print(f"Total procesos: {len(self.procs) + len(self.zombies)}")
+        print(f"En ready queue: {self.ready_count()}")
+        print(f"Running: {self._running_label()}")
         print(f"{'='*70}\n")
     
     def __repr__(self) -> str:
         """Representación legible del kernel."""
         return (
-            f"Kernel(procs={len(self.procs)}, "
-            f"ready={self.sched.size()}, "
-            f"running={self.running.pid if self.running else None})"
+            f"Kernel(procs={len(self.procs)}, zombies={len(self.zombies)}, "
+            f"ready={self.ready_count()}, "
+            f"running={self._running_label()})"
         )
\ No newline at end of file
@@ -0,0 +1,216 @@
+"""
+Rueda de Timers Jerárquica
+VOS (Virtual Operating System)
+
+Este módulo implementa una rueda de timers jerárquica (Varghese & Lauck,
+como la de Linux) para los eventos con vencimiento del Kernel, ej:
+despertar procesos dormidos o completar I/O simulado:
+- Nivel 0: un bucket por tick para los próximos `slots` ticks
+- Nivel L: cada bucket cubre slots^L ticks; al llegar el tiempo a su
+  rango, sus timers se redistribuyen (cascada) en los niveles inferiores
+- Agregar un timer es O(1); avanzar un tick es O(niveles) más los timers
+  que vencen o bajan de nivel
+- Saltos de tiempo: advance() salta directo al próximo bucket no vacío
+  del nivel más bajo con timers en vez de recorrer tick por tick
+- next_due() da el próximo vencimiento, para saltar el tiempo simulado
+  cuando no hay nada que ejecutar
+
+Los timers que superan el alcance de la rueda (slots^niveles ticks) van
+a una lista de desborde que se reubica en cada vuelta completa de la rueda.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class TimerWheel:
+    """
+    Rueda de timers jerárquica.
+
+    Atributos:
+        slots: Buckets por nivel (potencia de 2)
+        levels: Niveles de la rueda
+        now: Tick actual
+        wheels: Buckets de cada nivel; cada bucket es una lista de
+                (vencimiento, item)
+        overflow: Timers (vencimiento, item) fuera del alcance de la rueda
+        scheduled: Timers agregados
+        expired: Timers vencidos
+        cascades: Timers redistribuidos a un nivel inferior
+    """
+
+    def __init__(self, slots: int = 64, levels: int = 4, now: int = 0):
+        """
+        Args:
+            slots: Buckets por nivel (potencia de 2)
+            levels: Niveles de la rueda
+            now: Tick inicial
+
+        Raises:
+            ValueError: Si slots no es potencia de 2 mayor que 1 o levels < 1
+        """
+        if slots < 2 or slots & (slots - 1) or levels < 1:
+            raise ValueError(f"Geometría de rueda inválida: {slots} slots, {levels} niveles")
+        self.slots = slots
+        self.levels = levels
+        self.now = now
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self.wheels: List[List[List[Tuple[int, Any]]]] = [
+            [[] for _ in range(slots)] for _ in range(levels)
+        ]
+        self.overflow: List[Tuple[int, Any]] = []
+        self._counts = [0] * (levels + 1)   # Timers en cada nivel y en el desborde
+        self._due: List[Any] = []       # Vencidos al agregarlos (sin entregar)
+        self.scheduled = 0
+        self.expired = 0
+        self.cascades = 0
+
+    def __len__(self) -> int:
+        """Timers pendientes."""
+        return self.scheduled - self.expired
+
+    def schedule(self, expires: int, item: Any) -> None:
+        """
+        Agrega un timer.
+
+        Args:
+            expires: Tick de vencimiento (si ya pasó, vence en el próximo advance)
+            item: Objeto que advance() entrega al vencer
+        """
+        self.scheduled += 1
+        self._place(expires, item)
+
+    def _place(self, expires: int, item: Any) -> None:
+        """Ubica un timer en el nivel que corresponde a su distancia al tick actual."""
+        delta = expires - self.now
+        if delta <= 0:
+            self._due.append(item)
+            return
+        bits = self._bits
+        level = 0
+        while level < self.levels and delta >> (bits * (level + 1)):
+            level += 1
+        if level == self.levels:
+            self.overflow.append((expires, item))
+        else:
+            self.wheels[level][(expires >> (bits * level)) & self._mask].append((expires, item))
+        self._counts[level] += 1
+
+    def advance(self, until: int) -> List[Any]:
+        """
+        Avanza el tiempo hasta un tick y entrega los timers vencidos.
+
+        Args:
+            until: Tick destino (si no es posterior al actual, solo entrega
+                   los vencidos pendientes)
+
+        Returns:
+            Items de los timers vencidos, en orden de vencimiento
+        """
+        expired = self._due
+        self._due = []
+        counts, mask = self._counts, self._mask
+        while self.now < until:
+            # Nivel más bajo con timers: hasta su próximo bucket no vacío (o
+            # hasta que el nivel da la vuelta y cascadea el superior) no pasa nada
+            level = next((level for level, count in enumerate(counts) if count), None)
+            if level is None:
+                self.now = until
+                break
+            shift = self._bits * level
+            target = (self.now >> shift) + 1
+            if level < self.levels:
+                wheel = self.wheels[level]
+                while target & mask and not wheel[target & mask]:
+                    target += 1
+            target <<= shift
+            if target > until:
+                self.now = until
+                break
+            self.now = target
+            self._tick(expired)
+        self.expired += len(expired)
+        return expired
+
+    def _tick(self, expired: List[Any]) -> None:
+        """Procesa la llegada a self.now: cascadas y vencimientos del nivel 0."""
+        now, bits, mask = self.now, self._bits, self._mask
+        if self.overflow and not now & ((1 << (bits * self.levels)) - 1):
+            # Vuelta completa: el desborde se reubica (lo que entra en rango baja)
+            overflow = self.overflow
+            self.overflow = []
+            self._counts[self.levels] = 0
+            for expires, item in overflow:
+                self._place(expires, item)
+        for level in range(self.levels - 1, 0, -1):
+            shift = bits * level
+            if now & ((1 << shift) - 1):
+                continue
+            bucket = self.wheels[level][(now >> shift) & mask]
+            if bucket:
+                self.wheels[level][(now >> shift) & mask] = []
+                self._counts[level] -= len(bucket)
+                self.cascades += len(bucket)
+                for expires, item in bucket:
+                    self._place(expires, item)
+        if self._due:
+            expired.extend(self._due)
+            self._due = []
+        bucket = self.wheels[0][now & mask]
+        if bucket:
+            self.wheels[0][now & mask] = []
+            self._counts[0] -= len(bucket)
+            expired.extend(item for _, item in bucket)
+
+    def next_due(self) -> Optional[int]:
+        """
+        Tick del próximo vencimiento.
+
+        En cada nivel, el primer bucket no vacío a partir del actual tiene
+        los timers más próximos de ese nivel; el mínimo entre niveles es el
+        próximo vencimiento. Los buckets cuyo rango empieza después del
+        mejor candidato ya encontrado no se recorren.
+
+        Returns:
+            Tick del timer más próximo (el actual si hay vencidos sin
+            entregar), o None si no hay timers
+        """
+        if self._due:
+            return self.now
+        best: Optional[int] = None
+        bits, mask = self._bits, self._mask
+        for level, wheel in enumerate(self.wheels):
+            if not self._counts[level]:
+                continue
+            shift = bits * level
+            current = self.now >> shift
+            for offset in range(1, self.slots + 1):
+                bucket = wheel[(current + offset) & mask]
+                if bucket:
+                    if best is None or (current + offset) << shift < best:
+                        due = min(expires for expires, _ in bucket)
+                        if best is None or due < best:
+                            best = due
+                    break
+        if self.overflow:
+            due = min(expires for expires, _ in self.overflow)
+            if best is None or due < best:
+                best = due
+        return best
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtiene estadísticas de la rueda.
+
+        Returns:
+            Diccionario con timers pendientes, agregados, vencidos y cascadas
+        """
+        return {
+            'timers_pending': len(self),
+            'timers_scheduled': self.scheduled,
+            'timers_expired': self.expired,
+            'timer_cascades': self.cascades,
+        }
+
+    def __repr__(self) -> str:
+        return f"TimerWheel(now={self.now}, pending={len(self)}, slots={self.slots}, levels={self.levels})"
@@ -0,0 +1,176 @@
+"""
+Translation Lookaside Buffer (TLB) Simulado
+VOS (Virtual Operating System)
+
+Este módulo implementa un TLB configurable que cachea traducciones
+página virtual → entrada de tabla de páginas:
+- Tamaño y asociatividad configurables (directo, n-way, totalmente asociativo)
+- Reemplazo LRU o aleatorio dentro de cada conjunto
+- Invalidación por página y flush completo (cambio de contexto)
+- Estadísticas de hits/misses y tiempo efectivo de acceso
+
+El TLB guarda la propia entrada PTEntry, así un hit puede actualizar los
+bits dirty/referenced sin recorrer la tabla de páginas.
+"""
+
+import random
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from vos.core.vm import PTEntry
+
+
+class TLB:
+    """
+    TLB con conjuntos asociativos.
+
+    La página p se ubica en el conjunto p % num_sets; cada conjunto guarda
+    hasta `ways` traducciones.
+
+    Atributos:
+        entries: Capacidad total (número de traducciones)
+        ways: Asociatividad (traducciones por conjunto)
+        num_sets: Número de conjuntos (entries // ways)
+        replacement: 'lru' o 'random'
+        hits, misses: Contadores de búsquedas
+        flushes: Número de flush completos
+        evictions: Traducciones desplazadas por falta de espacio
+    """
+
+    def __init__(self, entries: int = 16, ways: Optional[int] = None,
+                 replacement: str = 'lru', seed: Optional[int] = None):
+        """
+        Args:
+            entries: Número total de traducciones
+            ways: Asociatividad (None = totalmente asociativo)
+            replacement: Política dentro de cada conjunto ('lru' o 'random')
+            seed: Semilla para el reemplazo aleatorio
+
+        Raises:
+            ValueError: Si la geometría o la política no son válidas
+        """
+        if ways is None:
+            ways = entries
+        if entries <= 0 or ways <= 0 or entries % ways != 0:
+            raise ValueError(
+                f"Geometría de TLB inválida: {entries} entradas, {ways} vías"
+            )
+        if replacement not in ('lru', 'random'):
+            raise ValueError(f"Reemplazo de TLB desconocido: {replacement!r}")
+
+        self.entries = entries
+        self.ways = ways
+        self.num_sets = entries // ways
+        self.replacement = replacement
+        self._lru = replacement == 'lru'
+        self._rng = random.Random(seed)
+        self._sets: List[OrderedDict] = [OrderedDict() for _ in range(self.num_sets)]
+
+        self.hits = 0
+        self.misses = 0
+        self.flushes = 0
+        self.evictions = 0
+
+    def lookup(self, page_no: int) -> Optional['PTEntry']:
+        """
+        Busca la traducción de una página.
+
+        Args:
+            page_no: Número de página virtual
+
+        Returns:
+            PTEntry cacheada (hit) o None (miss)
+        """
+        tlb_set = self._sets[page_no % self.num_sets]
+        entry = tlb_set.get(page_no)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self._lru:
+            tlb_set.move_to_end(page_no)
+        return entry
+
+    def insert(self, page_no: int, entry: 'PTEntry') -> None:
+        """
+        Inserta una traducción, desplazando otra si el conjunto está lleno.
+
+        Args:
+            page_no: Número de página virtual
+            entry: Entrada de tabla de páginas (residente)
+        """
+        tlb_set = self._sets[page_no % self.num_sets]
+        if page_no not in tlb_set and len(tlb_set) >= self.ways:
+            if self._lru:
+                tlb_set.popitem(last=False)
+            else:
+                del tlb_set[self._rng.choice(list(tlb_set))]
+            self.evictions += 1
+        tlb_set[page_no] = entry
+
+    def invalidate(self, page_no: int) -> None:
+        """Elimina la traducción de una página (si existe)."""
+        self._sets[page_no % self.num_sets].pop(page_no, None)
+
+    def flush(self) -> None:
+        """Elimina todas las traducciones (ej: cambio de contexto)."""
+        for tlb_set in self._sets:
+            tlb_set.clear()
+        self.flushes += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """Fracción de búsquedas resueltas por el TLB."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def effective_access_time(self, page_faults: int = 0, tlb_ns: float = 1.0,
+                              mem_ns: float = 100.0, fault_ns: float = 8_000_000.0,
+                              walk_levels: int = 1) -> float:
+        """
+        Calcula el tiempo efectivo de acceso a memoria (EAT) en nanosegundos.
+
+        EAT = h·(t + m) + (1-h)·(t + L·m + m) + (faults/accesos)·fault_ns
+        donde h es la tasa de hits y L los niveles recorridos en un miss.
+
+        Args:
+            page_faults: Page faults ocurridos en los mismos accesos
+            tlb_ns: Latencia de búsqueda en el TLB
+            mem_ns: Latencia de un acceso a memoria
+            fault_ns: Costo de servir un page fault
+            walk_levels: Accesos a memoria por recorrido de tabla de páginas
+
+        Returns:
+            Tiempo efectivo por acceso (ns)
+        """
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        h = self.hits / lookups
+        eat = h * (tlb_ns + mem_ns) + (1 - h) * (tlb_ns + walk_levels * mem_ns + mem_ns)
+        return eat + (page_faults / lookups) * fault_ns
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Obtiene estadísticas del TLB.
+
+        Returns:
+            Diccionario con hits, misses, tasa de hits, flushes y desplazamientos
+        """
+        return {
+            'tlb_hits': self.hits,
+            'tlb_misses': self.misses,
+            'tlb_hit_rate': self.hit_rate,
+            'tlb_flushes': self.flushes,
+            'tlb_evictions': self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return sum(len(tlb_set) for tlb_set in self._sets)
+
+    def __repr__(self) -> str:
+        return (
+            f"TLB(entries={self.entries}, ways={self.ways}, "
+            f"hit_rate={self.hit_rate:.2%})"
+        )
@@ -0,0 +1,357 @@
+"""
+Trazado Estructurado de Eventos
+VOS (Virtual Operating System)
+
+Este módulo reemplaza los print() de las rutas críticas de la VM, el
+Scheduler y el Kernel por una capa de eventos con niveles:
+- SILENT: no se emite nada (costo casi nulo en la ruta crítica)
+- EVENTS: solo eventos "raros" (page faults, desalojos, spawn, dispatch)
+- VERBOSE: además cada lectura/escritura individual
+
+Sinks disponibles:
+- NullTracer: modo silencioso (por defecto)
+- MemoryTracer: guarda los eventos como tuplas en un buffer acotado
+- JSONLinesTracer: escribe eventos como JSON-lines con buffer
+- ConsoleTracer: renderiza los eventos con el formato legible original
+
+Convención en la ruta crítica: el código emisor pregunta primero por
+`tracer.verbose` o `tracer.events` (atributos booleanos) y solo entonces
+construye los campos del evento. Así el modo silencioso cuesta una
+lectura de atributo por acceso.
+"""
+
+import json
+from collections import deque
+from enum import IntEnum
+from typing import Any, Dict, IO, Iterable, Optional, Tuple, Union
+
+
+class TraceLevel(IntEnum):
+    """
+    Niveles de trazado, ordenados de menor a mayor detalle.
+
+    SILENT: ningún evento
+    EVENTS: eventos de control (faults, desalojos, scheduling, kernel)
+    VERBOSE: además cada acceso a memoria (read/write)
+    """
+    SILENT = 0
+    EVENTS = 1
+    VERBOSE = 2
+
+
+class Tracer:
+    """
+    Interfaz base de un sink de eventos.
+
+    Las subclases implementan `emit`. El nivel se puede cambiar en
+    caliente; las banderas `events` y `verbose` se recalculan al hacerlo.
+
+    Atributos:
+        level: Nivel de trazado actual
+        events: True si se emiten eventos de nivel EVENTS
+        verbose: True si se emiten eventos de nivel VERBOSE
+    """
+
+    def __init__(self, level: TraceLevel = TraceLevel.VERBOSE):
+        """Inicializa el tracer con el nivel indicado."""
+        self.level = level
+
+    @property
+    def level(self) -> TraceLevel:
+        """Nivel de trazado actual."""
+        return self._level
+
+    @level.setter
+    def level(self, value: TraceLevel) -> None:
+        self._level = TraceLevel(value)
+        self.events = self._level >= TraceLevel.EVENTS
+        self.verbose = self._level >= TraceLevel.VERBOSE
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """
+        Registra un evento.
+
+        Args:
+            event: Nombre del evento (ej: 'vm.page_fault')
+            **fields: Campos del evento (valores simples serializables)
+        """
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Vacía cualquier buffer pendiente (no-op por defecto)."""
+
+    def close(self) -> None:
+        """Cierra el sink liberando recursos."""
+        self.flush()
+
+
+class NullTracer(Tracer):
+    """
+    Tracer silencioso: descarta todo.
+
+    Es el tracer por defecto. Su nivel es SILENT, por lo que el código
+    emisor ni siquiera llega a llamar a `emit`.
+    """
+
+    def __init__(self):
+        """Inicializa el tracer en modo SILENT."""
+        super().__init__(TraceLevel.SILENT)
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """Descarta el evento."""
+
+
+class MemoryTracer(Tracer):
+    """
+    Tracer que guarda eventos en memoria como tuplas (evento, campos).
+
+    Útil para inspeccionar una ejecución desde código. El buffer es
+    acotado: al superar `capacity` se descartan los eventos más antiguos.
+
+    Atributos:
+        records: Buffer de tuplas (event, fields)
+        dropped: Eventos descartados por desborde del buffer
+    """
+
+    def __init__(self, level: TraceLevel = TraceLevel.EVENTS,
+                 capacity: Optional[int] = 100_000):
+        """
+        Args:
+            level: Nivel de trazado
+            capacity: Máximo de eventos retenidos (None = ilimitado)
+        """
+        super().__init__(level)
+        self.records: deque = deque(maxlen=capacity)
+        self.dropped = 0
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """Agrega el evento al buffer."""
+        records = self.records
+        if records.maxlen is not None and len(records) == records.maxlen:
+            self.dropped += 1
+        records.append((event, fields))
+
+    def count(self, event: str) -> int:
+        """Cuenta los eventos retenidos con un nombre dado."""
+        return sum(1 for name, _ in self.records if name == event)
+
+
+class JSONLinesTracer(Tracer):
+    """
+    Tracer que escribe un objeto JSON por línea.
+
+    Los eventos se acumulan en un buffer y se serializan en bloque cada
+    `buffer_size` eventos (o al llamar a flush/close), minimizando la E/S.
+    Cada línea tiene la forma {"seq": n, "event": "...", ...campos}.
+    """
+
+    def __init__(self, target: Union[str, IO[str]],
+                 level: TraceLevel = TraceLevel.EVENTS,
+                 buffer_size: int = 4096):
+        """
+        Args:
+            target: Ruta de archivo o stream de texto ya abierto
+            level: Nivel de trazado
+            buffer_size: Eventos a acumular antes de escribir
+        """
+        super().__init__(level)
+        if isinstance(target, str):
+            self._stream = open(target, 'w', encoding='utf-8')
+            self._owns_stream = True
+        else:
+            self._stream = target
+            self._owns_stream = False
+        self.buffer_size = buffer_size
+        self._buffer: list = []
+        self.seq = 0
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """Agrega el evento al buffer, escribiendo si se llenó."""
+        self._buffer.append((self.seq, event, fields))
+        self.seq += 1
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Serializa y escribe los eventos pendientes."""
+        if not self._buffer:
+            return
+        dumps = json.dumps
+        lines = [
+            dumps({'seq': seq, 'event': event, **fields}, default=str)
+            for seq, event, fields in self._buffer
+        ]
+        self._stream.write('\n'.join(lines) + '\n')
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """Vacía el buffer y cierra el archivo si lo abrió este tracer."""
+        self.flush()
+        if self._owns_stream:
+            self._stream.close()
+
+
+# ============================================================================
+# RENDER LEGIBLE (formato original de los labs)
+# ============================================================================
+
+# Plantillas por evento. Cada una se formatea con los campos del evento.
+_TEMPLATES: Dict[str, str] = {
+    # VM (Lab 1)
+    'vm.read': "\n🔍 READ: vaddr={vaddr} → página={page}, offset={offset}",
+    'vm.read_done': "   ✓ Leído valor {value} del marco {frame}[{offset}]",
+    'vm.write': "\n✍️  WRITE: vaddr={vaddr} → página={page}, offset={offset}, value={value}",
+    'vm.write_done': "   ✓ Escrito valor {value} al marco {frame}[{offset}] (página marcada sucia)",
+    'vm.page_fault': "⚠️  PAGE FAULT: página {page} no está en RAM",
+    'vm.ram_full': "💾 RAM llena - ejecutando reemplazo {policy}",
+    'vm.victim': "   Víctima seleccionada: página {page}",
+    'vm.write_back': "   ✍️  Página {page} está sucia - escribiendo a disco",
+    'vm.clean_victim': "   ✓ Página {page} limpia - sin write-back necesario",
+    'vm.page_in': "   📖 Cargando página {page} desde backing store al marco {frame}",
+    'vm.page_new': "   🆕 Inicializando nueva página {page} con ceros en marco {frame}",
+    'vm.page_loaded': "   ✅ Página {page} ahora en marco {frame}",
+    'vm.prefetch': "   📦 Read-ahead: {count} páginas precargadas tras la página {page} (stride {stride}, ventana {window})",
+    'vm.clean': "   🧽 Página {page} escrita a disco en segundo plano (ahora limpia)",
+    'vm.cow': "   🐄 Copy-on-write: página {page} copiada del marco {old} al marco {frame}",
+    'vm.release': "   🧹 Espacio de direcciones liberado: {frames} marcos devueltos",
+    'vm.shm_map': "   🔗 Página {page} mapeada al marco {frame} del segmento {segment}",
+    'vm.read_bulk': "\n📚 READ: vaddr={vaddr}, {length} bytes",
+    'vm.write_bulk': "\n📝 WRITE: vaddr={vaddr}, {length} bytes",
+    'vm.translate_bulk': "\n🔎 TRANSLATE: {count} direcciones en {pages} páginas",
+    'vm.fill': "\n🧱 FILL: vaddr={vaddr}, {length} bytes con valor {value}",
+    'vm.copy': "\n📋 COPY: {length} bytes de vaddr={src} a vaddr={dst}",
+    'vm.zero_page': "\n🧹 ZERO_PAGE: Llenando página {page} con ceros",
+    'vm.zero_done': "   ✓ Página {page} (marco {frame}) llena con ceros",
+    # Scheduler (Lab 2)
+    'sched.add': "   📋 Scheduler: Proceso {pid} ({name}) agregado a ready queue",
+    'sched.next': "   🎯 Scheduler: Seleccionado proceso {pid} ({name}) para ejecutar",
+    'sched.level': "   🪜 Scheduler: Proceso {pid} ({name}) pasa al nivel {level}",
+    'sched.boost': "   🚀 Scheduler: Boost - {count} procesos postergados vuelven al nivel 0",
+    # Kernel (Lab 2)
+    'kernel.init': (
+        "🖥️  Kernel inicializado\n"
+        "   - Scheduler: {scheduler}\n"
+        "   - Ready queue: vacía\n"
+        "   - Procesos: 0\n"
+    ),
+    'kernel.spawn': (
+        "\n🆕 SPAWN: Creando proceso {pid} ({name})\n"
+        "   - Estado inicial: NEW\n"
+        "   - VM propia: ✓"
+    ),
+    'kernel.spawn_ready': "   - Transición: NEW → READY\n   - Agregado al scheduler",
+    'kernel.fork': (
+        "\n🍴 FORK: Proceso {parent} crea el proceso {pid} ({name})\n"
+        "   - Páginas compartidas copy-on-write: {shared}"
+    ),
+    'kernel.shm_create': "\n🧩 SHM: Segmento {shm_id} ({name}) creado con {pages} páginas",
+    'kernel.shm_attach': "   🔗 Segmento {shm_id} adjuntado al proceso {pid} en vaddr=0x{vaddr:x}",
+    'kernel.shm_detach': "   ✂️  Segmento {shm_id} desadjuntado del proceso {pid}",
+    'kernel.shm_destroy': "   🗑️  Segmento {shm_id} destruido",
+    'kernel.reclaim': "   ♻️  Reclamo: {reclaimed} marcos liberados, {cleaned} páginas limpiadas ({free} marcos libres)",
+    'kernel.sleep': "   😴 Proceso {pid} duerme {ticks} ticks (RUNNING → WAITING hasta el tick {due})",
+    'kernel.io': "   💾 Proceso {pid} inicia I/O de {latency} ticks (RUNNING → WAITING hasta el tick {due})",
+    'kernel.wake': "\n🔔 Proceso {pid} ({name}) despierta\n   - Transición: WAITING → READY",
+    'kernel.skip': "\n⏩ Todos los procesos bloqueados: el tiempo salta del tick {start} al {end}",
+    'kernel.dispatch': "\n{rule}\n⏰ DISPATCH: Iniciando time slice\n{rule}",
+    'kernel.requeue': (
+        "\n🔄 Proceso {pid} ({name}) aún RUNNING\n"
+        "   - Transición: RUNNING → READY"
+    ),
+    'kernel.cpu': "\n🧮 CPU {cpu}",
+    'kernel.steal': "   🤝 CPU {cpu}: roba {count} proceso(s) de la cola de la CPU {victim}",
+    'kernel.sched_state': "\n📋 Scheduler state: {sched}",
+    'kernel.idle': "\n💤 CPU IDLE: No hay procesos listos para ejecutar",
+    'kernel.run': (
+        "\n▶️  Ejecutando proceso {pid} ({name})\n"
+        "   - Estado: READY → RUNNING\n"
+        "   - CPU time usado hasta ahora: {cpu_time} slices\n"
+        "\n🔧 Ejecutando programa del proceso {pid}..."
+    ),
+    'kernel.slice_done': (
+        "\n✅ Time slice completado para proceso {pid}\n"
+        "   - Estado después de ejecución: {state}\n"
+        "   - CPU time total: {cpu_time} slices"
+    ),
+    'kernel.run_done': (
+        "\n🏁 RUN terminado ({reason}): {slices} slices en {ticks} ticks, "
+        "{elapsed:.3f}s ({slices_per_sec:,.0f} slices/s)"
+    ),
+    'kernel.exit': "\n🪦 Proceso {pid} ({name}) terminado: memoria liberada, queda como zombie",
+    'kernel.reap': "   ⚰️  Proceso {pid} ({name}) recogido con wait ({cpu_time} slices de CPU)",
+    'kernel.error': (
+        "\n❌ ERROR en proceso {pid}: {error}\n"
+        "   - Proceso terminado forzosamente"
+    ),
+}
+
+
+class ConsoleTracer(Tracer):
+    """
+    Tracer que imprime los eventos con el formato legible original.
+
+    Reproduce la salida con emojis de los Labs 1 y 2. Es opt-in: los
+    scripts de demostración lo activan explícitamente.
+    """
+
+    def __init__(self, level: TraceLevel = TraceLevel.VERBOSE,
+                 stream: Optional[IO[str]] = None):
+        """
+        Args:
+            level: Nivel de trazado
+            stream: Stream de salida (None = sys.stdout al momento de emitir)
+        """
+        super().__init__(level)
+        self.stream = stream
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """Formatea el evento con su plantilla y lo imprime."""
+        template = _TEMPLATES.get(event)
+        if template is None:
+            text = f"[{event}] " + ", ".join(f"{k}={v}" for k, v in fields.items())
+        else:
+            text = template.format(rule='=' * 70, **fields)
+        print(text, file=self.stream)
+
+
+# Tracer compartido por defecto: silencioso
+NULL_TRACER = NullTracer()
+
+# Tracer usado por componentes creados sin tracer explícito
+_default_tracer: Tracer = NULL_TRACER
+
+
+def get_default_tracer() -> Tracer:
+    """Retorna el tracer usado por VM/Scheduler/Kernel sin tracer explícito."""
+    return _default_tracer
+
+
+def set_default_tracer(tracer: Optional[Tracer]) -> Tracer:
+    """
+    Cambia el tracer por defecto para los componentes creados después.
+
+    Args:
+        tracer: Nuevo tracer por defecto (None = silencioso)
+
+    Returns:
+        El tracer por defecto anterior
+    """
+    global _default_tracer
+    previous = _default_tracer
+    _default_tracer = tracer if tracer is not None else NULL_TRACER
+    return previous
+
+
+def render_records(records: Iterable[Tuple[str, Dict[str, Any]]],
+                   tracer: Tracer) -> None:
+    """
+    Re-emite eventos grabados (ej: por MemoryTracer) en otro tracer.
+
+    Permite grabar en silencio y renderizar después con ConsoleTracer.
+
+    Args:
+        records: Iterable de tuplas (event, fields)
+        tracer: Tracer destino
+    """
+    for event, fields in records:
+        tracer.emit(event, **fields)
@@ -5,21 +5,39 @@ VOS (Virtual Operating System) - Lab 1
 Este módulo implementa un simulador completo de memoria virtual que incluye:
 - Paginación con tabla de páginas
 - Manejo de page faults
-- Reemplazo de páginas FIFO
+- Reemplazo de páginas con política seleccionable (FIFO, LRU, CLOCK, LFU, ARC)
 - Backing store simulado
 - Gestión de dirty bits
 """
 
+import mmap
+from array import array
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from vos.core.frames import FramePool
+from vos.core.prefetch import Prefetcher
+from vos.core.replacement import ReplacementPolicy
+from vos.core.shm import SharedSegment
+from vos.core.swap import BackingStore, DictBackingStore
+from vos.core.tlb import TLB
+from vos.core.trace import Tracer, get_default_tracer
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional (solo acelera translate_many)
+    np = None
 
 # ============================================================================
 # CONSTANTES DEL SISTEMA
 # ============================================================================
 
+# Valores por defecto; cada VM puede usar su propia geometría
 PAGE_SIZE = 256          # Bytes por página/marco
 VIRTUAL_PAGES = 16       # Número total de páginas virtuales
 PHYSICAL_FRAMES = 8      # Número de marcos físicos en RAM
+KERNEL_FRAMES = 64       # Marcos de la RAM compartida por los procesos de un Kernel
 
 
 # ============================================================================
@@ -38,37 +56,55 @@ class PTEntry:
         frame: Número de marco físico donde reside la página (None si no está en RAM)
         present: Bit de validez - True si la página está actualmente en memoria física
         dirty: Bit sucio - True si la página fue modificada (necesita write-back)
+        referenced: Bit de referencia - True si la página fue accedida desde la
+                    última vez que la política de reemplazo lo limpió (CLOCK)
+        cow: Copy-on-write - True si el marco se comparte tras un fork y debe
+             copiarse antes de la primera escritura
     """
     frame: Optional[int] = None
     present: bool = False
     dirty: bool = False
+    referenced: bool = False
+    cow: bool = False
 
 
 class PageTable:
     """
     Tabla de Páginas del proceso.
     
-    Mapea números de página virtual (0 a VIRTUAL_PAGES-1) a entradas PTEntry.
+    Mapea números de página virtual (0 a virtual_pages-1) a entradas PTEntry.
     Esta estructura es fundamental para la traducción de direcciones virtuales
     a físicas en un sistema de memoria virtual con paginación.
     
+    La tabla es dispersa: una entrada se crea la primera vez que se pide,
+    así un espacio de direcciones enorme solo cuesta memoria por las
+    páginas realmente tocadas. Cada get_entry cuenta como un recorrido
+    (walk) de un nivel; ver vos.core.pagetable para tablas jerárquicas.
+    
     Propósito:
         - Permite traducción de direcciones virtuales a físicas
         - Mantiene estado de cada página (presente, sucia)
         - Habilita paginación bajo demanda (lazy loading)
     """
     
-    def __init__(self):
-        """Inicializa tabla vacía para todas las páginas virtuales."""
+    def __init__(self, virtual_pages: int = VIRTUAL_PAGES):
+        """
+        Inicializa una tabla vacía (sin entradas materializadas).
+        
+        Args:
+            virtual_pages: Número de páginas del espacio de direcciones
+        """
+        self.virtual_pages = virtual_pages
+        self.levels = 1
+        self.walks = 0
         self._entries: Dict[int, PTEntry] = {}
-        # Crear entradas para todas las páginas virtuales
-        for page_no in range(VIRTUAL_PAGES):
-            self._entries[page_no] = PTEntry()
     
     def get_entry(self, page_no: int) -> PTEntry:
         """
         Obtiene entrada de tabla de páginas para una página virtual.
         
+        Si la página nunca fue tocada, crea su entrada (no presente).
+        
         Args:
             page_no: Número de página virtual
             
@@ -78,9 +114,13 @@ class PageTable:
         Raises:
             ValueError: Si page_no está fuera de rango
         """
-        if page_no not in self._entries:
-            raise ValueError(f"Página {page_no} fuera de rango [0, {VIRTUAL_PAGES-1}]")
-        return self._entries[page_no]
+        self.walks += 1
+        entry = self._entries.get(page_no)
+        if entry is None:
+            if not (0 <= page_no < self.virtual_pages):
+                raise ValueError(f"Página {page_no} fuera de rango [0, {self.virtual_pages-1}]")
+            entry = self._entries[page_no] = PTEntry()
+        return entry
     
     def set_entry(self, page_no: int, entry: PTEntry) -> None:
         """
@@ -93,9 +133,47 @@ class PageTable:
         Raises:
             ValueError: Si page_no está fuera de rango
         """
-        if page_no not in self._entries:
-            raise ValueError(f"Página {page_no} fuera de rango [0, {VIRTUAL_PAGES-1}]")
+        if not (0 <= page_no < self.virtual_pages):
+            raise ValueError(f"Página {page_no} fuera de rango [0, {self.virtual_pages-1}]")
         self._entries[page_no] = entry
+    
+    def lookup(self, page_no: int) -> Optional[PTEntry]:
+        """
+        Obtiene la entrada de una página sin materializarla.
+        
+        Args:
+            page_no: Número de página virtual
+            
+        Returns:
+            Entrada PTEntry, o None si la página nunca fue tocada
+        """
+        return self._entries.get(page_no)
+    
+    def items(self) -> Iterator[Tuple[int, PTEntry]]:
+        """Itera (página, entrada) solo sobre las páginas materializadas."""
+        return iter(self._entries.items())
+    
+    def empty_copy(self) -> 'PageTable':
+        """Crea una tabla vacía con la misma forma (ej: para un fork)."""
+        return PageTable(self.virtual_pages)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtiene estadísticas de la tabla.
+        
+        Returns:
+            Diccionario con niveles, recorridos y entradas materializadas
+        """
+        return {
+            'pt_levels': self.levels,
+            'pt_walks': self.walks,
+            'pt_walk_steps': self.walks,
+            'pt_entries': len(self._entries),
+        }
+    
+    def __len__(self) -> int:
+        """Número de entradas materializadas."""
+        return len(self._entries)
 
 
 class PhysicalMemory:
@@ -105,36 +183,65 @@ class PhysicalMemory:
     Gestiona marcos de memoria física donde se cargan las páginas.
     Mantiene tanto los datos como la lista de marcos disponibles.
     
+    Toda la RAM es un único buffer contiguo (bytearray o mmap anónimo) de
+    tamaño fijo; cada marco es un memoryview sobre su tramo del buffer.
+    Llenar, copiar y limpiar marcos se hace en el lugar con asignación de
+    slices, sin crear objetos nuevos en cada fault o desalojo. La dirección
+    física de (marco, offset) es el índice frame*page_size+offset en `arena`.
+    
     Propósito:
         - Simula la RAM física limitada del sistema
         - Gestiona asignación/liberación de marcos
         - Almacena los datos reales de las páginas
     
     Atributos:
-        frames: Mapeo de número de marco a bytearray con PAGE_SIZE bytes
-        free_frames: Lista de números de marco disponibles para asignar
+        num_frames: Número de marcos físicos
+        page_size: Bytes por marco
+        arena: Buffer contiguo con toda la RAM
+        frames: Lista de memoryviews de page_size bytes, uno por marco
+        free_frames: Cola de números de marco disponibles para asignar
     """
     
-    def __init__(self):
-        """Inicializa PHYSICAL_FRAMES marcos, todos inicialmente libres."""
-        # Cada marco es un bytearray de PAGE_SIZE bytes (inicialmente ceros)
-        self.frames: Dict[int, bytearray] = {
-            frame_no: bytearray(PAGE_SIZE)
-            for frame_no in range(PHYSICAL_FRAMES)
-        }
-        # Todos los marcos empiezan disponibles
-        self.free_frames: List[int] = list(range(PHYSICAL_FRAMES))
+    def __init__(self, num_frames: int = PHYSICAL_FRAMES, page_size: int = PAGE_SIZE,
+                 use_mmap: bool = False):
+        """
+        Inicializa num_frames marcos, todos inicialmente libres.
+        
+        Args:
+            num_frames: Número de marcos físicos
+            page_size: Bytes por marco
+            use_mmap: Si True, la RAM es un mmap anónimo en vez de un bytearray
+        """
+        self.num_frames = num_frames
+        self.page_size = page_size
+        size = num_frames * page_size
+        # Un solo buffer contiguo, inicialmente en ceros
+        self.arena = mmap.mmap(-1, size) if use_mmap else bytearray(size)
+        view = memoryview(self.arena)
+        self.frames: List[memoryview] = [
+            view[frame_no * page_size:(frame_no + 1) * page_size]
+            for frame_no in range(num_frames)
+        ]
+        self._zero = bytes(page_size)
+        # Todos los marcos empiezan disponibles (deque + set: O(1) por operación)
+        self.free_frames: Deque[int] = deque(range(num_frames))
+        self._free_set = set(self.free_frames)
     
     def allocate_frame(self) -> Optional[int]:
         """
         Asigna un marco libre de la memoria física.
         
+        El contenido del marco no se limpia: quien lo asigna lo llena con
+        los datos de la página o con ceros (ver zero_frame).
+        
         Returns:
             Número de marco asignado, o None si no hay marcos libres
         """
         if not self.free_frames:
             return None  # Sin marcos disponibles - necesita reemplazo
-        return self.free_frames.pop(0)  # FIFO: toma el primero
+        frame_no = self.free_frames.popleft()  # FIFO: toma el primero
+        self._free_set.discard(frame_no)
+        return frame_no
     
     def free_frame(self, frame_no: int) -> None:
         """
@@ -146,15 +253,32 @@ class PhysicalMemory:
         Raises:
             ValueError: Si frame_no es inválido o ya está libre
         """
-        if frame_no not in self.frames:
-            raise ValueError(f"Marco {frame_no} inválido [0, {PHYSICAL_FRAMES-1}]")
-        if frame_no in self.free_frames:
+        if not (0 <= frame_no < self.num_frames):
+            raise ValueError(f"Marco {frame_no} inválido [0, {self.num_frames-1}]")
+        if frame_no in self._free_set:
             raise ValueError(f"Marco {frame_no} ya está libre")
         
-        # Limpiar datos del marco (opcional pero buena práctica)
-        self.frames[frame_no] = bytearray(PAGE_SIZE)
-        # Marcar como disponible
+        # Marcar como disponible (se limpia al reasignarse a una página nueva)
         self.free_frames.append(frame_no)
+        self._free_set.add(frame_no)
+    
+    def zero_frame(self, frame_no: int) -> None:
+        """Llena un marco con ceros, en el lugar."""
+        self.frames[frame_no][:] = self._zero
+    
+    def load_frame(self, frame_no: int, data: bytes) -> None:
+        """
+        Copia una página completa dentro de un marco, en el lugar.
+        
+        Args:
+            frame_no: Número de marco destino
+            data: Exactamente page_size bytes
+        """
+        self.frames[frame_no][:] = data
+    
+    def read_frame(self, frame_no: int) -> bytes:
+        """Copia el contenido de un marco a un objeto bytes inmutable."""
+        return bytes(self.frames[frame_no])
 
 
 # ============================================================================
@@ -168,7 +292,7 @@ class VM:
     Implementa un sistema completo de memoria virtual con:
     - Traducción de direcciones virtuales a físicas
     - Manejo automático de page faults
-    - Reemplazo de páginas usando algoritmo FIFO
+    - Reemplazo de páginas con política seleccionable por instancia
     - Backing store para páginas no residentes
     - Gestión de dirty bits para optimizar write-backs
     
@@ -176,7 +300,15 @@ class VM:
     mientras maneja internamente toda la complejidad de la gestión de memoria.
     """
     
-    def __init__(self):
+    def __init__(self, page_size: int = PAGE_SIZE, virtual_pages: int = VIRTUAL_PAGES,
+                 physical_frames: int = PHYSICAL_FRAMES,
+                 policy: Union[str, ReplacementPolicy] = 'fifo',
+                 tlb: Optional[TLB] = None, page_table: Union[str, PageTable] = 'flat',
+                 physical_memory: Optional[PhysicalMemory] = None,
+                 backing_store: Optional[BackingStore] = None,
+                 tracer: Optional[Tracer] = None,
+                 frame_pool: Optional[FramePool] = None,
+                 prefetcher: Optional[Prefetcher] = None):
         """
         Inicializa el simulador de memoria virtual.
         
@@ -184,129 +316,710 @@ class VM:
         - Tabla de páginas para mapeo virtual→físico
         - Memoria física con marcos de tamaño fijo
         - Backing store para páginas en disco
-        - Estructuras para algoritmo de reemplazo FIFO
+        - Política de reemplazo de páginas
+        
+        Args:
+            page_size: Bytes por página/marco
+            virtual_pages: Número de páginas del espacio de direcciones
+            physical_frames: Número de marcos físicos en RAM (con un pool
+                             compartido de alcance local, la cuota de marcos
+                             de esta VM)
+            policy: Política de reemplazo ('fifo', 'lru', 'clock', 'lfu', 'arc')
+                    o instancia de ReplacementPolicy
+            tlb: TLB para cachear traducciones (None = sin TLB)
+            page_table: Representación de la tabla de páginas ('flat',
+                        'two-level', 'three-level', 'four-level', 'compact')
+                        o una instancia vacía con la misma interfaz
+            physical_memory: RAM ya construida (ej: respaldada por mmap); si se
+                             da, su número de marcos reemplaza a physical_frames
+            backing_store: Almacenamiento de páginas desalojadas (None =
+                           DictBackingStore en memoria; SwapDevice = archivo;
+                           CompressedBackingStore = comprimido en memoria)
+            tracer: Sink de eventos (None = tracer por defecto, silencioso)
+            frame_pool: Pool de marcos compartido (ej: el del Kernel); None =
+                        RAM privada de physical_frames marcos
+            prefetcher: Read-ahead de páginas en cada fault (None = sin prefetch)
+            
+        Raises:
+            ValueError: Si algún parámetro de geometría no es positivo o la
+                        tabla de páginas / memoria física no coinciden con él
         """
-        # Tabla de páginas del proceso
-        self.page_table = PageTable()
+        if frame_pool is not None:
+            if physical_memory is not None:
+                raise ValueError("Indicar physical_memory o frame_pool, no ambos")
+            physical_memory = frame_pool.memory
+        elif physical_memory is not None:
+            physical_frames = physical_memory.num_frames
+        if physical_memory is not None:
+            if physical_memory.page_size != page_size:
+                raise ValueError(
+                    f"La memoria física usa marcos de {physical_memory.page_size} bytes, "
+                    f"se esperaban {page_size}"
+                )
+        if page_size <= 0 or virtual_pages <= 0 or physical_frames <= 0:
+            raise ValueError(
+                f"Geometría inválida: page_size={page_size}, "
+                f"virtual_pages={virtual_pages}, physical_frames={physical_frames}"
+            )
         
-        # Memoria física (RAM simulada)
-        self.physical_memory = PhysicalMemory()
+        # Geometría de memoria de esta instancia
+        self.page_size = page_size
+        self.virtual_pages = virtual_pages
+        self.physical_frames = physical_frames
+        self.max_vaddr = virtual_pages * page_size  # Primera dirección inválida
+        
+        # Trazado de eventos (ver vos.core.trace)
+        self.tracer: Tracer = tracer if tracer is not None else get_default_tracer()
+        
+        # Tabla de páginas del proceso (dispersa)
+        if isinstance(page_table, str):
+            # Import diferido: vos.core.pagetable depende de este módulo
+            from vos.core.pagetable import make_page_table
+            page_table = make_page_table(page_table, virtual_pages)
+        elif page_table.virtual_pages != virtual_pages:
+            raise ValueError(
+                f"La tabla de páginas cubre {page_table.virtual_pages} páginas, "
+                f"se esperaban {virtual_pages}"
+            )
+        self.page_table = page_table
+        
+        # Memoria física (RAM simulada, un buffer contiguo) y el pool que
+        # reparte sus marcos; sin pool compartido, la RAM es privada
+        if frame_pool is None:
+            if physical_memory is None:
+                physical_memory = PhysicalMemory(physical_frames, page_size)
+            frame_pool = FramePool(physical_memory)
+        self.frame_pool = frame_pool
+        self.physical_memory = physical_memory
         
         # Backing store - simula almacenamiento secundario (disco)
         # Almacena páginas que no están actualmente en RAM
-        self.backing_store: Dict[int, bytearray] = {}
-        
-        # Cola FIFO - rastrea orden de llegada de páginas a RAM
-        # La página al frente es la más antigua (candidata para reemplazo)
-        self.fifo_queue: List[int] = []
+        if backing_store is None:
+            backing_store = DictBackingStore()
+        self.backing_store = backing_store
         
         # Mapeo inverso: frame → page
-        # Permite saber qué página está en cada marco
+        # Permite saber qué página está en cada marco (su tamaño es el RSS)
         self.frame_to_page: Dict[int, int] = {}
         
+        # Política de reemplazo - decide qué página desalojar con RAM llena
+        # (propia con alcance local, vista de la del pool con alcance global)
+        self.policy: ReplacementPolicy = frame_pool.register(self, policy)
+        self._track_hits = self.policy.tracks_hits
+        
+        # TLB opcional - atajo de traducción para páginas residentes
+        self.tlb: Optional[TLB] = tlb
+        
+        # Prefetcher opcional - precarga páginas de patrones secuenciales/stride
+        self.prefetcher: Optional[Prefetcher] = prefetcher
+        self._prefetched = prefetcher.pending if prefetcher is not None else frozenset()
+        if prefetcher is not None:
+            prefetcher.attach(physical_frames)
+        
         # Estadísticas
         self.page_faults = 0
         self.write_backs = 0
+        self.cow_faults = 0      # Copias hechas al escribir una página compartida
+        
+        # Páginas limpiadas por el reclamador (vos.core.reclaim) que aún no
+        # fueron desalojadas, y desalojos que gracias a eso no hicieron write-back
+        self._cleaned: Set[int] = set()
+        self.writebacks_avoided = 0
+        
+        # Segmentos de memoria compartida adjuntos: (página inicial, página
+        # final exclusiva, segmento)
+        self.segments: List[Tuple[int, int, SharedSegment]] = []
     
-    def _ensure_in_ram(self, page_no: int) -> None:
+    def _test_and_clear_referenced(self, page_no: int) -> bool:
+        """
+        Lee y limpia el bit de referencia de una página (usado por CLOCK).
+        
+        Args:
+            page_no: Número de página virtual
+            
+        Returns:
+            Valor del bit antes de limpiarlo
+        """
+        entry = self.page_table.lookup(page_no)
+        referenced = entry.referenced
+        entry.referenced = False
+        return referenced
+    
+    def _translate(self, page_no: int) -> PTEntry:
+        """
+        Traduce una página residente consultando primero el TLB.
+        
+        En un hit del TLB se evita la tabla de páginas y _ensure_in_ram: solo
+        se marca el bit de referencia y se notifica a la política. En un miss
+        se recorre la ruta normal (con page fault si hace falta) y se llena el TLB.
+        
+        Args:
+            page_no: Número de página virtual (ya validado)
+            
+        Returns:
+            Entrada PTEntry de la página, presente en RAM
+        """
+        tlb = self.tlb
+        if tlb is not None:
+            entry = tlb.lookup(page_no)
+            if entry is not None:
+                entry.referenced = True
+                if self._track_hits:
+                    self.policy.on_access(page_no)
+                return entry
+            entry = self._ensure_in_ram(page_no)
+            tlb.insert(page_no, entry)
+            return entry
+        return self._ensure_in_ram(page_no)
+    
+    def _ensure_in_ram(self, page_no: int) -> PTEntry:
         """
         Asegura que una página esté cargada en RAM, manejando page faults si es necesario.
         
         Este método implementa el núcleo del sistema de memoria virtual:
         - Detecta si una página está presente en RAM
         - Maneja page faults cargando páginas desde backing store
-        - Implementa reemplazo FIFO cuando RAM está llena
+        - Delega en la política de reemplazo cuando RAM está llena
         - Realiza write-back de páginas sucias al disco
         
         Args:
-            page_no: Número de página virtual a cargar (0 a VIRTUAL_PAGES-1)
+            page_no: Número de página virtual a cargar (0 a virtual_pages-1)
+            
+        Returns:
+            Entrada PTEntry de la página, ya presente en RAM
             
         Raises:
             ValueError: Si page_no está fuera de rango
         """
-        # Validación
-        if not (0 <= page_no < VIRTUAL_PAGES):
-            raise ValueError(f"Página {page_no} fuera de rango [0, {VIRTUAL_PAGES-1}]")
-        
-        # Obtener entrada de tabla de páginas
+        # Obtener entrada de tabla de páginas (valida el rango)
         entry = self.page_table.get_entry(page_no)
         
         # CASO 1: Página ya está en RAM (HIT)
         if entry.present:
-            return  # Nada que hacer
+            entry.referenced = True
+            if self._track_hits:
+                self.policy.on_access(page_no)
+            if self._prefetched and page_no in self._prefetched:
+                self.prefetcher.on_useful(page_no)
+            return entry
         
         # CASO 2: PAGE FAULT - página no está en RAM
-        print(f"⚠️  PAGE FAULT: página {page_no} no está en RAM")
+        tracer = self.tracer
+        if tracer.events:
+            tracer.emit('vm.page_fault', page=page_no)
         self.page_faults += 1
         
-        # Intentar obtener un marco libre
-        frame_no = self.physical_memory.allocate_frame()
+        # Read-ahead antes de la carga: así la precarga nunca desaloja la
+        # página que provocó el fault
+        if self.prefetcher is not None:
+            self._read_ahead(page_no)
+        return self._page_in(page_no, entry)
+
+    def _page_in(self, page_no: int, entry: PTEntry) -> PTEntry:
+        """
+        Carga una página no residente en un marco (sin contarla como fault).
         
-        # Si no hay marcos libres, necesitamos reemplazar una página
-        if frame_no is None:
-            print("💾 RAM llena - ejecutando reemplazo FIFO")
-            
-            # FIFO: seleccionar víctima (la página más antigua en RAM)
-            if not self.fifo_queue:
-                raise RuntimeError("No hay páginas para desalojar")
-            
-            victim_page = self.fifo_queue.pop(0)  # Remover del frente (más antigua)
-            print(f"   Víctima seleccionada: página {victim_page}")
-            
-            # Obtener información de la víctima
-            victim_entry = self.page_table.get_entry(victim_page)
-            victim_frame = victim_entry.frame
-            
-            # Si la víctima está sucia, escribirla de vuelta al backing store
-            if victim_entry.dirty:
-                print(f"   ✍️  Página {victim_page} está sucia - escribiendo a disco")
-                # Copiar datos del marco al backing store
-                self.backing_store[victim_page] = bytearray(
-                    self.physical_memory.frames[victim_frame]
-                )
-                self.write_backs += 1
-            else:
-                print(f"   ✓ Página {victim_page} limpia - sin write-back necesario")
-            
-            # Actualizar entrada de la víctima (ya no está en RAM)
-            victim_entry.present = False
-            victim_entry.frame = None
-            victim_entry.dirty = False
-            
-            # Remover mapeo inverso
-            del self.frame_to_page[victim_frame]
-            
-            # Liberar el marco
-            self.physical_memory.free_frame(victim_frame)
+        Args:
+            page_no: Número de página virtual (ya validado)
+            entry: Su entrada en la tabla de páginas
             
-            # Ahora podemos asignar el marco recién liberado
-            frame_no = self.physical_memory.allocate_frame()
-            if frame_no is None:
-                raise RuntimeError("Error al reasignar marco después de desalojo")
+        Returns:
+            Entrada PTEntry de la página, ya presente en RAM
+        """
+        # Página de un segmento compartido: un solo marco para todos sus mapeos
+        if self.segments:
+            mapped = self._segment_for(page_no)
+            if mapped is not None:
+                return self._fault_shared(page_no, entry, *mapped)
+        
+        tracer = self.tracer
+        # Obtener un marco (el pool desaloja una víctima si hace falta)
+        frame_no = self.frame_pool.allocate(self, page_no)
         
         # Cargar página del backing store (o inicializar con ceros si es nueva)
         if page_no in self.backing_store:
-            print(f"   📖 Cargando página {page_no} desde backing store al marco {frame_no}")
-            # Copiar datos del backing store al marco
-            self.physical_memory.frames[frame_no] = bytearray(
-                self.backing_store[page_no]
-            )
+            if tracer.events:
+                tracer.emit('vm.page_in', page=page_no, frame=frame_no)
+            # Copiar datos del backing store al marco (en el lugar)
+            self.physical_memory.load_frame(frame_no, self.backing_store[page_no])
         else:
-            print(f"   🆕 Inicializando nueva página {page_no} con ceros en marco {frame_no}")
-            # Página nueva - ya inicializada con ceros por PhysicalMemory
-            pass
+            # Página nueva - el marco puede traer datos de su dueño anterior
+            self.physical_memory.zero_frame(frame_no)
+            if tracer.events:
+                tracer.emit('vm.page_new', page=page_no, frame=frame_no)
         
         # Actualizar entrada de tabla de páginas
         entry.frame = frame_no
         entry.present = True
         entry.dirty = False  # Recién cargada, no modificada aún
+        entry.referenced = True
         
         # Actualizar estructuras de seguimiento
-        self.fifo_queue.append(page_no)  # Agregar al final (más reciente)
+        self.policy.on_load(page_no)
+        self.frame_to_page[frame_no] = page_no
+        self.frame_pool.map(frame_no, self, page_no)
+        
+        if tracer.events:
+            tracer.emit('vm.page_loaded', page=page_no, frame=frame_no)
+        return entry
+
+    def _read_ahead(self, page_no: int) -> None:
+        """
+        Precarga las páginas que el prefetcher predice tras un fault.
+        
+        Las páginas fuera del espacio de direcciones cortan la ventana; las
+        ya residentes se saltean.
+        
+        Args:
+            page_no: Página que provocó el fault
+        """
+        prefetcher = self.prefetcher
+        pages = prefetcher.on_fault(page_no)
+        if not pages:
+            return
+        get_entry = self.page_table.get_entry
+        loaded = 0
+        for candidate in pages:
+            if not 0 <= candidate < self.virtual_pages:
+                break
+            entry = get_entry(candidate)
+            if entry.present:
+                continue
+            self._page_in(candidate, entry)
+            prefetcher.issue(candidate)
+            loaded += 1
+        if loaded and self.tracer.events:
+            self.tracer.emit('vm.prefetch', page=page_no, count=loaded,
+                             stride=prefetcher.stride, window=prefetcher.window)
+
+    def _evict(self, page_no: int, on_fault: bool = False) -> None:
+        """
+        Desaloja una página residente ya elegida como víctima.
+        
+        Hace write-back si está sucia, invalida su entrada y su traducción
+        en el TLB y devuelve el marco al pool. La política ya dejó de
+        rastrearla al elegirla (select_victim). Si el marco está compartido
+        (copy-on-write tras un fork) se desaloja una sola vez, quitándolo
+        de todos los espacios de direcciones que lo mapean.
+        
+        Args:
+            page_no: Página víctima (residente)
+            on_fault: El desalojo lo hace un page fault (no el reclamador);
+                      solo entonces cuenta en writebacks_avoided
+        """
+        victim_entry = self.page_table.lookup(page_no)
+        victim_frame = victim_entry.frame
+        if on_fault and self._cleaned and page_no in self._cleaned and not victim_entry.dirty:
+            self.writebacks_avoided += 1
+        pool = self.frame_pool
+        if pool.refcount(victim_frame) > 1:
+            for vm, other_page in pool.mappings(victim_frame):
+                if vm is not self or other_page != page_no:
+                    vm.policy.remove(other_page)
+                    vm._unmap(other_page, vm.page_table.lookup(other_page))
+        self._unmap(page_no, victim_entry)
+        if self.segments:
+            mapped = self._segment_for(page_no)
+            if mapped is not None:
+                segment, seg_page = mapped
+                segment.release(seg_page, self.physical_memory)
+        pool.release(victim_frame)
+
+    def _unmap(self, page_no: int, entry: PTEntry) -> None:
+        """
+        Quita una página residente de este espacio de direcciones.
+        
+        Hace write-back si está sucia y limpia la entrada, el TLB y el mapeo
+        inverso. No libera el marco ni toca la política.
+        
+        Args:
+            page_no: Página residente
+            entry: Su entrada en la tabla de páginas
+        """
+        tracer = self.tracer
+        frame_no = entry.frame
+        if self._prefetched and page_no in self._prefetched:
+            self.prefetcher.on_wasted(page_no)
+        if self._cleaned:
+            self._cleaned.discard(page_no)
+        
+        # Página de un segmento: su write-back se hace una sola vez, al
+        # liberar el marco (ver SharedSegment.release)
+        mapped = self._segment_for(page_no) if self.segments else None
+        if mapped is not None:
+            if entry.dirty:
+                segment, seg_page = mapped
+                segment.dirty.add(seg_page)
+        # Si la víctima está sucia, escribirla de vuelta al backing store
+        elif entry.dirty:
+            if tracer.events:
+                tracer.emit('vm.write_back', page=page_no)
+            # Copiar datos del marco al backing store
+            self.backing_store[page_no] = self.physical_memory.read_frame(frame_no)
+            self.write_backs += 1
+        elif tracer.events:
+            tracer.emit('vm.clean_victim', page=page_no)
+        
+        # Actualizar entrada de la víctima (ya no está en RAM)
+        entry.present = False
+        entry.frame = None
+        entry.dirty = False
+        entry.referenced = False
+        entry.cow = False
+        
+        # La traducción cacheada de la víctima deja de ser válida
+        if self.tlb is not None:
+            self.tlb.invalidate(page_no)
+        
+        # Remover mapeo inverso
+        del self.frame_to_page[frame_no]
+
+    def clean_page(self, page_no: int, mark: bool = True) -> bool:
+        """
+        Escribe una página residente sucia al backing store y la marca limpia.
+        
+        Es el write-back asíncrono del reclamador: no cuenta en write_backs
+        (que son los hechos en la ruta del fault). Una página de un segmento
+        compartido se escribe al store del segmento y queda limpia en todos
+        sus mapeos.
+        
+        Args:
+            page_no: Número de página virtual
+            mark: Recordar la página para contar el write-back que se evita
+                  si se desaloja antes de volver a ensuciarse
+            
+        Returns:
+            True si la página estaba sucia y se escribió
+        """
+        entry = self.page_table.lookup(page_no)
+        if entry is None or not entry.present:
+            return False
+        mapped = self._segment_for(page_no) if self.segments else None
+        if mapped is not None:
+            segment, seg_page = mapped
+            pool = self.frame_pool
+            frame_no = entry.frame
+            mappings = pool.mappings(frame_no)
+            if not (seg_page in segment.dirty
+                    or any(vm.page_table.lookup(p).dirty for vm, p in mappings)):
+                return False
+            segment.backing_store[seg_page] = self.physical_memory.read_frame(frame_no)
+            segment.dirty.discard(seg_page)
+            for vm, p in mappings:
+                vm.page_table.lookup(p).dirty = False
+        elif entry.dirty:
+            self.backing_store[page_no] = self.physical_memory.read_frame(entry.frame)
+            entry.dirty = False
+        else:
+            return False
+        if mark:
+            self._cleaned.add(page_no)
+        if self.tracer.events:
+            self.tracer.emit('vm.clean', page=page_no)
+        return True
+
+    def _translate_write(self, page_no: int) -> PTEntry:
+        """
+        Traduce una página que se va a escribir.
+        
+        Si el marco es compartido (copy-on-write) primero se copia a uno
+        propio; luego la página se marca sucia.
+        
+        Args:
+            page_no: Número de página virtual (ya validado)
+            
+        Returns:
+            Entrada PTEntry de la página, presente y con marco propio
+        """
+        entry = self._translate(page_no)
+        if entry.cow:
+            self._break_cow(page_no, entry)
+        entry.dirty = True
+        return entry
+
+    def _break_cow(self, page_no: int, entry: PTEntry) -> None:
+        """
+        Resuelve un fault de copy-on-write.
+        
+        Si otro espacio de direcciones aún comparte el marco, el contenido
+        se copia a un marco nuevo (lo que puede desalojar otra página); si
+        esta VM es la última que lo mapea, simplemente se queda con él.
+        La entrada se actualiza en el lugar, así el TLB sigue siendo válido.
+        
+        Args:
+            page_no: Página residente con el bit cow
+            entry: Su entrada en la tabla de páginas
+        """
+        pool = self.frame_pool
+        old_frame = entry.frame
+        if pool.refcount(old_frame) > 1:
+            data = self.physical_memory.read_frame(old_frame)
+            # Soltar el mapeo compartido antes de pedir marco: así el
+            # desalojo que pueda provocar allocate no elige esta página
+            self.policy.remove(page_no)
+            del self.frame_to_page[old_frame]
+            pool.unmap(old_frame, self, page_no)
+            entry.present = False
+            entry.frame = None
+            
+            frame_no = pool.allocate(self, page_no)
+            self.physical_memory.load_frame(frame_no, data)
+            entry.frame = frame_no
+            entry.present = True
+            self.policy.on_load(page_no)
+            self.frame_to_page[frame_no] = page_no
+            pool.map(frame_no, self, page_no)
+            self.cow_faults += 1
+            if self.tracer.events:
+                self.tracer.emit('vm.cow', page=page_no, old=old_frame, frame=frame_no)
+        entry.cow = False
+
+    def fork(self, tlb: Optional[TLB] = None, prefetcher: Optional[Prefetcher] = None) -> 'VM':
+        """
+        Crea un espacio de direcciones hijo copy-on-write.
+        
+        El hijo usa el mismo pool de marcos, la misma geometría y una
+        política del mismo tipo. Sus páginas residentes apuntan a los
+        mismos marcos que las del padre, marcadas cow en ambos lados, y su
+        backing store comparte las páginas guardadas (ver fork() de cada
+        store). Nada se copia hasta la primera escritura de cualquiera de
+        los dos; si un marco compartido es desalojado, cada lado vuelve a
+        cargar su propia copia.
+        
+        Args:
+            tlb: TLB del hijo (None = sin TLB)
+            prefetcher: Prefetcher del hijo (None = sin prefetch)
+            
+        Returns:
+            VM hija
+        """
+        child = VM(page_size=self.page_size, virtual_pages=self.virtual_pages,
+                   physical_frames=self.physical_frames, policy=type(self.policy),
+                   tlb=tlb, page_table=self.page_table.empty_copy(),
+                   backing_store=self.backing_store.fork(), tracer=self.tracer,
+                   frame_pool=self.frame_pool, prefetcher=prefetcher)
+        pool = self.frame_pool
+        lookup = self.page_table.lookup
+        child_entry_for = child.page_table.get_entry
+        # Los segmentos se heredan adjuntos: sus páginas son compartidas de
+        # verdad, no copy-on-write
+        for start, end, segment in self.segments:
+            child.segments.append((start, end, segment))
+            segment.attachments.append((child, start))
+        segment_for = self._segment_for if self.segments else None
+        for frame_no, page_no in self.frame_to_page.items():
+            entry = lookup(page_no)
+            child_entry = child_entry_for(page_no)
+            child_entry.frame = frame_no
+            child_entry.present = True
+            if segment_for is not None and segment_for(page_no) is not None:
+                child_entry.dirty = False
+            else:
+                entry.cow = True
+                # El store del hijo es copia del del padre: igual de desactualizado
+                child_entry.dirty = entry.dirty
+                child_entry.cow = True
+            child.frame_to_page[frame_no] = page_no
+            child.policy.on_load(page_no)
+            pool.share(frame_no, child, page_no)
+        return child
+
+    def _segment_for(self, page_no: int) -> Optional[Tuple[SharedSegment, int]]:
+        """
+        Busca el segmento adjunto que cubre una página.
+        
+        Args:
+            page_no: Número de página virtual
+            
+        Returns:
+            Tupla (segmento, página dentro del segmento), o None
+        """
+        for start, end, segment in self.segments:
+            if start <= page_no < end:
+                return segment, page_no - start
+        return None
+
+    def _fault_shared(self, page_no: int, entry: PTEntry, segment: SharedSegment,
+                      seg_page: int) -> PTEntry:
+        """
+        Resuelve el page fault de una página de un segmento compartido.
+        
+        Si otro proceso ya la tiene en RAM solo se mapea su marco; si no, se
+        asigna uno y se carga desde el store del segmento.
+        
+        Args:
+            page_no: Página virtual que provocó el fault
+            entry: Su entrada en la tabla de páginas
+            segment: Segmento que cubre la página
+            seg_page: Página dentro del segmento
+            
+        Returns:
+            Entrada PTEntry de la página, ya presente en RAM
+        """
+        pool = self.frame_pool
+        # Hacer lugar antes de mirar el segmento: el desalojo podría soltar
+        # justo el marco que se iba a mapear
+        pool.reserve(self, page_no)
+        frame_no = segment.frames.get(seg_page)
+        if frame_no is None:
+            frame_no = pool.allocate(self, page_no)
+            segment.load(seg_page, frame_no, self.physical_memory)
+            pool.map(frame_no, self, page_no)
+        else:
+            pool.share(frame_no, self, page_no)
+        
+        entry.frame = frame_no
+        entry.present = True
+        entry.dirty = False
+        entry.referenced = True
+        entry.cow = False
+        self.policy.on_load(page_no)
         self.frame_to_page[frame_no] = page_no
         
-        print(f"   ✅ Página {page_no} ahora en marco {frame_no}")
+        if self.tracer.events:
+            self.tracer.emit('vm.shm_map', page=page_no, frame=frame_no, segment=segment.name)
+        return entry
+
+    def attach_segment(self, segment: SharedSegment, vaddr: int) -> None:
+        """
+        Adjunta un segmento compartido a partir de una dirección virtual.
+        
+        Lo que hubiera en el rango (páginas privadas, residentes o en el
+        backing store) se descarta. Las páginas del segmento se cargan o
+        mapean recién al primer acceso.
+        
+        Args:
+            segment: Segmento a adjuntar
+            vaddr: Dirección inicial (alineada a página)
+            
+        Raises:
+            ValueError: Si la dirección no está alineada, el rango no entra
+                        en el espacio de direcciones, se superpone con otro
+                        segmento o el tamaño de página no coincide
+        """
+        if segment.page_size != self.page_size:
+            raise ValueError(
+                f"El segmento usa páginas de {segment.page_size} bytes, "
+                f"esta VM de {self.page_size}"
+            )
+        if vaddr % self.page_size:
+            raise ValueError(f"Dirección de segmento no alineada a página: 0x{vaddr:x}")
+        start = vaddr // self.page_size
+        end = start + segment.num_pages
+        if start < 0 or end > self.virtual_pages:
+            raise ValueError(
+                f"El segmento [0x{vaddr:x}, 0x{end * self.page_size:x}) "
+                f"no entra en el espacio de direcciones (0x{self.max_vaddr:x})"
+            )
+        for other_start, other_end, other in self.segments:
+            if start < other_end and other_start < end:
+                raise ValueError(f"El rango se superpone con el segmento '{other.name}'")
+        
+        # Descartar el contenido privado del rango (sin write-back)
+        pool = self.frame_pool
+        lookup = self.page_table.lookup
+        for page_no in range(start, end):
+            entry = lookup(page_no)
+            if entry is not None and entry.present:
+                frame_no = entry.frame
+                entry.dirty = False
+                self.policy.remove(page_no)
+                self._unmap(page_no, entry)
+                pool.unmap(frame_no, self, page_no)
+            self.backing_store.discard(page_no)
+        
+        self.segments.append((start, end, segment))
+        segment.attachments.append((self, start))
+
+    def detach_segment(self, segment: SharedSegment) -> None:
+        """
+        Desadjunta un segmento compartido.
+        
+        Las páginas residentes dejan de estar mapeadas en esta VM; si era el
+        último mapeo de un marco, se libera (con write-back al store del
+        segmento si quedó sucio). El rango vuelve a ser memoria privada vacía.
+        
+        Args:
+            segment: Segmento adjunto
+            
+        Raises:
+            ValueError: Si el segmento no está adjunto a esta VM
+        """
+        for attached in self.segments:
+            if attached[2] is segment:
+                break
+        else:
+            raise ValueError(f"El segmento '{segment.name}' no está adjunto")
+        start, end, _ = attached
+        
+        pool = self.frame_pool
+        lookup = self.page_table.lookup
+        resident = [page_no for page_no in self.frame_to_page.values() if start <= page_no < end]
+        for page_no in resident:
+            entry = lookup(page_no)
+            frame_no = entry.frame
+            self.policy.remove(page_no)
+            self._unmap(page_no, entry)
+            if pool.refcount(frame_no) > 1:
+                pool.unmap(frame_no, self, page_no)
+            else:
+                segment.release(page_no - start, self.physical_memory)
+                pool.release(frame_no)
+        
+        self.segments.remove(attached)
+        segment.attachments.remove((self, start))
+
+    def release(self) -> None:
+        """
+        Libera toda la memoria de la VM (al terminar su proceso).
+        
+        Desadjunta los segmentos compartidos (lo que sus páginas tengan
+        sucio se conserva en el store del segmento), suelta los marcos
+        privados sin write-back (un marco copy-on-write sigue mapeado en
+        los otros procesos), cierra el backing store y se da de baja del
+        pool. La VM queda vacía y no debe volver a usarse.
+        """
+        for _, _, segment in list(self.segments):
+            self.detach_segment(segment)
+        
+        # La tabla de páginas entera se descarta: no hace falta limpiar
+        # cada entrada ni contar prefetches desperdiciados
+        pool = self.frame_pool
+        frames = len(self.frame_to_page)
+        for frame_no, page_no in self.frame_to_page.items():
+            self.policy.remove(page_no)
+            pool.unmap(frame_no, self, page_no)
+        self.frame_to_page.clear()
+        self.page_table = self.page_table.empty_copy()
+        if self.tlb is not None:
+            self.tlb.flush()
+        if self.prefetcher is not None:
+            self.prefetcher.pending.clear()
+        self._cleaned.clear()
+        
+        self.backing_store.close()
+        pool.unregister(self)
+        if self.tracer.events:
+            self.tracer.emit('vm.release', frames=frames)
     
+    def touch_page(self, page_no: int, write: bool = False) -> PTEntry:
+        """
+        Referencia una página sin transferir datos (replay de trazas).
+
+        Tiene el mismo efecto sobre faults, política, TLB y bits que un
+        acceso byte a byte, pero sin validar la dirección ni trazar el acceso.
+
+        Args:
+            page_no: Número de página virtual (validado por quien llama)
+            write: Si el acceso es una escritura (marca la página sucia)
+
+        Returns:
+            Entrada PTEntry de la página, presente en RAM
+        """
+        if write:
+            return self._translate_write(page_no)
+        return self._translate(page_no)
+
     def read_byte(self, vaddr: int) -> int:
         """
         Lee un byte de una dirección virtual.
@@ -315,7 +1028,7 @@ class VM:
         y retorna el valor del byte.
         
         Args:
-            vaddr: Dirección virtual (0 a VIRTUAL_PAGES*PAGE_SIZE-1)
+            vaddr: Dirección virtual (0 a max_vaddr-1)
             
         Returns:
             Valor del byte (0-255)
@@ -324,27 +1037,28 @@ class VM:
             ValueError: Si vaddr está fuera de rango
         """
         # Validar dirección virtual
-        max_vaddr = VIRTUAL_PAGES * PAGE_SIZE
-        if not (0 <= vaddr < max_vaddr):
-            raise ValueError(f"Dirección virtual {vaddr} fuera de rango [0, {max_vaddr-1}]")
+        if not (0 <= vaddr < self.max_vaddr):
+            raise ValueError(f"Dirección virtual {vaddr} fuera de rango [0, {self.max_vaddr-1}]")
         
         # PASO 1: Traducción de dirección virtual a (página, offset)
-        page_no = vaddr // PAGE_SIZE    # Número de página virtual
-        offset = vaddr % PAGE_SIZE       # Offset dentro de la página
+        page_size = self.page_size
+        page_no = vaddr // page_size    # Número de página virtual
+        offset = vaddr % page_size       # Offset dentro de la página
         
-        print(f"\n🔍 READ: vaddr={vaddr} → página={page_no}, offset={offset}")
+        tracer = self.tracer
+        if tracer.verbose:
+            tracer.emit('vm.read', vaddr=vaddr, page=page_no, offset=offset)
         
         # PASO 2: Asegurar que la página esté en RAM (puede causar page fault)
-        self._ensure_in_ram(page_no)
-        
-        # PASO 3: Obtener el marco físico donde está la página
-        entry = self.page_table.get_entry(page_no)
+        # PASO 3: Obtener el marco físico donde está la página (TLB o tabla)
+        entry = self._translate(page_no)
         frame_no = entry.frame
         
         # PASO 4: Leer el byte de la memoria física
         byte_value = self.physical_memory.frames[frame_no][offset]
         
-        print(f"   ✓ Leído valor {byte_value} del marco {frame_no}[{offset}]")
+        if tracer.verbose:
+            tracer.emit('vm.read_done', value=byte_value, frame=frame_no, offset=offset)
         return byte_value
     
     def write_byte(self, vaddr: int, value: int) -> None:
@@ -355,42 +1069,162 @@ class VM:
         marca la página como sucia (dirty), y escribe el valor.
         
         Args:
-            vaddr: Dirección virtual (0 a VIRTUAL_PAGES*PAGE_SIZE-1)
+            vaddr: Dirección virtual (0 a max_vaddr-1)
             value: Valor a escribir (0-255)
             
         Raises:
             ValueError: Si vaddr o value están fuera de rango
         """
         # Validar dirección virtual
-        max_vaddr = VIRTUAL_PAGES * PAGE_SIZE
-        if not (0 <= vaddr < max_vaddr):
-            raise ValueError(f"Dirección virtual {vaddr} fuera de rango [0, {max_vaddr-1}]")
+        if not (0 <= vaddr < self.max_vaddr):
+            raise ValueError(f"Dirección virtual {vaddr} fuera de rango [0, {self.max_vaddr-1}]")
         
         # Validar valor de byte
         if not (0 <= value <= 255):
             raise ValueError(f"Valor {value} fuera de rango [0, 255]")
         
         # PASO 1: Traducción de dirección
-        page_no = vaddr // PAGE_SIZE
-        offset = vaddr % PAGE_SIZE
+        page_size = self.page_size
+        page_no = vaddr // page_size
+        offset = vaddr % page_size
         
-        print(f"\n✍️  WRITE: vaddr={vaddr} → página={page_no}, offset={offset}, value={value}")
+        tracer = self.tracer
+        if tracer.verbose:
+            tracer.emit('vm.write', vaddr=vaddr, page=page_no, offset=offset, value=value)
         
         # PASO 2: Asegurar página en RAM
-        self._ensure_in_ram(page_no)
-        
-        # PASO 3: Obtener marco físico
-        entry = self.page_table.get_entry(page_no)
+        # PASO 3: Obtener marco físico (TLB o tabla de páginas)
+        # PASO 4: Marcar página como SUCIA antes de escribir (copiándola
+        # antes si es copy-on-write). Esto es CRÍTICO - indica que la
+        # página fue modificada
+        entry = self._translate_write(page_no)
         frame_no = entry.frame
         
-        # PASO 4: Marcar página como SUCIA antes de escribir
-        # Esto es CRÍTICO - indica que la página fue modificada
-        entry.dirty = True
-        
         # PASO 5: Escribir el byte a memoria física
         self.physical_memory.frames[frame_no][offset] = value
         
-        print(f"   ✓ Escrito valor {value} al marco {frame_no}[{offset}] (página marcada sucia)")
+        if tracer.verbose:
+            tracer.emit('vm.write_done', value=value, frame=frame_no, offset=offset)
+    
+    def _page_spans(self, vaddr: int, length: int) -> Iterator[Tuple[int, int, int, int]]:
+        """
+        Divide un rango virtual en tramos que no cruzan límites de página.
+        
+        Args:
+            vaddr: Dirección virtual inicial
+            length: Cantidad de bytes del rango
+            
+        Yields:
+            Tuplas (página, offset en la página, posición en el rango, bytes del tramo)
+            
+        Raises:
+            ValueError: Si el rango se sale del espacio de direcciones
+        """
+        max_vaddr = self.max_vaddr
+        if length < 0 or not (0 <= vaddr and vaddr + length <= max_vaddr):
+            raise ValueError(
+                f"Rango virtual [{vaddr}, {vaddr + length}) fuera de [0, {max_vaddr})"
+            )
+        page_size = self.page_size
+        pos = 0
+        while pos < length:
+            page_no, offset = divmod(vaddr + pos, page_size)
+            n = min(page_size - offset, length - pos)
+            yield page_no, offset, pos, n
+            pos += n
+    
+    def read(self, vaddr: int, length: int) -> bytes:
+        """
+        Lee un rango de bytes que puede cruzar varias páginas.
+        
+        Traduce una sola vez por página tocada y copia cada tramo como un
+        slice completo. Cada página sufre a lo sumo un page fault por llamada.
+        
+        Args:
+            vaddr: Dirección virtual inicial
+            length: Cantidad de bytes a leer
+            
+        Returns:
+            Bytes leídos
+            
+        Raises:
+            ValueError: Si el rango se sale del espacio de direcciones
+        """
+        tracer = self.tracer
+        if tracer.verbose:
+            tracer.emit('vm.read_bulk', vaddr=vaddr, length=length)
+        
+        out = bytearray(length)
+        frames = self.physical_memory.frames
+        for page_no, offset, pos, n in self._page_spans(vaddr, length):
+            frame_no = self._translate(page_no).frame
+            out[pos:pos + n] = frames[frame_no][offset:offset + n]
+        return bytes(out)
+    
+    def write(self, vaddr: int, data: bytes) -> None:
+        """
+        Escribe un buffer que puede cruzar varias páginas.
+        
+        Traduce una sola vez por página tocada, marca cada página sucia una
+        vez y copia cada tramo como un slice completo.
+        
+        Args:
+            vaddr: Dirección virtual inicial
+            data: Objeto bytes-like a escribir
+            
+        Raises:
+            ValueError: Si el rango se sale del espacio de direcciones
+        """
+        view = memoryview(data).cast('B')
+        tracer = self.tracer
+        if tracer.verbose:
+            tracer.emit('vm.write_bulk', vaddr=vaddr, length=len(view))
+        
+        frames = self.physical_memory.frames
+        for page_no, offset, pos, n in self._page_spans(vaddr, len(view)):
+            entry = self._translate_write(page_no)
+            frames[entry.frame][offset:offset + n] = view[pos:pos + n]
+    
+    def fill(self, vaddr: int, length: int, value: int = 0) -> None:
+        """
+        Llena un rango virtual con un mismo valor de byte (memset).
+        
+        Args:
+            vaddr: Dirección virtual inicial
+            length: Cantidad de bytes a llenar
+            value: Valor de byte (0-255)
+            
+        Raises:
+            ValueError: Si el rango o el valor están fuera de rango
+        """
+        if not (0 <= value <= 255):
+            raise ValueError(f"Valor {value} fuera de rango [0, 255]")
+        tracer = self.tracer
+        if tracer.verbose:
+            tracer.emit('vm.fill', vaddr=vaddr, length=length, value=value)
+        
+        pattern = bytes((value,)) * min(length, self.page_size)
+        frames = self.physical_memory.frames
+        for page_no, offset, pos, n in self._page_spans(vaddr, length):
+            entry = self._translate_write(page_no)
+            frames[entry.frame][offset:offset + n] = pattern[:n]
+    
+    def copy(self, dst: int, src: int, length: int) -> None:
+        """
+        Copia un rango virtual a otro (memmove: admite solapamiento).
+        
+        Args:
+            dst: Dirección virtual destino
+            src: Dirección virtual origen
+            length: Cantidad de bytes a copiar
+            
+        Raises:
+            ValueError: Si alguno de los rangos se sale del espacio de direcciones
+        """
+        tracer = self.tracer
+        if tracer.verbose:
+            tracer.emit('vm.copy', dst=dst, src=src, length=length)
+        self.write(dst, self.read(src, length))
     
     def zero_page(self, page_no: int) -> None:
         """
@@ -406,26 +1240,122 @@ class VM:
             ValueError: Si page_no está fuera de rango
         """
         # Validar número de página
-        if not (0 <= page_no < VIRTUAL_PAGES):
-            raise ValueError(f"Página {page_no} fuera de rango [0, {VIRTUAL_PAGES-1}]")
+        if not (0 <= page_no < self.virtual_pages):
+            raise ValueError(f"Página {page_no} fuera de rango [0, {self.virtual_pages-1}]")
         
-        print(f"\n🧹 ZERO_PAGE: Llenando página {page_no} con ceros")
+        tracer = self.tracer
+        if tracer.verbose:
+            tracer.emit('vm.zero_page', page=page_no)
         
-        # Asegurar página en RAM
-        self._ensure_in_ram(page_no)
-        
-        # Obtener marco físico
-        entry = self.page_table.get_entry(page_no)
+        # Asegurar página en RAM (con marco propio si era copy-on-write),
+        # marcarla sucia (estamos modificando la página) y obtener el marco
+        entry = self._translate_write(page_no)
         frame_no = entry.frame
         
-        # Marcar como sucia (estamos modificando la página)
-        entry.dirty = True
+        # Llenar con ceros en el lugar
+        self.physical_memory.zero_frame(frame_no)
         
-        # Llenar con ceros - reemplazar bytearray completo
-        self.physical_memory.frames[frame_no] = bytearray(PAGE_SIZE)
-        
-        print(f"   ✓ Página {page_no} (marco {frame_no}) llena con ceros")
-    
+        if tracer.verbose:
+            tracer.emit('vm.zero_done', page=page_no, frame=frame_no)
+
+    def translate_many(self, vaddrs, gather: bool = False):
+        """
+        Traduce (o lee) un lote de direcciones virtuales de una vez.
+
+        Las direcciones se validan y se dividen en página/offset en bloque
+        (vectorizado con NumPy si está instalado). Cada página distinta se
+        traduce UNA sola vez, en orden de primera aparición, así solo las
+        páginas no residentes pasan por la ruta de page fault. Si el lote
+        toca más páginas que marcos, una página traducida al principio
+        puede ser desalojada después: las direcciones físicas reflejan el
+        marco en el momento de su traducción, y con gather=True los bytes
+        se copian inmediatamente tras traducir cada página.
+
+        Args:
+            vaddrs: numpy.ndarray, array('Q'/'L'/...) o secuencia de enteros
+            gather: Si True, devuelve los bytes en lugar de las direcciones
+
+        Returns:
+            Con gather=True, bytes con un byte por dirección. Si no, las
+            direcciones físicas: numpy.ndarray int64 si la entrada era un
+            ndarray, o array('q') en otro caso
+
+        Raises:
+            ValueError: Si alguna dirección está fuera de rango
+        """
+        tracer = self.tracer
+        if np is not None:
+            return self._translate_many_numpy(vaddrs, gather, tracer)
+
+        vaddrs = list(vaddrs)
+        if vaddrs and (min(vaddrs) < 0 or max(vaddrs) >= self.max_vaddr):
+            raise ValueError(f"Direcciones virtuales fuera de [0, {self.max_vaddr})")
+        page_size = self.page_size
+        # Posiciones de cada página, en orden de primera aparición
+        groups: Dict[int, List[int]] = {}
+        for i, vaddr in enumerate(vaddrs):
+            page_no = vaddr // page_size
+            positions = groups.get(page_no)
+            if positions is None:
+                groups[page_no] = [i]
+            else:
+                positions.append(i)
+        if tracer.verbose:
+            tracer.emit('vm.translate_bulk', count=len(vaddrs), pages=len(groups))
+
+        if gather:
+            out = bytearray(len(vaddrs))
+            frames = self.physical_memory.frames
+            for page_no, positions in groups.items():
+                frame = frames[self._translate(page_no).frame]
+                for i in positions:
+                    out[i] = frame[vaddrs[i] % page_size]
+            return bytes(out)
+
+        paddrs = array('q', bytes(8 * len(vaddrs)))
+        for page_no, positions in groups.items():
+            base = self._translate(page_no).frame * page_size - page_no * page_size
+            for i in positions:
+                paddrs[i] = base + vaddrs[i]
+        return paddrs
+
+    def _translate_many_numpy(self, vaddrs, gather: bool, tracer: Tracer):
+        """Implementación vectorizada de translate_many (requiere NumPy)."""
+        was_ndarray = isinstance(vaddrs, np.ndarray)
+        v = np.asarray(vaddrs, dtype=np.int64)
+        if v.size and (v.min() < 0 or v.max() >= self.max_vaddr):
+            raise ValueError(f"Direcciones virtuales fuera de [0, {self.max_vaddr})")
+        page_size = self.page_size
+        pages, offsets = np.divmod(v, page_size)
+        uniq, first, inverse, counts = np.unique(
+            pages, return_index=True, return_inverse=True, return_counts=True
+        )
+        inverse = inverse.reshape(-1)
+        if tracer.verbose:
+            tracer.emit('vm.translate_bulk', count=int(v.size), pages=int(uniq.size))
+
+        # Posiciones agrupadas por página: bucket k = by_page[starts[k]:starts[k+1]]
+        by_page = np.argsort(inverse, kind='stable')
+        starts = np.concatenate(([0], np.cumsum(counts)))
+        translate = self._translate
+
+        if gather:
+            out = np.empty(v.size, dtype=np.uint8)
+            frames = self.physical_memory.frames
+            for k in np.argsort(first):
+                frame = np.frombuffer(frames[translate(int(uniq[k])).frame], dtype=np.uint8)
+                positions = by_page[starts[k]:starts[k + 1]]
+                out[positions] = frame[offsets[positions]]
+            return out.tobytes()
+
+        frame_of = np.empty(uniq.size, dtype=np.int64)
+        for k in np.argsort(first):
+            frame_of[k] = translate(int(uniq[k])).frame
+        paddrs = frame_of[inverse] * page_size + offsets
+        if was_ndarray:
+            return paddrs
+        return array('q', paddrs.tobytes())
+
     def get_stats(self) -> Dict[str, any]:
         """
         Obtiene estadísticas del simulador.
@@ -433,24 +1363,57 @@ class VM:
         Returns:
             Diccionario con estadísticas de rendimiento y estado
         """
+        # Solo las páginas residentes pueden estar sucias: basta recorrer
+        # el mapeo inverso (O(marcos)), no todo el espacio de direcciones
+        lookup = self.page_table.lookup
         dirty_pages = sum(
-            1 for page_no in range(VIRTUAL_PAGES)
-            if self.page_table.get_entry(page_no).dirty
+            1 for page_no in self.frame_to_page.values()
+            if lookup(page_no).dirty
         )
         
-        pages_in_ram = sum(
-            1 for page_no in range(VIRTUAL_PAGES)
-            if self.page_table.get_entry(page_no).present
-        )
+        pages_in_ram = len(self.frame_to_page)
         
-        return {
+        stats = {
             'page_faults': self.page_faults,
             'write_backs': self.write_backs,
             'pages_in_ram': pages_in_ram,
             'dirty_pages': dirty_pages,
             'free_frames': len(self.physical_memory.free_frames),
-            'fifo_queue': list(self.fifo_queue)
+            'cow_faults': self.cow_faults,
+            'writebacks_avoided': self.writebacks_avoided,
+            'policy': self.policy.name,
+            'replacement_queue': self.policy.snapshot()
         }
+        stats.update(self.page_table.get_stats())
+        stats.update(self.backing_store.get_stats())
+        if self.tlb is not None:
+            stats.update(self.tlb.get_stats())
+        if self.prefetcher is not None:
+            stats.update(self.prefetcher.get_stats())
+        return stats
+    
+    def effective_access_time(self, tlb_ns: float = 1.0, mem_ns: float = 100.0,
+                              fault_ns: float = 8_000_000.0) -> float:
+        """
+        Estima el tiempo efectivo de acceso (ns) a partir del TLB y los page faults.
+        
+        Args:
+            tlb_ns: Latencia de búsqueda en el TLB
+            mem_ns: Latencia de un acceso a memoria
+            fault_ns: Costo de servir un page fault
+            
+        Returns:
+            Tiempo efectivo por acceso en nanosegundos
+            
+        Raises:
+            RuntimeError: Si la VM no tiene TLB (no hay conteo de accesos)
+        """
+        if self.tlb is None:
+            raise RuntimeError("La VM no tiene TLB configurado")
+        return self.tlb.effective_access_time(
+            self.page_faults, tlb_ns=tlb_ns, mem_ns=mem_ns, fault_ns=fault_ns,
+            walk_levels=self.page_table.levels
+        )
     
     def __repr__(self) -> str:
         """Representación legible del estado de la VM."""
@@ -458,6 +1421,6 @@ class VM:
         return (
             f"VM(faults={stats['page_faults']}, "
             f"writebacks={stats['write_backs']}, "
-            f"ram={stats['pages_in_ram']}/{VIRTUAL_PAGES}, "
+            f"ram={stats['pages_in_ram']}/{self.virtual_pages}, "
             f"dirty={stats['dirty_pages']})"
         )
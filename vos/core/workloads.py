@@ -0,0 +1,248 @@
+"""
+Generador de Cargas de Trabajo Sintéticas
+VOS (Virtual Operating System)
+
+Este módulo genera cadenas de referencias a memoria con distintos
+modelos de localidad, reproducibles con una semilla:
+- uniform: direcciones aleatorias uniformes (sin localidad)
+- zipf: conjunto caliente de páginas con popularidad Zipfiana
+- sequential: recorrido secuencial (scan) con paso configurable
+- loop: working set recorrido en bucle
+- strided: recorrido por columnas de una matriz guardada por filas
+- phased: concatenación de fases con modelos distintos
+
+Cada modelo es un generador de referencias codificadas como en
+vos.core.replay: (vaddr << 1) | es_escritura, así sirven tanto para
+replay() como para make_program(), que las convierte en un programa
+listo para Kernel.spawn.
+"""
+
+import bisect
+import itertools
+import random
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from vos.core.process import State
+from vos.core.vm import PAGE_SIZE
+
+
+def _writes(rng: random.Random, write_ratio: float) -> Callable[[], int]:
+    """Retorna una función que decide (0/1) si la próxima referencia escribe."""
+    if write_ratio <= 0:
+        return lambda: 0
+    if write_ratio >= 1:
+        return lambda: 1
+    draw = rng.random
+    return lambda: draw() < write_ratio
+
+
+def uniform(n: int, size: int, write_ratio: float = 0.0,
+            seed: Optional[int] = None) -> Iterator[int]:
+    """
+    Direcciones uniformes en [0, size).
+
+    Args:
+        n: Cantidad de referencias
+        size: Bytes del espacio de direcciones
+        write_ratio: Fracción de escrituras
+        seed: Semilla
+    """
+    rng = random.Random(seed)
+    write = _writes(rng, write_ratio)
+    randrange = rng.randrange
+    for _ in range(n):
+        yield (randrange(size) << 1) | write()
+
+
+def zipf(n: int, size: int, page_size: int = PAGE_SIZE, alpha: float = 1.0,
+         write_ratio: float = 0.0, seed: Optional[int] = None) -> Iterator[int]:
+    """
+    Páginas con popularidad Zipfiana: la k-ésima más popular tiene peso 1/k^alpha.
+
+    Las páginas se permutan al azar, así las calientes no quedan contiguas.
+
+    Args:
+        n: Cantidad de referencias
+        size: Bytes del espacio de direcciones
+        page_size: Tamaño de página (granularidad de la popularidad)
+        alpha: Sesgo (0 = uniforme; mayor = conjunto caliente más chico)
+        write_ratio: Fracción de escrituras
+        seed: Semilla
+    """
+    rng = random.Random(seed)
+    write = _writes(rng, write_ratio)
+    pages = max(1, size // page_size)
+    order = list(range(pages))
+    rng.shuffle(order)
+    cumulative = list(itertools.accumulate(1.0 / (k ** alpha) for k in range(1, pages + 1)))
+    total = cumulative[-1]
+    draw, randrange = rng.random, rng.randrange
+    for _ in range(n):
+        rank = bisect.bisect_left(cumulative, draw() * total)
+        page_no = order[min(rank, pages - 1)]
+        yield ((page_no * page_size + randrange(page_size)) << 1) | write()
+
+
+def sequential(n: int, size: int, start: int = 0, stride: int = 1,
+               write_ratio: float = 0.0, seed: Optional[int] = None) -> Iterator[int]:
+    """
+    Recorrido secuencial desde start, volviendo a 0 al llegar a size.
+
+    Args:
+        n: Cantidad de referencias
+        size: Bytes del espacio de direcciones
+        start: Dirección inicial
+        stride: Bytes entre referencias consecutivas
+        write_ratio: Fracción de escrituras
+        seed: Semilla (solo afecta lecturas/escrituras)
+    """
+    write = _writes(random.Random(seed), write_ratio)
+    vaddr = start % size
+    for _ in range(n):
+        yield (vaddr << 1) | write()
+        vaddr = (vaddr + stride) % size
+
+
+def loop(n: int, working_set: int, start: int = 0, stride: int = 1,
+         write_ratio: float = 0.0, seed: Optional[int] = None) -> Iterator[int]:
+    """
+    Bucle sobre un working set [start, start + working_set).
+
+    Con working_set mayor que la RAM es el peor caso de LRU/FIFO.
+
+    Args:
+        n: Cantidad de referencias
+        working_set: Bytes del working set
+        start: Dirección inicial del working set
+        stride: Bytes entre referencias consecutivas
+        write_ratio: Fracción de escrituras
+        seed: Semilla (solo afecta lecturas/escrituras)
+    """
+    write = _writes(random.Random(seed), write_ratio)
+    offset = 0
+    for _ in range(n):
+        yield ((start + offset) << 1) | write()
+        offset = (offset + stride) % working_set
+
+
+def strided(n: int, rows: int, cols: int, element_size: int = 1, base: int = 0,
+            write_ratio: float = 0.0, seed: Optional[int] = None) -> Iterator[int]:
+    """
+    Recorre por columnas una matriz rows×cols guardada por filas.
+
+    Referencias consecutivas están separadas por cols*element_size bytes,
+    así con filas grandes cada una toca una página distinta.
+
+    Args:
+        n: Cantidad de referencias (la matriz se recorre de nuevo si sobra)
+        rows, cols: Dimensiones de la matriz
+        element_size: Bytes por elemento
+        base: Dirección de la matriz
+        write_ratio: Fracción de escrituras
+        seed: Semilla (solo afecta lecturas/escrituras)
+    """
+    write = _writes(random.Random(seed), write_ratio)
+    row_bytes = cols * element_size
+    count = 0
+    while count < n:
+        for c in range(cols):
+            col_base = base + c * element_size
+            for r in range(rows):
+                if count >= n:
+                    return
+                yield ((col_base + r * row_bytes) << 1) | write()
+                count += 1
+
+
+def phased(phases: Iterable[Tuple[str, int, Dict]], seed: Optional[int] = None) -> Iterator[int]:
+    """
+    Concatena fases de modelos distintos (cambios de working set en el tiempo).
+
+    Args:
+        phases: Tuplas (modelo, referencias, kwargs del modelo)
+        seed: Semilla base; cada fase usa una semilla derivada salvo que
+              sus kwargs traigan una propia
+
+    Ejemplo:
+        phased([('zipf', 10000, {'size': 65536}),
+                ('loop', 5000, {'working_set': 8192, 'start': 32768})], seed=1)
+    """
+    rng = random.Random(seed)
+    for model, n, kwargs in phases:
+        kwargs = dict(kwargs)
+        kwargs.setdefault('seed', rng.randrange(2 ** 32))
+        yield from make_workload(model, n, **kwargs)
+
+
+# Registro de modelos por nombre
+MODELS: Dict[str, Callable[..., Iterator[int]]] = {
+    'uniform': uniform,
+    'zipf': zipf,
+    'sequential': sequential,
+    'loop': loop,
+    'strided': strided,
+}
+
+
+def make_workload(model: str, n: int, **kwargs) -> Iterator[int]:
+    """
+    Crea un generador de referencias por nombre de modelo.
+
+    Args:
+        model: Nombre en MODELS
+        n: Cantidad de referencias
+        **kwargs: Parámetros del modelo (size, write_ratio, seed, ...)
+
+    Returns:
+        Generador de referencias codificadas
+
+    Raises:
+        ValueError: Si el modelo no existe
+    """
+    try:
+        factory = MODELS[model]
+    except KeyError:
+        raise ValueError(
+            f"Modelo de carga desconocido: {model!r}. Opciones: {', '.join(MODELS)}"
+        ) from None
+    return factory(n, **kwargs)
+
+
+def make_program(refs: Iterable[int], refs_per_slice: int = 64) -> Callable:
+    """
+    Convierte una cadena de referencias en un programa para Kernel.spawn.
+
+    En cada time slice el programa aplica hasta refs_per_slice referencias
+    a la VM del proceso con read_byte/write_byte, y termina cuando se
+    agotan. Cada programa consume su propio iterador: crear uno por proceso.
+
+    Args:
+        refs: Referencias codificadas ((vaddr << 1) | escritura)
+        refs_per_slice: Referencias por time slice
+
+    Returns:
+        Función prog(kernel, pcb)
+    """
+    it = iter(refs)
+    pending: List[Optional[int]] = []   # Próxima referencia (lookahead)
+
+    def workload_prog(kernel, pcb):
+        if not pending:
+            pending.append(next(it, None))
+        vm = pcb.vm
+        read_byte, write_byte = vm.read_byte, vm.write_byte
+        value = pcb.pid & 0xFF
+        ref = pending[0]
+        for _ in range(refs_per_slice):
+            if ref is None:
+                break
+            if ref & 1:
+                write_byte(ref >> 1, value)
+            else:
+                read_byte(ref >> 1)
+            ref = next(it, None)
+        pending[0] = ref
+        if ref is None:
+            pcb.state = State.TERMINATED
+
+    return workload_prog